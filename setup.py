@@ -14,6 +14,7 @@ setuptools.setup(
     url='https://github.com/6871/matrix-display',
     package_dir={'': 'src'},
     packages=['matrix_display', 'matrix_display.displays'],
+    package_data={'matrix_display': ['fonts/*.mdf']},
     classifiers=[
         'Programming Language :: Python :: 3',
         'Operating System :: OS Independent',
@@ -1,2 +1,4 @@
 from .conveyor import Conveyor
-from .canvas import Canvas
+from .canvas import Canvas, measure_text
+from .packed_canvas import PackedCanvas
+from .sprite_sheet import SpriteSheet
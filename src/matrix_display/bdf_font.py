@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Module to import BDF (Glyph Bitmap Distribution Format) bitmap fonts, such
+as the X11 misc-fixed family, for use as a canvas charset.
+
+Fonts are converted to the compiled font format (see compiled_font) and the
+result is cached on disk, keyed by a hash of the BDF file, so a large font
+is only parsed once. Characters are placed on a common baseline in rows of
+the font's full height, so characters with descenders line up with the rest
+of the text.
+
+Examples
+--------
+>>> import os, tempfile
+>>> from matrix_display import Canvas
+>>> from matrix_display.bdf_font import load_bdf
+>>> bdf = '''STARTFONT 2.1
+... FONT -test-tiny
+... SIZE 4 75 75
+... FONTBOUNDINGBOX 3 4 0 -1
+... STARTPROPERTIES 2
+... FONT_ASCENT 3
+... FONT_DESCENT 1
+... ENDPROPERTIES
+... CHARS 3
+... STARTCHAR o
+... ENCODING 111
+... DWIDTH 4 0
+... BBX 3 2 0 0
+... BITMAP
+... E0
+... E0
+... ENDCHAR
+... STARTCHAR j
+... ENCODING 106
+... DWIDTH 2 0
+... BBX 1 4 0 -1
+... BITMAP
+... 80
+... 00
+... 80
+... 80
+... ENDCHAR
+... STARTCHAR x-private
+... ENCODING -1 120
+... DWIDTH 2 0
+... BBX 1 1 0 0
+... BITMAP
+... 80
+... ENDCHAR
+... ENDFONT
+... '''
+>>> with tempfile.TemporaryDirectory() as tmp:
+...     path = os.path.join(tmp, 'tiny.bdf')
+...     with open(path, 'w') as fh:
+...         __ = fh.write(bdf)
+...     font = load_bdf(path, cache_dir=tmp)
+...     cached = load_bdf(path, cache_dir=tmp)  # read from the cache
+...
+>>> font.height, font.baseline, font['j']
+(4, 3, [[1], [0], [1], [1]])
+>>> 'x' in font  # unencoded characters are skipped
+False
+>>> print(Canvas(charset=font).append_text('jo').to_str())
+[█    ]
+[  ███]
+[█ ███]
+[█    ]
+>>>
+"""
+from matrix_display.compiled_font import CompiledFont, compile_charset
+import hashlib
+import os
+
+
+def cache_dir_default():
+    """Return the default directory for cached font conversions; under
+    $XDG_CACHE_HOME if set, else ~/.cache.
+
+    Returns
+    -------
+    path : str
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'matrix_display', 'fonts')
+
+
+def load_bdf(path, cache_dir=None, proportional=True):
+    """Load a BDF font file as a charset, converting it on first use.
+
+    Parameters
+    ----------
+    path : str
+        The BDF file's path
+    cache_dir : str
+        Optional directory to cache converted fonts in; defaults to
+        cache_dir_default(). Set to False to disable caching
+    proportional : bool
+        Optional; if True (default) each character is as wide as its pixels,
+        otherwise all characters are as wide as the font's advance width
+        (less the blank column Canvas adds between characters)
+
+    Returns
+    -------
+    font : CompiledFont
+    """
+    with open(path, 'rb') as fh:
+        data = fh.read()
+
+    cache_path = None
+    if cache_dir is not False:
+        cache_dir = cache_dir_default() if cache_dir is None else cache_dir
+        cache_path = os.path.join(cache_dir, '{}-{}.mdf'.format(
+            hashlib.sha256(data).hexdigest(), 'p' if proportional else 'm'))
+        try:
+            return CompiledFont.load(cache_path)
+        except (OSError, ValueError):  # not cached yet, or unreadable
+            pass
+
+    charset, baseline = parse_bdf(
+        data.decode('latin-1').splitlines(), proportional)
+    compiled = compile_charset(charset, baseline)
+    if cache_path is not None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = f'{cache_path}.{os.getpid()}.tmp'
+            with open(temp_path, 'wb') as fh:
+                fh.write(compiled)
+            os.replace(temp_path, cache_path)  # readers never see partial data
+        except OSError:
+            pass  # caching is an optimisation; the font is still usable
+    return CompiledFont(compiled)
+
+
+def parse_bdf(lines, proportional=True):
+    """Convert the lines of a BDF font to a charset dictionary.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        The lines of the BDF font
+    proportional : bool
+        Optional; see load_bdf
+
+    Returns
+    -------
+    charset : dict
+        Dictionary mapping each character to a list of pixel rows of 0 (off)
+        or 1 (on); all characters have the same number of rows
+    baseline : int
+        The number of rows above the baseline
+    """
+    ascent = descent = None
+    font_box = None
+    glyphs = []  # (character, advance width, bounding box, bitmap rows)
+    glyph = None
+    bitmap = None
+    for line in lines:
+        words = line.split()
+        if not words:
+            continue
+        keyword = words[0]
+        if bitmap is not None:
+            if keyword == 'ENDCHAR':
+                if glyph is not None:  # unencoded characters are skipped
+                    glyphs.append(glyph + (bitmap,))
+                glyph = bitmap = None
+            else:
+                bitmap.append(keyword)
+        elif keyword == 'FONTBOUNDINGBOX':
+            font_box = [int(word) for word in words[1:5]]
+        elif keyword == 'FONT_ASCENT':
+            ascent = int(words[1])
+        elif keyword == 'FONT_DESCENT':
+            descent = int(words[1])
+        elif keyword == 'STARTCHAR':
+            encoding, advance, box = -1, None, None
+        elif keyword == 'ENCODING':
+            # 'ENCODING -1 n' gives n in a non-standard encoding: skip it
+            encoding = int(words[1])
+        elif keyword == 'DWIDTH':
+            advance = int(words[1])
+        elif keyword == 'BBX':
+            box = [int(word) for word in words[1:5]]
+        elif keyword == 'BITMAP':
+            if encoding >= 0 and box is not None:
+                glyph = (chr(encoding), advance, box)
+            bitmap = []
+
+    if font_box is None and (ascent is None or descent is None):
+        raise ValueError('BDF font has no FONTBOUNDINGBOX')
+    if ascent is None:
+        ascent = font_box[1] + font_box[3]
+    if descent is None:
+        descent = -font_box[3]
+    height = ascent + descent
+    default_advance = font_box[0] if font_box is not None else 1
+
+    charset = {}
+    for c, advance, (box_width, box_height, x_offset, y_offset), bitmap \
+            in glyphs:
+        advance = default_advance if advance is None else advance
+        left = max(x_offset, 0)
+        top = ascent - (y_offset + box_height)  # cell row of bitmap's top
+        cell_width = max(left + box_width, advance - 1, 1)
+        rows = [[0] * cell_width for __ in range(height)]
+        for row_ctr, hex_row in enumerate(bitmap[:box_height]):
+            y = top + row_ctr
+            if not 0 <= y < height:
+                continue  # outside the font's ascent and descent
+            bits = int(hex_row, 16)
+            bit_count = len(hex_row) * 4
+            for x in range(box_width):
+                if bits >> (bit_count - 1 - x) & 1:
+                    rows[y][left + x] = 1
+
+        if proportional:
+            ink = [x for x in range(cell_width) if any(row[x] for row in rows)]
+            if ink:
+                rows = [row[ink[0]:ink[-1] + 1] for row in rows]
+            else:  # e.g. space; keep the advance less the canvas spacing
+                rows = [row[:max(advance - 1, 1)] for row in rows]
+        charset[c] = rows
+
+    return charset, ascent
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Benchmarks for matrix_display, run without display hardware.
+
+Run all scenarios and print a summary with:
+
+    python3 -m matrix_display.bench
+
+Each scenario times a single operation (e.g. appending a long string to a
+canvas, or one Conveyor frame on a Null display) repeatedly, and reports
+operations per second, per-operation latency percentiles and peak memory
+allocated (measured with tracemalloc in a separate run, as tracing slows
+Python down). Use --json to save results, e.g. to compare releases.
+
+Examples
+--------
+>>> from matrix_display import bench
+>>> result = bench.run_scenario('canvas.to_str', repeat=3)
+>>> sorted(result)  # doctest: +NORMALIZE_WHITESPACE
+['max_ms', 'name', 'ops', 'ops_per_sec', 'p50_ms', 'p90_ms', 'p99_ms',
+ 'peak_memory_bytes', 'seconds']
+>>>
+"""
+from matrix_display import Canvas, Conveyor, PackedCanvas
+from matrix_display.displays import Null
+import matrix_display.rgb_colours as rgb_colours
+import argparse
+import functools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+TEXT = 'The quick brown fox jumps over the lazy dog 0123456789 '
+COLOURS = [rgb_colours.cyan, rgb_colours.yellow, rgb_colours.green]
+
+scenarios = {}  # scenario name: function returning the operation to time
+
+
+def scenario(name):
+    """Decorator to register a scenario; the decorated function sets up
+    any state and returns a function that performs one operation."""
+    def register(setup):
+        scenarios[name] = setup
+        return setup
+    return register
+
+
+def _append_text(canvas_class):
+    """Return an operation that appends a long string to a new canvas."""
+    return lambda: canvas_class().append_text(TEXT * 20)
+
+
+def _append_canvas(canvas_class):
+    """Return an operation that builds a canvas from many small ones."""
+    parts = [canvas_class().append_text(word, COLOURS[i % 3])
+             for i, word in enumerate(TEXT.split())]
+
+    def op():
+        canvas = canvas_class()
+        for part in parts * 5:
+            canvas.append_canvas(part)
+        return canvas
+    return op
+
+
+for canvas_class in (Canvas, PackedCanvas):
+    scenarios[f'{canvas_class.__name__}.append_text'] = functools.partial(
+        _append_text, canvas_class)
+    scenarios[f'{canvas_class.__name__}.append_canvas'] = functools.partial(
+        _append_canvas, canvas_class)
+
+
+@scenario('canvas.to_str')
+def _to_str():
+    canvas = Canvas()
+    for i, word in enumerate(TEXT.split()):
+        canvas.append_text(word, COLOURS[i % 3])
+    return lambda: canvas.to_str(show_colour=True)
+
+
+def _conveyor_frame(row_count, display_rows, display_cols):
+    """Return an operation that shows one frame of a Conveyor with
+    row_count scrolling rows on a Null display."""
+    conveyor = Conveyor(Null(display_rows, display_cols))
+    if row_count * 5 <= display_rows:  # text rows fit
+        for i in range(row_count):
+            conveyor.add_row((TEXT, COLOURS[i % 3]))
+    else:  # use 1 pixel high rows
+        for i in range(row_count):
+            canvas = Canvas(row_count=1)
+            for x in range(display_cols * 3):
+                canvas.rows[0].append(COLOURS[(x + i) % 3])
+            conveyor.add_row(canvas)
+    return lambda: conveyor.run_for(1)
+
+
+for row_count in (1, 3, 16):
+    for display_rows, display_cols in ((16, 16), (32, 64)):
+        scenarios[
+            f'conveyor.frame.{row_count}rows.{display_cols}x{display_rows}'
+        ] = functools.partial(
+            _conveyor_frame, row_count, display_rows, display_cols)
+
+
+@scenario('conveyor.stream')
+def _stream():
+    def feed():
+        line = 0
+        while True:
+            line += 1
+            yield (f'{line}: {TEXT}', COLOURS[line % 3])
+
+    conveyor = Conveyor(Null(32, 64))
+    conveyor.add_stream_row(feed)
+    return lambda: conveyor.run_for(1)
+
+
+@scenario('conveyor.reload')
+def _reload():
+    def clock_text():
+        return [(time.strftime('%a %d %b'), rgb_colours.cyan),
+                (time.strftime(' %H:%M:%S'), rgb_colours.yellow)]
+
+    source = Conveyor.DisplaySource(clock_text, 64, 0.03, 15)
+    source.render()
+    return source._redraw_canvas
+
+
+def _percentile(sorted_values, percent):
+    """Return the value below which percent of sorted_values fall."""
+    index = min(len(sorted_values) - 1,
+                int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(name, repeat=100, min_seconds=0.0):
+    """Time a registered scenario.
+
+    Parameters
+    ----------
+    name : str
+        The scenario name; a key of the scenarios dictionary
+    repeat : int
+        Optional minimum number of times to run the operation; default 100
+    min_seconds : float
+        Optional minimum time to keep running the operation; default 0
+
+    Returns
+    -------
+    result : dict
+        The scenario name, number of operations, total seconds, operations
+        per second, latency percentiles in milliseconds and peak memory
+        allocated in bytes
+    """
+    op = scenarios[name]()
+    op()  # warm up caches
+
+    timings = []
+    start = time.perf_counter()
+    while len(timings) < repeat or time.perf_counter() - start < min_seconds:
+        op_start = time.perf_counter()
+        op()
+        timings.append(time.perf_counter() - op_start)
+    seconds = sum(timings)
+
+    op = scenarios[name]()  # set up before tracing, so only op is measured
+    tracemalloc.start()
+    try:
+        op()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'name': name,
+        'ops': len(timings),
+        'seconds': seconds,
+        'ops_per_sec': len(timings) / seconds if seconds > 0 else None,
+        'p50_ms': _percentile(timings, 50) * 1000,
+        'p90_ms': _percentile(timings, 90) * 1000,
+        'p99_ms': _percentile(timings, 99) * 1000,
+        'max_ms': timings[-1] * 1000,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def main(argv=None):
+    """Run benchmark scenarios from the command line.
+
+    Parameters
+    ----------
+    argv : list of str
+        Optional command line arguments; defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(
+        prog='python3 -m matrix_display.bench',
+        description='Benchmark matrix_display without display hardware.')
+    parser.add_argument(
+        'names', nargs='*', metavar='scenario',
+        help='scenarios to run (prefixes allowed); default all')
+    parser.add_argument(
+        '--repeat', type=int, default=100,
+        help='minimum operations per scenario (default 100)')
+    parser.add_argument(
+        '--min-seconds', type=float, default=0.5,
+        help='minimum seconds per scenario (default 0.5)')
+    parser.add_argument(
+        '--json', metavar='FILE',
+        help="write results as JSON to FILE ('-' for stdout)")
+    parser.add_argument(
+        '--list', action='store_true', help='list scenarios and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print('\n'.join(scenarios))
+        return
+
+    names = [name for name in scenarios
+             if not args.names or any(name.startswith(prefix)
+                                      for prefix in args.names)]
+    results = []
+    out = sys.stderr if args.json == '-' else sys.stdout
+    out.write(f"{'scenario':<36}{'ops/s':>10}{'p50 ms':>9}{'p90 ms':>9}"
+              f"{'p99 ms':>9}{'peak KiB':>10}\n")
+    for name in names:
+        result = run_scenario(name, args.repeat, args.min_seconds)
+        results.append(result)
+        ops_per_sec = result['ops_per_sec']  # None if too fast to time
+        ops_per_sec = 'n/a' if ops_per_sec is None else f'{ops_per_sec:.1f}'
+        out.write(f"{name:<36}{ops_per_sec:>10}"
+                  f"{result['p50_ms']:>9.3f}{result['p90_ms']:>9.3f}"
+                  f"{result['p99_ms']:>9.3f}"
+                  f"{result['peak_memory_bytes'] / 1024:>10.1f}\n")
+
+    if args.json:
+        report = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'results': results,
+        }
+        if args.json == '-':
+            json.dump(report, sys.stdout, indent=2)
+            sys.stdout.write('\n')
+        else:
+            with open(args.json, 'w') as fh:
+                json.dump(report, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
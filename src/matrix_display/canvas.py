@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """Module defining Canvas class."""
-import matrix_display.font_5 as font_5
+import matrix_display.compiled_font as compiled_font
+import matrix_display.glyph_cache as glyph_cache
+from matrix_display.image import load_image
 import matrix_display.rgb_colours as rgb_colours
+import sys
+
+_colour_modes = ('16', '256', 'truecolour')  # to_str terminal colour modes
+_colour_codes = {}  # (rgb, colour mode): terminal colour code
 
 
 class Canvas:
     """Represents a canvas as a matrix (list of rows) with methods to append
     content.
     """
+    glyph_cache = glyph_cache.default  # rendered characters shared by canvases
+
     def __init__(
             self,
             lpad_count=0,
@@ -24,7 +32,7 @@ class Canvas:
         ----------
         charset : dict
             Optional dictionary of character shapes used to print text to the
-            canvas; defaults to font_5x5.lookup
+            canvas; defaults to the compiled font_5 font
         lpad_count : int
             Optional number of empty columns to left-pad the canvas with;
             useful if know in advance the text will be scrolled in from the
@@ -60,8 +68,10 @@ class Canvas:
         [    ]
         >>>
         """
-        self.charset = font_5.lookup if charset is None else charset
-        row_count = len(self.charset['0']) if row_count is None else row_count
+        self.charset = (compiled_font.load_font_5() if charset is None
+                        else charset)
+        row_count = (compiled_font.charset_height(self.charset)
+                     if row_count is None else row_count)
         self.rows = [
             [
                 pad_colour for __ in range(lpad_count)
@@ -105,6 +115,59 @@ class Canvas:
         else:
             return len(self.rows[0])
 
+    def nbytes(self):
+        """Return the approximate number of bytes used to store the canvas's
+        pixels; for this class, the row lists (pixel tuples are mostly shared
+        and not counted).
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return sys.getsizeof(self.rows) + sum(map(sys.getsizeof, self.rows))
+
+    def measure(self, text, unknown_char='█'):
+        """Return the size text would have in this canvas's charset, without
+        drawing it; see measure_text.
+
+        Parameters
+        ----------
+        text : str
+            The text to measure
+        unknown_char : str
+            Character measured instead of characters missing from the charset
+
+        Returns
+        -------
+        width : int
+        height : int
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> Canvas().measure('Hello, World!')
+        (45, 5)
+        >>>
+        """
+        return measure_text(text, self.charset, unknown_char)
+
+    def reserve(self, width):
+        """Prepare the canvas to be width columns wide, so content can be
+        appended without repeatedly enlarging its pixel storage. The rows of
+        this class are lists that grow as needed, so this does nothing;
+        PackedCanvas and NumpyCanvas allocate the room up front.
+
+        Parameters
+        ----------
+        width : int
+            The number of columns to make room for
+
+        Returns
+        -------
+        self : Canvas
+        """
+        return self
+
     def append_canvas(self, canvas, lpad_count=None,
                       pad_colour=rgb_colours.black):
         """Append canvas to this canvas.
@@ -154,6 +217,122 @@ class Canvas:
         self.append_space = 1  # Precede all subsequent content with a space
         return self
 
+    @classmethod
+    def from_image(cls, image, width=None, height=None, method='box',
+                   charset=None):
+        """Create a canvas showing an image: a PPM, PGM or PNG file; see
+        matrix_display.image. Decoded image files are cached, so loading an
+        unchanged file again (e.g. in a row function) is quick.
+
+        Parameters
+        ----------
+        image : str or bytes-like
+            The image file's path, or its contents
+        width : int
+            Optional width to scale the image to; if None and height is
+            given, keeps the image's aspect ratio
+        height : int
+            Optional height to scale the image to; the canvas's row count.
+            If None and width is given, keeps the image's aspect ratio
+        method : str
+            Optional scaling method: 'box' (default) averages pixels, which
+            suits shrinking logos and photos; 'nearest' keeps pixel art sharp
+        charset : dict
+            Optional dictionary of character shapes used to print text to the
+            canvas; defaults to the compiled font_5 font
+
+        Returns
+        -------
+        canvas : Canvas
+            A canvas of this class
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> pgm = b'P5 4 2 255 ' + bytes([255, 0, 0, 255, 0, 255, 255, 0])
+        >>> print(Canvas.from_image(pgm).to_str())
+        [█  █]
+        [ ██ ]
+        >>> Canvas.from_image(pgm, height=1, method='nearest').rows
+        [[(255, 255, 255), (0, 0, 0)]]
+        >>>
+        """
+        width, height, pixels = load_image(
+            image, width, height, method)
+        return cls._from_pixels(width, height, pixels, charset)
+
+    @classmethod
+    def _from_pixels(cls, width, height, pixels, charset=None):
+        """Internal method to create a canvas of this class from packed RGB
+        pixels, row by row."""
+        canvas = cls(row_count=height, charset=charset)
+        canvas._append_pixels(width, pixels)
+        canvas.append_space = 1  # Precede all subsequent content with a space
+        return canvas
+
+    def append_image(self, image, width=None, method='box', lpad_count=None,
+                     pad_colour=rgb_colours.black):
+        """Append an image, scaled to the canvas's height; e.g. a logo
+        before a row's text. See from_image.
+
+        Parameters
+        ----------
+        image : str or bytes-like
+            The image file's path, or its contents
+        width : int
+            Optional width to scale the image to; if None (default), keeps
+            the image's aspect ratio
+        method : str
+            Optional scaling method, 'box' (default) or 'nearest'
+        lpad_count : int
+            Optional custom padding amount before the image; default value of
+            None lets target canvas decide
+        pad_colour : (int, int, int)
+            Optional pad colour; defaults to rgb_colours.black, i.e. (0, 0, 0)
+
+        Returns
+        -------
+        self : Canvas
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> ppm = b'P6 1 1 255 ' + bytes([255, 0, 0])
+        >>> canvas = Canvas().append_image(ppm).append_text('1')
+        >>> canvas.width(), canvas.rows[4][:2]
+        (7, [(255, 0, 0), (255, 0, 0)])
+        >>> canvas = Canvas().append_image(ppm, width=1).append_text('1')
+        >>> print(canvas.to_str())
+        [█ █]
+        [█ █]
+        [█ █]
+        [█ █]
+        [█ █]
+        >>>
+        """
+        width, height, pixels = load_image(
+            image, width, self.height(), method)
+        lpad_count = self.append_space if lpad_count is None else lpad_count
+        if lpad_count > 0:  # pad each image row
+            row_size = width * 3
+            pad = bytes(pad_colour) * lpad_count
+            pixels = b''.join([
+                pad + pixels[offset:offset + row_size]
+                for offset in range(0, len(pixels), row_size)])
+            width += lpad_count
+        self._append_pixels(width, pixels)
+
+        self.append_space = 1  # Precede all subsequent content with a space
+        return self
+
+    def _append_pixels(self, width, pixels):
+        """Internal method to append width columns of packed RGB pixels, row
+        by row; there is a row of pixels for each canvas row."""
+        row_size = width * 3
+        for y, row in enumerate(self.rows):
+            strip = pixels[y * row_size:(y + 1) * row_size]
+            row.extend(zip(strip[0::3], strip[1::3], strip[2::3]))
+
     def append_text(self, text, rgb=(255, 255, 255), unknown_char='█'):
         """Append text to a canvas matrix using the specified RGB colour.
 
@@ -190,35 +369,125 @@ class Canvas:
         [ ██ ███ ███ █████ ███]
         >>>
         """
+        rgb = tuple(rgb)
         for c in text:
-            # Handle characters not in font charset (to a point)
-            try:
-                c_map = self.charset[c]
-            except KeyError:
-                try:
-                    c_map = self.charset[unknown_char]
-                except KeyError:
-                    c_map = self.charset['█']
-
-            c_width = len(c_map[0])  # char rows are same length, use 1st row
-            row_ctr = 0
+            strips = self.glyph_cache.lookup(
+                self.charset, (c, unknown_char, rgb, 'list'),
+                self._glyph_strips, c, rgb, unknown_char)
 
             # Append character; and leading space unless at canvas start
-            for row in self.rows:
-                for col_ctr in range(self.append_space + c_width):
-                    if self.append_space == 1 and col_ctr == 0:
-                        row.append(rgb_colours.black)
-                    else:
-                        if c_map[row_ctr][col_ctr - self.append_space] == 0:
-                            row.append(rgb_colours.black)
-                        else:
-                            row.append(rgb)
-                row_ctr += 1
+            start = 1 - self.append_space
+            for row, strip in zip(self.rows, strips):
+                row.extend(strip[start:])
+            for row in self.rows[len(strips):]:  # canvas taller than charset
+                row.extend([rgb_colours.black] * (len(strips[0]) - start))
 
             # Precede all subsequent content with a space
             self.append_space = 1
         return self
 
+    def draw_text(self, x, text, rgb=(255, 255, 255), unknown_char='█'):
+        """Draw text over the canvas's existing columns, starting at column
+        x, as append_text would draw it there; used to update part of a
+        canvas in place. Only the charset's rows are drawn.
+
+        Parameters
+        ----------
+        x : int
+            The canvas column of the text's first pixel
+        text : str
+            The text to draw
+        rgb : (int, int, int)
+            Optional RGB colour tuple, defaults to white, i.e. (255, 255, 255)
+        unknown_char : str
+            Character printed instead of characters missing from the charset
+
+        Returns
+        -------
+        self : Canvas
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> print(Canvas().append_text('1:00').draw_text(8, '7').to_str())
+        [█   ███ ███]
+        [█ █ █ █   █]
+        [█   █ █   █]
+        [█ █ █ █   █]
+        [█   ███   █]
+        >>>
+        """
+        self._check_draw(x, text, unknown_char)
+        rgb = tuple(rgb)
+        start = 1  # the first character's blank column is not drawn
+        for c in text:
+            strips = self.glyph_cache.lookup(
+                self.charset, (c, unknown_char, rgb, 'list'),
+                self._glyph_strips, c, rgb, unknown_char)
+            count = len(strips[0]) - start
+            for row, strip in zip(self.rows, strips):
+                row[x:x + count] = strip[start:]
+            x += count
+            start = 0
+        return self
+
+    def _check_draw(self, x, text, unknown_char):
+        """Internal method to check text drawn at column x fits the canvas."""
+        width = self.measure(text, unknown_char)[0]
+        if x < 0 or x + width > self.width():
+            raise ValueError((
+                f"Can't draw text \"{text}\" of width \"{width}\" at column "
+                f"\"{x}\" of canvas with width \"{self.width()}\""))
+
+    def _glyph_strips(self, c, rgb, unknown_char):
+        """Internal method to render a character for the glyph cache.
+
+        Parameters
+        ----------
+        c : str
+            The character to render
+        rgb : (int, int, int)
+            The character's colour
+        unknown_char : str
+            Character to render if c is not in the charset
+
+        Returns
+        -------
+        strips : tuple of tuples
+            One tuple of pixels per character row, each starting with a
+            blank column
+        """
+        c_map = self._char_map(c, unknown_char)
+        off = rgb_colours.black
+        return tuple(
+            (off,) + tuple([rgb if v else off for v in c_map_row])
+            for c_map_row in c_map)
+
+    def _char_map(self, c, unknown_char='█'):
+        """Internal method to look up a character's shape in the charset.
+
+        Parameters
+        ----------
+        c : str
+            The character to look up
+        unknown_char : str
+            Character to use if c is not in the charset; if that is also
+            missing, '█' is used
+
+        Returns
+        -------
+        c_map : list of lists of int
+            The character's shape; a list of rows of 0 (off) or 1 (on)
+        """
+        # Handle characters not in font charset (to a point)
+        try:
+            return self.charset[c]
+        except KeyError:
+            try:
+                return self.charset[unknown_char]
+            except KeyError:
+                return self.charset['█']
+
     def append_text_from_function(self, function):
         """Append text blocks returned by the passed function to the canvas.
 
@@ -262,11 +531,12 @@ class Canvas:
 
         return self
 
-    def to_str(self, show_colour=False, pixel_on='\u2588', pixel_off=' '):
-        """Returns a string representation of the canvas that can be displayed
-        with Python's print() function. Colourised output is optional and only
-        approximates RGB colour; avoid colourised output if writing to log
-        files, it introduces significant control-code clutter.
+    def to_str(self, show_colour=False, pixel_on='█', pixel_off=' ',
+               colour_mode='16'):
+        r"""Returns a string representation of the canvas that can be displayed
+        with Python's print() function. Colourised output is optional; avoid
+        colourised output if writing to log files, it introduces control-code
+        clutter.
 
         Parameters
         ----------
@@ -275,10 +545,15 @@ class Canvas:
             codes in the output string; defaults to False
         pixel_on : str
             Optional alternate character to represent a non-black pixel; the
-            default is a solid block character (unicode '\u2588')
+            default is a solid block character (unicode '█')
         pixel_off : str
             Optional alternate character to represent a black pixel, the
             default is a space ' '
+        colour_mode : str
+            Optional terminal colour support used when show_colour is True;
+            '16' (default) approximates RGB colour with the 16 basic terminal
+            colours, '256' uses the nearest of the 256 xterm colours and
+            'truecolour' uses exact 24-bit colour
 
         Returns
         -------
@@ -302,22 +577,111 @@ class Canvas:
         [██  █   █ █ ██ ]
         [█ █ █   █ █ █  ]
         [██  ███ ███ ███]
+        >>> Canvas().append_text('i', (255, 128, 0)).to_str(
+        ...     show_colour=True, colour_mode='truecolour').split('\n')[1]
+        '[\x1b[38;2;255;128;0m█\x1b[0m]'
         >>>
         """
-        text = ''
-        row_count = len(self.rows)
-        for row_ctr, row in enumerate(self.rows):
-            text += '['
-            for col in row:
-                if col[0] == 0 and col[1] == 0 and col[2] == 0:
-                    text += pixel_off
-                else:
-                    if show_colour:
-                        text += self.__term_colour(col) + pixel_on + '\033[0m'
-                    else:
-                        text += pixel_on
-            text += ']' + ('\n' if row_ctr < row_count - 1 else '')
-        return text
+        if show_colour and colour_mode not in _colour_modes:
+            raise ValueError(
+                f"Unknown colour mode \"{colour_mode}\"; expected one of "
+                f"{', '.join(repr(mode) for mode in _colour_modes)}")
+
+        lines = []
+        codes = {}  # rgb: colour code, for the colours seen in this canvas
+        for row in self.rows:
+            if not show_colour:
+                lines.append('[' + ''.join([
+                    pixel_off if rgb[0] == 0 and rgb[1] == 0 and rgb[2] == 0
+                    else pixel_on for rgb in row]) + ']')
+                continue
+
+            parts = ['[']
+            colour = None  # colour code in effect at this point of the row
+            for rgb in row:
+                if rgb[0] == 0 and rgb[1] == 0 and rgb[2] == 0:
+                    if colour is not None:
+                        parts.append('\033[0m')
+                        colour = None
+                    parts.append(pixel_off)
+                    continue
+
+                rgb = tuple(rgb) if type(rgb) is not tuple else rgb
+                code = codes.get(rgb)
+                if code is None:
+                    code = codes[rgb] = self._colour_code(rgb, colour_mode)
+                if code is not colour:
+                    parts.append(code)
+                    colour = code
+                parts.append(pixel_on)
+            if colour is not None:
+                parts.append('\033[0m')
+            parts.append(']')
+            lines.append(''.join(parts))
+        return '\n'.join(lines)
+
+    def viewport(self, x, width, y=0, height=None):
+        """Return the pixels of a rectangular window onto the canvas as
+        packed RGB bytes, one bytes-like object per row, ready to pass to
+        Display.blit. Parts of the window past the right edge of the canvas
+        are black.
+
+        This class copies the window's pixels; PackedCanvas and NumpyCanvas
+        return views of their pixel storage instead.
+
+        Parameters
+        ----------
+        x : int
+            The first canvas column of the window
+        width : int
+            The number of columns in the window
+        y : int
+            Optional first canvas row of the window; defaults to 0
+        height : int
+            Optional number of rows in the window; defaults to all rows from
+            y to the bottom of the canvas
+
+        Returns
+        -------
+        rows : list of bytes-like
+            3 * width bytes of packed (r, g, b) values for each window row
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> c = Canvas(2, 2, (0, 0, 255))
+        >>> [list(row) for row in c.viewport(1, 2, 1)]
+        [[0, 0, 255, 0, 0, 0]]
+        >>>
+        """
+        height = self.height() - y if height is None else height
+        pad = bytes(max(0, x + width - self.width()) * 3)
+        return [
+            bytes([c for rgb in row[x:x + width] for c in rgb]) + pad
+            for row in self.rows[y:y + height]
+        ]
+
+    def clear(self):
+        """Remove all columns from the canvas, keeping its rows, so it can be
+        drawn again; PackedCanvas and NumpyCanvas also keep their allocated
+        storage, so redrawing content of a similar width allocates none.
+
+        Returns
+        -------
+        self : Canvas
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> canvas = Canvas().append_text('Hello')
+        >>> canvas.clear().width(), canvas.height()
+        (0, 5)
+        >>>
+        """
+        for row in self.rows:
+            del row[:]
+        self.append_space = 0  # first character will have no preceding space
+        return self
 
     def add_rows(self, count=1, pad_colour=rgb_colours.black):
         """Adds rows to the canvas.
@@ -360,6 +724,120 @@ class Canvas:
 
         return self
 
+    def brightness(self, factor):
+        """Scale the red, green and blue values of every pixel.
+
+        Parameters
+        ----------
+        factor : float
+            Multiplier for each colour component; results are truncated to
+            int and capped at 255
+
+        Returns
+        -------
+        self : Canvas
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> Canvas(2, 1, (100, 200, 10)).brightness(1.5).rows
+        [[(150, 255, 15), (150, 255, 15)]]
+        >>>
+        """
+        scaled = {}  # colours already scaled
+        for row in self.rows:
+            for col_ctr, rgb in enumerate(row):
+                rgb = tuple(rgb)
+                if rgb not in scaled:
+                    scaled[rgb] = tuple([min(255, int(c * factor))
+                                         for c in rgb])
+                row[col_ctr] = scaled[rgb]
+        return self
+
+    def replace_colour(self, old_rgb, new_rgb):
+        """Change every pixel of one colour to another.
+
+        Parameters
+        ----------
+        old_rgb : (int, int, int)
+            The colour to replace
+        new_rgb : (int, int, int)
+            The replacement colour
+
+        Returns
+        -------
+        self : Canvas
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas
+        >>> c = Canvas().append_text('i', (255, 0, 0))
+        >>> c.replace_colour((255, 0, 0), (0, 0, 255)).rows
+        [[(0, 0, 0)], [(0, 0, 255)], [(0, 0, 0)], [(0, 0, 255)], [(0, 0, 255)]]
+        >>>
+        """
+        old_rgb = tuple(old_rgb)
+        new_rgb = tuple(new_rgb)
+        for row in self.rows:
+            for col_ctr, rgb in enumerate(row):
+                if tuple(rgb) == old_rgb:
+                    row[col_ctr] = new_rgb
+        return self
+
+    @classmethod
+    def _colour_code(cls, rgb, colour_mode):
+        """Internal method returning the terminal colour code for an RGB
+        colour, cached as the same few colours are looked up repeatedly.
+
+        Parameters
+        ----------
+        rgb : (int, int, int)
+            Tuple of 3 int values representing red, green and blue content
+        colour_mode : str
+            One of '16', '256' or 'truecolour'; see to_str
+
+        Returns
+        -------
+        code : str
+            The escape sequence that sets the terminal foreground colour
+        """
+        key = (rgb, colour_mode)
+        code = _colour_codes.get(key)
+        if code is None:
+            if colour_mode == 'truecolour':
+                code = f'\033[38;2;{rgb[0]};{rgb[1]};{rgb[2]}m'
+            elif colour_mode == '256':
+                code = f'\033[38;5;{cls.__term_colour_256(rgb)}m'
+            else:
+                code = cls.__term_colour(rgb)
+            _colour_codes[key] = code
+        return code
+
+    @staticmethod
+    def __term_colour_256(rgb):
+        """Return the number of the xterm 256 colour palette entry nearest
+        to an RGB tuple; greys use the 24 step grey ramp.
+
+        Parameters
+        ----------
+        rgb : (int, int, int)
+            Tuple of 3 int values representing red, green and blue content
+
+        Returns
+        -------
+        number : int
+            Palette entry number; 16-255
+        """
+        r, g, b = rgb
+        if r == g == b:
+            if r < 8:
+                return 16  # black corner of the colour cube
+            if r > 248:
+                return 231  # white corner of the colour cube
+            return 232 + round((r - 8) / 247 * 23)
+        return (16 + 36 * round(r / 255 * 5) + 6 * round(g / 255 * 5)
+                + round(b / 255 * 5))
+
     @staticmethod
     def __term_colour(rgb):
         """Evaluate a RGB tuple and attempt to return a similar terminal
@@ -405,3 +883,59 @@ class Canvas:
             String representation of the canvas.
         """
         return self.to_str(show_colour=True)
+
+
+def measure_text(text, charset=None, unknown_char='█'):
+    """Return the size of text as drawn by Canvas.append_text at the start
+    of a canvas, computed from character widths without drawing any pixels.
+
+    Parameters
+    ----------
+    text : str
+        The text to measure
+    charset : dict
+        Optional charset; defaults to the compiled font_5 font
+    unknown_char : str
+        Character measured instead of characters missing from the charset
+
+    Returns
+    -------
+    width : int
+        Width in pixels, including the blank column between characters
+    height : int
+        Height in pixels
+
+    Examples
+    --------
+    >>> from matrix_display.canvas import measure_text
+    >>> measure_text('Hello, World!')
+    (45, 5)
+    >>>
+    """
+    charset = compiled_font.load_font_5() if charset is None else charset
+    char_widths = Canvas.glyph_cache.lookup(  # character: width
+        charset, ('widths', unknown_char), dict)
+    try:
+        width = sum(map(char_widths.__getitem__, text))
+    except KeyError:  # characters not measured before
+        for c in set(text).difference(char_widths):
+            char_widths[c] = _char_width(charset, c, unknown_char)
+        width = sum(map(char_widths.__getitem__, text))
+    if len(text) > 1:
+        width += len(text) - 1  # blank column between characters
+    return width, compiled_font.charset_height(charset)
+
+
+def _char_width(charset, c, unknown_char):
+    """Internal function returning the width of a character; falls back to
+    unknown_char, then '█', like Canvas.append_text."""
+    char_width = getattr(charset, 'char_width', None)  # width sans decoding
+    for key in (c, unknown_char, '█'):
+        try:
+            if char_width is not None:
+                return char_width(key)
+            c_map = charset[key]
+        except KeyError:
+            continue
+        return len(c_map[0]) if len(c_map) > 0 else 0
+    raise KeyError(c)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Module defining CompiledFont class, a charset stored in a compact binary
+format whose characters are decoded on first use; this keeps start up fast
+and memory use low, even for fonts with many characters.
+
+A compiled font file holds, little-endian:
+
+* a header: the magic bytes b'MDFN', a format version (1), the character
+  height in pixels, the baseline (the number of rows above it), a reserved
+  byte and the number of characters (uint32)
+* the characters' Unicode code points in ascending order (uint32 each)
+* the offset of each character's bitmap in the bitmap data (uint32 each)
+* the width of each character in pixels (uint8 each)
+* the bitmap data; each character is a bit field per row, padded to whole
+  bytes, with the most significant bit of the first byte the leftmost pixel
+
+Use compile_charset to convert a charset dictionary such as font_5.lookup;
+the package's fonts/font_5.mdf file was made with:
+
+    with open('font_5.mdf', 'wb') as fh:
+        fh.write(compile_charset(font_5.lookup))
+
+Examples
+--------
+>>> from matrix_display import font_5
+>>> from matrix_display.compiled_font import CompiledFont, compile_charset
+>>> font = CompiledFont(compile_charset(font_5.lookup))
+>>> font['L']
+[[1, 0, 0], [1, 0, 0], [1, 0, 0], [1, 0, 0], [1, 1, 1]]
+>>> font.height, len(font), '¶' in font
+(5, 99, False)
+>>> all(font[c] == font_5.lookup[c] for c in font_5.lookup)
+True
+>>>
+"""
+from array import array
+from collections.abc import Mapping
+import bisect
+import functools
+import os
+import struct
+import sys
+
+MAGIC = b'MDFN'
+VERSION = 1
+_HEADER = struct.Struct('<4sBBBxI')
+
+font_5_path = os.path.join(os.path.dirname(__file__), 'fonts', 'font_5.mdf')
+
+
+class CompiledFont(Mapping):
+    """A read-only charset, used like a charset dictionary (e.g. font_5.lookup)
+    that maps each character to a list of pixel rows of 0 (off) or 1 (on).
+
+    Only the character index is unpacked when the font is loaded; each
+    character's pixel rows are decoded from the font data when first looked
+    up and then kept for reuse. The height attribute is the number of rows
+    in every character and baseline the number of rows above the baseline
+    that characters sit on.
+    """
+    def __init__(self, data):
+        """Initialise the font from compiled font data.
+
+        Parameters
+        ----------
+        data : bytes
+            Compiled font data, e.g. from compile_charset or a font file
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError('Font data is too short to be a compiled font')
+        magic, version, height, baseline, count = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError('Font data is not a compiled font')
+        if version != VERSION:
+            raise ValueError(
+                f"Unsupported compiled font version \"{version}\"")
+
+        self.height = height
+        self.baseline = baseline
+        self._data = data
+        self._code_points = self._uint32_array(data, _HEADER.size, count)
+        self._offsets = self._uint32_array(
+            data, _HEADER.size + 4 * count, count)
+        widths_start = _HEADER.size + 8 * count
+        self._widths = data[widths_start:widths_start + count]
+        self._bitmaps_start = widths_start + count
+        self._glyphs = {}  # character: decoded pixel rows
+
+    @classmethod
+    def load(cls, path):
+        """Load a compiled font file.
+
+        Parameters
+        ----------
+        path : str
+            The font file's path
+
+        Returns
+        -------
+        font : CompiledFont
+        """
+        with open(path, 'rb') as fh:
+            return cls(fh.read())
+
+    def __getitem__(self, c):
+        """Return a character's pixel rows, decoding them on first use.
+
+        Parameters
+        ----------
+        c : str
+            The character to look up
+
+        Returns
+        -------
+        c_map : list of lists of int
+            The character's shape; a list of rows of 0 (off) or 1 (on)
+        """
+        glyph = self._glyphs.get(c)
+        if glyph is None:
+            index = self._index(c)
+            if index is None:
+                raise KeyError(c)
+            glyph = self._glyphs[c] = self._decode(index)
+        return glyph
+
+    def char_width(self, c):
+        """Return a character's width in pixels without decoding it.
+
+        Parameters
+        ----------
+        c : str
+            The character to look up
+
+        Returns
+        -------
+        width : int
+        """
+        index = self._index(c)
+        if index is None:
+            raise KeyError(c)
+        return self._widths[index]
+
+    def __contains__(self, c):
+        """Return True if the font has character c."""
+        return c in self._glyphs or self._index(c) is not None
+
+    def __iter__(self):
+        """Iterate over the font's characters in code point order."""
+        return (chr(code_point) for code_point in self._code_points)
+
+    def __len__(self):
+        """Return the number of characters in the font."""
+        return len(self._code_points)
+
+    def _index(self, c):
+        """Internal method returning the index of character c in the font's
+        tables, or None if the font does not have it."""
+        if not isinstance(c, str) or len(c) != 1:
+            return None
+        code_point = ord(c)
+        index = bisect.bisect_left(self._code_points, code_point)
+        if index < len(self._code_points) \
+                and self._code_points[index] == code_point:
+            return index
+        return None
+
+    def _decode(self, index):
+        """Internal method to decode the pixel rows of a character.
+
+        Parameters
+        ----------
+        index : int
+            The character's index in the font's tables
+
+        Returns
+        -------
+        c_map : list of lists of int
+            The character's shape; a list of rows of 0 (off) or 1 (on)
+        """
+        width = self._widths[index]
+        row_size = (width + 7) // 8
+        shifts = range(row_size * 8 - 1, row_size * 8 - 1 - width, -1)
+        position = self._bitmaps_start + self._offsets[index]
+        rows = []
+        for __ in range(self.height):
+            bits = int.from_bytes(
+                self._data[position:position + row_size], 'big')
+            rows.append([(bits >> shift) & 1 for shift in shifts])
+            position += row_size
+        return rows
+
+    @staticmethod
+    def _uint32_array(data, start, count):
+        """Internal method to unpack count little-endian uint32 values."""
+        values = array('I', data[start:start + 4 * count])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+
+def compile_charset(charset, baseline=None):
+    """Convert a charset dictionary to compiled font data.
+
+    Parameters
+    ----------
+    charset : dict
+        Dictionary mapping single characters to lists of pixel rows of 0
+        (off) or 1 (on); every character must have the same number of rows
+        and be at most 255 pixels wide
+    baseline : int
+        Optional number of character rows above the baseline, recorded in
+        the font data; defaults to the character height
+
+    Returns
+    -------
+    data : bytes
+        The compiled font data
+    """
+    characters = sorted(charset, key=ord)
+    heights = {len(charset[c]) for c in characters}
+    if len(heights) > 1:
+        raise ValueError(
+            f"Characters have different heights: {sorted(heights)}")
+    height = heights.pop() if heights else 0
+    baseline = height if baseline is None else baseline
+
+    offsets = []
+    widths = bytearray()
+    bitmaps = bytearray()
+    for c in characters:
+        width = max((len(row) for row in charset[c]), default=0)
+        if width > 255:
+            raise ValueError(
+                f"Character \"{c}\" is wider than 255 pixels ({width})")
+        row_size = (width + 7) // 8
+        offsets.append(len(bitmaps))
+        widths.append(width)
+        for row in charset[c]:
+            bits = 0
+            for pixel in row:
+                bits = (bits << 1) | (1 if pixel else 0)
+            bits <<= row_size * 8 - len(row)  # pad on the right
+            bitmaps += bits.to_bytes(row_size, 'big')
+
+    return b''.join([
+        _HEADER.pack(MAGIC, VERSION, height, baseline, len(characters)),
+        struct.pack(f'<{len(characters)}I', *map(ord, characters)),
+        struct.pack(f'<{len(offsets)}I', *offsets),
+        bytes(widths),
+        bytes(bitmaps),
+    ])
+
+
+def charset_height(charset):
+    """Return the number of pixel rows in a charset's characters.
+
+    Parameters
+    ----------
+    charset : dict or CompiledFont
+        The charset; a dictionary charset must include the character '0'
+
+    Returns
+    -------
+    height : int
+    """
+    height = getattr(charset, 'height', None)
+    return len(charset['0']) if height is None else height
+
+
+@functools.lru_cache(maxsize=None)
+def load_font_5():
+    """Return the compiled version of font_5.lookup shipped with the package,
+    loading it on first use; Canvas classes use it as their default charset.
+
+    Returns
+    -------
+    font : CompiledFont
+    """
+    return CompiledFont.load(font_5_path)
+
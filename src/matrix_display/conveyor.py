@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 """Module defining Conveyor class.
 """
-from matrix_display.canvas import Canvas
+from matrix_display.canvas import Canvas, measure_text
+from matrix_display.scheduler import FrameScheduler
+from matrix_display.stream_canvas import StreamCanvas
+import matrix_display.compiled_font as compiled_font
 import matrix_display.rgb_colours as rgb_colours
+import contextlib
+import functools
+import os
 import time
+import types
+
+# asyncio, concurrent.futures and multiprocessing are slow to import, so are
+# imported where needed: by async, background and process rows
+_CO_COROUTINE = 0x80  # code flag of coroutine functions; see inspect
 
 
 class Conveyor:
@@ -11,7 +22,10 @@ class Conveyor:
     may be static or sourced from a function that gets periodically
     re-evaluated.
     """
-    def __init__(self, display, scroll_delay=0.03):
+    def __init__(self, display, scroll_delay=0.03,
+                 canvas_class=Canvas, drop_frames=False,
+                 load_workers=4, stale_colour=rgb_colours.red,
+                 metrics=None, process_workers=None, draw_thread=False):
         """Initialise the display with an external display driver object.
 
         Parameters
@@ -20,23 +34,157 @@ class Conveyor:
             External display driver that extends matrix_display.Display
         scroll_delay : float
             Time in seconds to wait between each refresh of the display.
+        canvas_class : type
+            Optional Canvas class used to store each row's pixels; use
+            matrix_display.PackedCanvas to reduce memory use for long rows
+        drop_frames : bool
+            Optional; if True, skip frames when rendering falls behind so
+            rows scroll at the same speed on slow hardware; defaults to False
+        load_workers : int
+            Optional number of threads used to load content for rows added
+            with add_background_row; defaults to 4
+        stale_colour : (int, int, int)
+            Optional colour of the pixel shown at the top right of a
+            background row whose content could not be reloaded in time;
+            defaults to red, None disables the indicator
+        metrics : matrix_display.metrics.Metrics
+            Optional object to record frame timings, row reloads, late and
+            dropped frames and canvas memory in; defaults to None
+        process_workers : int
+            Optional number of worker processes used to draw rows added
+            with add_process_row; defaults to one less than the number of
+            CPUs, leaving one for the display
+        draw_thread : bool
+            Optional; if True, frames are sent to the display driver from a
+            separate thread, so the next frame is composed while the driver
+            sends the last one; see displays.ThreadedDisplay. With
+            drop_frames, frames the driver has not started sending are
+            merged with the next frame instead of waited for. Defaults to
+            False
         """
+        if draw_thread:
+            from matrix_display.displays.threaded import ThreadedDisplay
+            display = ThreadedDisplay(display, drop_frames)
         self.display = display
         self.scroll_delay = scroll_delay
+        self.canvas_class = canvas_class
+        self.scheduler = FrameScheduler(scroll_delay, drop_frames)
         self.width = display.col_count
         self.height = display.row_count
         self.sources = []
         self.capacity = self.height
+        self._frame = None  # last frame sent to display, packed RGB bytes
+        self.load_workers = load_workers
+        self.stale_colour = stale_colour
+        self._executor = None  # thread pool for background rows
+        self.process_workers = process_workers
+        self._process_executor = None  # process pool for process rows
+        self.metrics = metrics
+        self._advance_seconds = 0.0  # time taken by the last _advance
+        if metrics is not None:
+            metrics.collectors.append(self._collect_metrics)
 
     def add_row(self, content, reload_wait_time=15, *args, **kwargs):
         """Adds a row of content to the display.
 
+        The content is measured before it is drawn: content too tall for the
+        rows left on the display is rejected without drawing it, and whether
+        the row scrolls is decided from its measured width.
+
+        Content functions may be coroutine functions (async def); their
+        reloads run in the background, as for add_background_row. Use
+        add_row_async to add them from a running event loop.
+
+        Parameters
+        ----------
+        content : str or bytes or tuple or function or list or Canvas
+            The row's content
+        reload_wait_time : float
+            Time to wait before refreshing dynamic content from a function
+        *args
+            Optional list of arguments to pass to content function
+        **kwargs
+            Optional list of keyword arguments to pass to content function
+
+        Returns
+        -------
+        status : boolean
+            True if display has room for the content and it was added OK.
+
+        Examples
+        --------
+        >>> from matrix_display import Conveyor
+        >>> from matrix_display.displays import Null
+        >>> conveyor = Conveyor(Null(8, 16))
+        >>> conveyor.add_row('Hello'), conveyor.add_row('World' * 1000)
+        (True, False)
+        >>> conveyor.sources[0].content_width, conveyor.capacity
+        (17, 3)
+        >>>
+        """
+        if _iscoroutinefunction(content):
+            return self.add_background_row(
+                content, reload_wait_time, None, *args, **kwargs)
+
+        source = self.DisplaySource(
+            content, self.width, self.scroll_delay, reload_wait_time,
+            *args, canvas_class=self.canvas_class, **kwargs)
+        return self._add_source(source)
+
+    async def add_row_async(self, content, reload_wait_time=15, *args,
+                            **kwargs):
+        """Adds a row of content to the display from a running event loop;
+        see add_row. Coroutine function content is awaited on the event
+        loop, both for the row's first content and when reloaded by
+        play_async.
+
+        Parameters
+        ----------
+        content : str or bytes or tuple or function or list or Canvas
+            The row's content
+        reload_wait_time : float
+            Time to wait before refreshing dynamic content from a function
+        *args
+            Optional list of arguments to pass to content function
+        **kwargs
+            Optional list of keyword arguments to pass to content function
+
+        Returns
+        -------
+        status : boolean
+            True if display has room for the content and it was added OK.
+        """
+        if not _iscoroutinefunction(content):
+            return self.add_row(content, reload_wait_time, *args, **kwargs)
+
+        source = self.DisplaySource(
+            content, self.width, self.scroll_delay, reload_wait_time,
+            *args, canvas_class=self.canvas_class,
+            executor=self._get_executor(),
+            initial_content=await content(*args, **kwargs), **kwargs)
+        return self._add_source(source)
+
+    def add_background_row(self, content, reload_wait_time=15,
+                           load_timeout=None, *args, **kwargs):
+        """Adds a row of content to the display, reloading content functions
+        in a background thread so slow functions do not pause the display.
+
+        The row's first content is loaded before this method returns. While
+        later reloads run, the current content stays on the display; new
+        content is shown once ready, when a scrolling row has scrolled off
+        the display or on the next frame for other rows. If a reload fails,
+        or takes longer than load_timeout, the row is marked stale (see
+        stale_colour) until new content is shown.
+
         Parameters
         ----------
         content : str or bytes or tuple or function or list or Canvas
             The row's content
         reload_wait_time : float
             Time to wait before refreshing dynamic content from a function
+        load_timeout : float
+            Optional seconds a reload may take before the row is marked
+            stale; defaults to None, i.e. no limit
         *args
             Optional list of arguments to pass to content function
         **kwargs
@@ -49,39 +197,350 @@ class Conveyor:
         """
         source = self.DisplaySource(
             content, self.width, self.scroll_delay, reload_wait_time,
-            *args, **kwargs)
+            *args, canvas_class=self.canvas_class,
+            executor=self._get_executor(), load_timeout=load_timeout,
+            **kwargs)
+        return self._add_source(source)
+
+    def add_process_row(self, content, reload_wait_time=15,
+                        load_timeout=None, *args, **kwargs):
+        """Adds a row of content to the display, running the content
+        function and drawing its canvas in a worker process; suits CPU-heavy
+        content (e.g. charts, or long text) on multi-core boards, as the
+        display thread is not slowed by it.
+
+        The canvas's pixels are returned through shared memory rather than
+        pickled. Otherwise rows behave as for add_background_row: the first
+        content is loaded before this method returns, and the current content
+        stays on the display while reloads run. The content function and its
+        arguments must be picklable, e.g. a function defined at module level
+        (not a lambda), and it must return picklable content; it runs in
+        another process, so should not rely on state changed by the display
+        process.
+
+        Parameters
+        ----------
+        content : function
+            The row's content function, returning content of any type
+            add_row supports
+        reload_wait_time : float
+            Time to wait before refreshing dynamic content from a function
+        load_timeout : float
+            Optional seconds a reload may take before the row is marked
+            stale; defaults to None, i.e. no limit
+        *args
+            Optional list of arguments to pass to content function
+        **kwargs
+            Optional list of keyword arguments to pass to content function
+
+        Returns
+        -------
+        status : boolean
+            True if display has room for the content and it was added OK.
+
+        Examples
+        --------
+        >>> from matrix_display import Conveyor
+        >>> from matrix_display.displays import Null
+        >>> conveyor = Conveyor(Null(16, 16), process_workers=1)
+        >>> conveyor.add_process_row(str.upper, 15, None, 'hi')
+        True
+        >>> print(conveyor.sources[0].canvas.to_str())
+        [█ █ ███]
+        [█ █  █ ]
+        [███  █ ]
+        [█ █  █ ]
+        [█ █ ███]
+        >>>
+        """
+        source = self.ProcessSource(
+            content, self.width, self.scroll_delay, reload_wait_time,
+            *args, canvas_class=self.canvas_class,
+            executor=self._get_process_executor(), load_timeout=load_timeout,
+            **kwargs)
+        return self._add_source(source)
 
-        if source.canvas.height() <= self.capacity:
+    def add_stream_row(self, content, *args, **kwargs):
+        """Adds a row that scrolls content of any length, e.g. lines read
+        from a log file or news feed, drawing it only just ahead of the
+        display; memory use does not depend on the length of the content.
+
+        The content is an iterable of content items, or a function returning
+        one; items are read as the row scrolls, on the display thread, so
+        reading them should be quick. When the items are exhausted and have
+        scrolled off the display, the content is iterated (or the function
+        called) again, so an iterator such as a generator object can only be
+        streamed once: pass the function returning it instead.
+
+        Parameters
+        ----------
+        content : iterable or function
+            The row's content; a re-iterable (e.g. a list) of str, tuple,
+            list or Canvas items, or a function returning any iterable of
+            them, e.g. a generator function
+        *args
+            Optional list of arguments to pass to content function
+        **kwargs
+            Optional list of keyword arguments to pass to content function
+
+        Returns
+        -------
+        status : boolean
+            True if display has room for the content and it was added OK.
+
+        Examples
+        --------
+        >>> from matrix_display import Conveyor
+        >>> from matrix_display.displays import Null
+        >>> def log_lines():
+        ...     for i in range(1000000):
+        ...         yield f'Line {i}'
+        ...
+        >>> conveyor = Conveyor(Null(16, 16))
+        >>> conveyor.add_stream_row(log_lines)
+        True
+        >>> conveyor.run_for(100)
+        >>> conveyor.add_stream_row(log_lines())
+        Traceback (most recent call last):
+        ...
+        ValueError: Can't restream an iterator; pass a function returning it
+        >>>
+        """
+        source = self.StreamSource(content, self.width, *args, **kwargs)
+        return self._add_source(source)
+
+    def _get_executor(self):
+        """Internal method returning the background row thread pool."""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.load_workers,
+                thread_name_prefix='matrix_display')
+        return self._executor
+
+    def _get_process_executor(self):
+        """Internal method returning the process row worker pool."""
+        if self._process_executor is None:
+            workers = self.process_workers
+            if workers is None:
+                workers = max((os.cpu_count() or 1) - 1, 1)
+            from concurrent.futures import ProcessPoolExecutor
+            self._process_executor = ProcessPoolExecutor(max_workers=workers)
+        return self._process_executor
+
+    def _add_source(self, source):
+        """Internal method to add a DisplaySource if the display has room;
+        the source is measured when created, and only drawn once accepted.
+
+        Parameters
+        ----------
+        source : Conveyor.DisplaySource
+            The row to add
+
+        Returns
+        -------
+        status : boolean
+            True if display has room for the content and it was added OK.
+        """
+        if source.row_count <= self.capacity:
+            source.render()
+            if self.metrics is not None:
+                source.reload_hook = functools.partial(
+                    self.metrics.record_reload, str(len(self.sources)),
+                    getattr(source.content, '__name__',
+                            type(source.content).__name__))
             self.sources.append(source)
-            self.capacity -= source.canvas.height()
+            self.capacity -= source.row_count
+            self._frame = None  # layout changed; next frame sends all pixels
             return True
         else:
             return False
 
     def play(self):
         """Evaluates and displays content assigned with add_row."""
+        self.scheduler.start()
         while True:
-            dy_ptr = 0  # display y axis pointer
+            self._render_frame()
+            elapsed, steps = self.scheduler.wait()
+            self._advance(elapsed, steps)
+
+    async def play_async(self, frames=None):
+        """Evaluates and displays content assigned with add_row, sharing the
+        running event loop with other tasks; cancel the task to stop.
+
+        Parameters
+        ----------
+        frames : int
+            Optional number of frames to show before returning; defaults to
+            None, i.e. play until cancelled
+        """
+        self.scheduler.start()
+        frame_ctr = 0
+        try:
+            while frames is None or frame_ctr < frames:
+                self._render_frame()
+                frame_ctr += 1
+                elapsed, steps = await self.scheduler.wait_async()
+                self._advance(elapsed, steps)
+        finally:
             for source in self.sources:
-                for row in source.canvas.rows:
-                    for dx_ptr in range(self.width):
-                        rgb = rgb_colours.black
-                        canvas_pixel = dx_ptr + source.scroll_ptr
-                        if canvas_pixel < source.canvas.width():
-                            rgb = row[canvas_pixel]
-                        self.display.set_pixel(
-                            dy_ptr, dx_ptr, rgb[0], rgb[1], rgb[2])
-                    dy_ptr += 1
-                source.scroll_handler()  # Shift display left for long source
+                source.cancel_reload()
+
+    def run_for(self, frames):
+        """Show a number of frames as fast as possible, advancing content as
+        if scroll_delay seconds passed between frames; the output does not
+        depend on timing, which suits tests. Background reloads still run
+        in their own threads.
 
+        Parameters
+        ----------
+        frames : int
+            The number of frames to show
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas, Conveyor
+        >>> from matrix_display.displays import Display
+        >>> class Screen(Display):
+        ...     def __init__(self, row_count, col_count):
+        ...         super().__init__(row_count, col_count)
+        ...         self.canvas = Canvas(col_count, row_count)
+        ...     def set_pixel(self, x, y, r, g, b):
+        ...         self.canvas.rows[x][y] = (r, g, b)
+        ...
+        >>> screen = Screen(5, 10)
+        >>> conveyor = Conveyor(screen)
+        >>> conveyor.add_row('Hello, World!')
+        True
+        >>> conveyor.run_for(15)
+        >>> print(screen.canvas.to_str())
+        [ █  █  █  ]
+        [█ █ █  █  ]
+        [███ █  █  ]
+        [█   █  █  ]
+        [ ██  █  █ ]
+        >>>
+        """
+        for __ in range(frames):
+            self._render_frame()
+            self._advance(self.scroll_delay)
+
+    def _advance(self, elapsed, steps=1):
+        """Internal method to scroll rows and reload dynamic content.
+
+        Parameters
+        ----------
+        elapsed : float
+            Seconds since the previous frame
+        steps : int
+            Optional number of columns to scroll; defaults to 1
+        """
+        start = time.perf_counter()
+        for source in self.sources:
+            source.scroll_handler(elapsed, steps)
+        self._advance_seconds = time.perf_counter() - start
+
+    def _collect_metrics(self):
+        """Internal method returning frame schedule and canvas memory values
+        for Metrics.collect."""
+        return {
+            'frames_late_total': self.scheduler.late,
+            'frames_dropped_total': self.scheduler.dropped,
+            'canvas_bytes': sum(
+                source.canvas_bytes() for source in self.sources),
+        }
+
+    def _render_frame(self):
+        """Internal method to send one frame to the display.
+
+        The frame is composed as packed RGB bytes and only display row spans
+        that differ from the previous frame are sent to the display driver
+        (with Display.blit); the display is not redrawn if nothing changed.
+        """
+        began = time.perf_counter()
+        row_size = self.width * 3
+        frame = bytearray(self.height * row_size)
+        dy_ptr = 0  # display y axis pointer
+        for source in self.sources:
+            if source.stale and self.stale_colour is not None:
+                # Show stale indicator at the top right of the source's rows
+                offset = (dy_ptr + 1) * row_size - 3
+                indicator = (offset, offset + 3)
+            else:
+                indicator = None
+            column, rows = source.viewport(self.width)
+            for row_ctr, pixels in enumerate(rows):
+                offset = (dy_ptr + row_ctr) * row_size + column * 3
+                frame[offset:offset + len(pixels)] = pixels
+            dy_ptr += source.canvas.height()
+            if indicator is not None and source.canvas.height() > 0:
+                frame[indicator[0]:indicator[1]] = bytes(self.stale_colour)
+
+        composed = time.perf_counter()
+        if self._frame is None:  # send everything on first frame
+            self.display.blit(frame, 0, 0, self.width, dy_ptr)
+            changed = dy_ptr > 0
+        else:
+            changed = False
+            rows = memoryview(frame)
+            last_rows = memoryview(self._frame)
+            for row_ctr in range(dy_ptr):
+                offset = row_ctr * row_size
+                row = rows[offset:offset + row_size]
+                last_row = last_rows[offset:offset + row_size]
+                if row == last_row:
+                    continue
+                start, end = self._changed_span(row, last_row)
+                self.display.blit(
+                    row[start * 3:end * 3], row_ctr, start, end - start, 1)
+                changed = True
+
+        self._frame = frame
+        sent = time.perf_counter()
+        if changed:
             self.display.draw()
-            time.sleep(self.scroll_delay)
+        else:
+            self.display.skip_draw()
+
+        if self.metrics is not None:
+            self.metrics.record_frame({
+                'advance': self._advance_seconds,
+                'compose': composed - began,
+                'blit': sent - composed,
+                'draw': time.perf_counter() - sent,
+            })
+
+    @staticmethod
+    def _changed_span(row, last_row):
+        """Internal method returning the (start, end) pixel indexes that
+        bound the differences between two equal length packed RGB rows."""
+        lo, hi = 0, len(row) // 3
+        while lo < hi:  # find first changed pixel
+            mid = (lo + hi) // 2
+            if row[:(mid + 1) * 3] == last_row[:(mid + 1) * 3]:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+
+        hi = len(row) // 3
+        while lo < hi:  # find first pixel of unchanged tail
+            mid = (lo + hi) // 2
+            if row[mid * 3:] == last_row[mid * 3:]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return start, lo
 
     class DisplaySource:
         """Represents a source of content for a row on the display."""
         def __init__(self, content, display_width, scroll_delay,
-                     data_reload_wait_time, *args, **kwargs):
-            """Initialise this display row, render its initial canvas content.
+                     data_reload_wait_time, *args, canvas_class=Canvas,
+                     executor=None, load_timeout=None, initial_content=None,
+                     **kwargs):
+            """Initialise this display row: load its initial content and
+            measure it, setting row_count and content_width, but do not draw
+            it until render is called.
 
             Parameters
             ----------
@@ -91,34 +550,128 @@ class Conveyor:
                 The width of the display being used (required for scrolling)
             *args
                 Optional list of arguments to pass to content function
+            canvas_class : type
+                Optional Canvas class used to store the row's pixels
+            executor : concurrent.futures.Executor
+                Optional executor used to reload content in the background;
+                defaults to None, i.e. reload on the display thread
+            load_timeout : float
+                Optional seconds a background reload may take before the
+                row is marked stale
+            initial_content : str or tuple or list or Canvas
+                Optional content to show first instead of evaluating content;
+                used when content is a coroutine function already awaited
             **kwargs
                 Optional list of keyword arguments to pass to content function
             """
             self.initialised = False
+            self.canvas_class = canvas_class
             self.scroll_ptr = 0
             self.display_width = display_width
             self.content = content
             self.content_args = args
             self.content_kwargs = kwargs
             self.canvas = None
+            self._spare = None  # previous canvas, reused to draw reloads
+            self._items = None  # content items drawn on canvas
+            self._spare_items = None  # content items drawn on _spare
+            self._loaded_items = None  # items drawn by last _render_canvas
             self.scroll_delay = scroll_delay
             self.data_reload_wait_time = data_reload_wait_time
             self.data_reload_ttl = self.data_reload_wait_time
-            self._redraw_canvas()
+            self.executor = executor
+            self.load_timeout = load_timeout
+            self.stale = False  # True if reload failed or is overdue
+            self.load_error = None  # exception raised by last failed reload
+            self.reload_hook = None  # see _reload_timer
+            self._pending = None  # background reload in progress
+            self._pending_age = 0
+            self._loaded_width = 0  # content width of last _render_canvas
+            self._first = None  # initial content, kept for render
+            # Rows needed and width of the content, known before drawing it
+            self.row_count, self.content_width = self._measure(
+                initial_content)
+
+        def _measure(self, content):
+            """Internal method to load the row's initial content and measure
+            it without drawing it; the height is that of the first Canvas
+            item, else the charset's.
+
+            Parameters
+            ----------
+            content : str or tuple or function or list or Canvas
+                Optional content to measure; defaults to the row's content
+
+            Returns
+            -------
+            row_count : int
+            content_width : int
+            """
+            self._first = self._load_items(content)
+            return (self._measure_height(self._first),
+                    self._measure_content(self._first))
+
+        def render(self):
+            """Draw the row's initial canvas; called by Conveyor once the
+            display has room for row_count rows."""
+            items, self._first = self._first, None
+            self.canvas = self._render_canvas(items)
+            self._items = self._loaded_items
+            self.content_width = self._loaded_width
             self.initialised = True
 
-        def scroll_handler(self):
+        def viewport(self, width):
+            """Return the row's pixels currently on the display.
+
+            Scrolling content rolls in from the right: it is shown after
+            display_width columns of padding, which is not stored but left
+            black, like any part of the display past the end of the content.
+
+            Parameters
+            ----------
+            width : int
+                The display width
+
+            Returns
+            -------
+            column : int
+                The display column the pixels start at
+            rows : list of bytes-like
+                Packed RGB pixels for each row; empty if none are visible
+            """
+            x = self.scroll_ptr  # canvas column at the display's left edge
+            if self.content_width > self.display_width:  # scrolling
+                x -= self.display_width
+            start = max(x, 0)
+            end = min(x + width, self.canvas.width())
+            if end <= start:
+                return 0, []
+            return start - x, self.canvas.viewport(start, end - start)
+
+        def scroll_handler(self, elapsed=None, steps=1):
             """Called on each display redraw so scrolling can be incremented
-            and dynamic content can be reloaded."""
+            and dynamic content can be reloaded.
+
+            Parameters
+            ----------
+            elapsed : float
+                Optional seconds since the previous redraw, used to decide
+                when content is reloaded; defaults to scroll_delay
+            steps : int
+                Optional number of columns to scroll by; defaults to 1
+            """
             reload_data = False
-            self.data_reload_ttl -= self.scroll_delay
+            elapsed = self.scroll_delay if elapsed is None else elapsed
+            self.data_reload_ttl -= elapsed
             if self.data_reload_ttl <= 0:
                 reload_data = True
 
-            if self.canvas.width() > self.display_width:  # scrolling required
-                self.scroll_ptr += 1
+            if self.executor is not None:
+                self._background_handler(elapsed, steps, reload_data)
+            elif self.content_width > self.display_width:  # scrolling
+                self.scroll_ptr += steps
 
-                if self.scroll_ptr > self.canvas.width():
+                if self.scroll_ptr > self.display_width + self.content_width:
                     self.scroll_ptr = 0  # scrolled off screen, reset to start
                     if reload_data:
                         self._redraw_canvas()  # reload data while row blank
@@ -128,62 +681,600 @@ class Conveyor:
                     self._redraw_canvas()
                     self.data_reload_ttl = self.data_reload_wait_time
 
-        def _add_scroll_lpad(self):
-            """Internal method used to make scrolled content roll in."""
-            if self.canvas.width() > self.display_width:
-                self.canvas = Canvas(
-                    lpad_count=self.display_width,
-                    row_count=self.canvas.height()
-                ).append_canvas(self.canvas)
+        def _background_handler(self, elapsed, steps, reload_data):
+            """Internal scroll_handler for rows reloaded in the background;
+            starts due reloads and swaps in loaded content at a safe point.
+            """
+            if self._pending is not None:
+                self._pending_age += elapsed
+                if (self.load_timeout is not None
+                        and self._pending_age > self.load_timeout):
+                    self.stale = True  # keep waiting, but flag old content
+
+            if self.content_width > self.display_width:  # scrolling
+                self.scroll_ptr += steps
+                if self.scroll_ptr > self.display_width + self.content_width:
+                    self.scroll_ptr = 0  # scrolled off screen, reset to start
+                    self._swap_loaded_canvas()  # swap while row blank
+            else:
+                self._swap_loaded_canvas()
+
+            if reload_data and callable(self.content) \
+                    and self._pending is None:
+                self._pending = self._submit_reload()
+                self._pending_age = 0
+                self.data_reload_ttl = self.data_reload_wait_time
+
+        def _submit_reload(self):
+            """Internal method to start a background reload; coroutine
+            functions run as a task if this thread has a running event loop,
+            other content runs in the executor.
+
+            Returns
+            -------
+            future : concurrent.futures.Future or asyncio.Task
+                Completes with the reloaded canvas
+            """
+            if _iscoroutinefunction(self.content):
+                import asyncio
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:  # no event loop; await in a thread
+                    pass
+                else:
+                    return asyncio.ensure_future(self._render_canvas_async())
+            return self.executor.submit(self._load_canvas)
+
+        def cancel_reload(self):
+            """Cancel a pending background reload, if possible."""
+            if self._pending is not None and self._pending.cancel():
+                self._pending = None
+
+        def _swap_loaded_canvas(self):
+            """Internal method to show background loaded content, if ready."""
+            if self._pending is None or not self._pending.done():
+                return
+
+            future, self._pending = self._pending, None
+            try:
+                self._spare, self.canvas = self.canvas, future.result()
+                self._spare_items, self._items = \
+                    self._items, self._loaded_items
+                self.content_width = self._loaded_width
+                self.stale = False
+                self.load_error = None
+            except Exception as e:  # keep showing old content
+                self.stale = True
+                self.load_error = e
+
+        def canvas_bytes(self):
+            """Return the number of bytes of pixel storage used by the row's
+            canvases; see Canvas.nbytes.
+
+            Returns
+            -------
+            nbytes : int
+            """
+            return self.canvas.nbytes() + (
+                0 if self._spare is None else self._spare.nbytes())
 
         def _redraw_canvas(self):
-            """Internal method to draw display row's canvas."""
+            """Internal method to draw display row's canvas; runs on the
+            display thread between frames, so when only some characters have
+            changed they are redrawn in place on the current canvas."""
+            with self._reload_timer() as loaded:
+                items = []
+                self._process_content(self.content, items)
+                loaded()
+                if self._update_canvas(self.canvas, self._items, items):
+                    self._items = items
+                    return
+
+                canvas = self._render_canvas(items)
+                self._spare, self.canvas = self.canvas, canvas
+                self._spare_items, self._items = \
+                    self._items, self._loaded_items
+                self.content_width = self._loaded_width
+
+        def _load_canvas(self):
+            """Internal method to evaluate the row's content and return a
+            new canvas for it; used by background reloads."""
+            with self._reload_timer() as loaded:
+                items = []
+                self._process_content(self.content, items)
+                loaded()
+                return self._render_canvas(items)
+
+        async def _render_canvas_async(self):
+            """Internal method to await coroutine function content and return
+            a new canvas for the row."""
+            with self._reload_timer() as loaded:
+                content = await self.content(
+                    *self.content_args, **self.content_kwargs)
+                loaded()
+                return self._render_canvas(content)
+
+        @contextlib.contextmanager
+        def _reload_timer(self):
+            """Internal context manager timing a reload for reload_hook, which
+            is called as reload_hook(load_seconds, render_seconds, error) if
+            set; call the function it yields once content has loaded, before
+            it is drawn.
+            """
+            times = [time.perf_counter()]
+            error = None
+            try:
+                yield lambda: times.append(time.perf_counter())
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                if self.reload_hook is not None:
+                    end = time.perf_counter()
+                    loaded = times[1] if len(times) > 1 else end
+                    self.reload_hook(loaded - times[0], end - loaded, error)
+
+        def _render_canvas(self, content=None):
+            """Internal method to draw and return a new canvas for the row;
+            does not change the current canvas, so may run in any thread.
+
+            The previous canvas is reused when possible: if the content
+            differs from what it shows only in characters of the same width,
+            just those characters are redrawn; otherwise it is cleared, and
+            the content is measured before it is drawn so the canvas has room
+            for all of it. Either way reloads of similar content need no new
+            pixel storage. The items drawn are left in _loaded_items, and
+            their width in _loaded_width.
+
+            Parameters
+            ----------
+            content : str or tuple or function or list or Canvas
+                Optional content to draw; defaults to the row's content
+            """
+            items = self._load_items(content)
+
+            canvas, self._spare = self._spare, None
+            drawn, self._spare_items = self._spare_items, None
+            self._loaded_items = items
             if self.initialised:  # keep existing height in case of more rows
-                self.canvas = Canvas(row_count=self.canvas.height())
-            else:  # initial content sets the canvas height
-                # if isinstance(self.content, Canvas):
-                #     self.canvas = Canvas(row_count=self.content.height())
-                # else:
-                #     self.canvas = Canvas()
-                self.canvas = Canvas(row_count=0)
-
-            self._process_content(self.content)
-            self._add_scroll_lpad()
-
-        def _process_content(self, value):
-            """Internal method to normalise list and function content."""
+                if canvas is not None \
+                        and canvas.height() == self.canvas.height():
+                    if self._update_canvas(canvas, drawn, items):
+                        self._loaded_width = canvas.width()  # widths kept
+                        return canvas
+                    canvas.clear()
+                else:
+                    canvas = self.canvas_class(row_count=self.canvas.height())
+            else:
+                canvas = self.canvas_class(
+                    row_count=self._measure_height(items))
+
+            self._loaded_width = self._measure_content(items, canvas.charset)
+            canvas.reserve(self._loaded_width)
+            for item in items:
+                self._append_content(item, canvas)
+            return canvas
+
+        def _update_canvas(self, canvas, drawn, items):
+            """Internal method to redraw, in place, the characters of items
+            that differ from drawn, the items last drawn on canvas.
+
+            Parameters
+            ----------
+            canvas : Canvas
+                The canvas to update
+            drawn : list of str or tuple or Canvas
+                Normalised content items drawn on canvas; None if unknown
+            items : list of str or tuple or Canvas
+                Normalised content items to draw
+
+            Returns
+            -------
+            updated : bool
+                False, leaving canvas unchanged, if items need a full redraw:
+                if any item is not text, or if its colour, length or
+                character widths differ from those of the item it replaces
+            """
+            if drawn is None or len(drawn) != len(items):
+                return False
+
+            changes = []  # (column, character, rgb) to redraw
+            x = 0  # canvas column of the next item
+            appended = False  # True once an item adds a preceding blank
+            for old, new in zip(drawn, items):
+                old_text, old_rgb = self._text_item(old)
+                new_text, new_rgb = self._text_item(new)
+                if old_text is None or new_text is None or old_rgb != new_rgb \
+                        or len(old_text) != len(new_text):
+                    return False
+                if len(new_text) == 0:
+                    continue  # appending empty text changes nothing
+                if appended:
+                    x += 1
+                appended = True
+                if old_text == new_text:
+                    x += canvas.measure(new_text)[0]
+                    continue
+
+                for old_c, new_c in zip(old_text, new_text):
+                    width = canvas.measure(new_c)[0]
+                    if old_c != new_c:
+                        if canvas.measure(old_c)[0] != width:
+                            return False  # later characters would move
+                        changes.append((x, new_c, new_rgb))
+                    x += width + 1
+                x -= 1  # no blank column after the last character
+
+            for x, c, rgb in changes:
+                canvas.draw_text(x, c, rgb)
+            return True
+
+        @staticmethod
+        def _text_item(value):
+            """Internal method returning the text and colour of a normalised
+            str or tuple content item; (None, None) for other items."""
+            if type(value) is str:
+                return value, (255, 255, 255)
+            elif type(value) is tuple:
+                return value[0], tuple(value[1])
+            return None, None
+
+        def _load_items(self, content=None):
+            """Internal method returning content, by default the row's,
+            normalised into a list of str, tuple and Canvas items."""
+            content = self.content if content is None else content
+            items = []
+            self._process_content(content, items)
+            return items
+
+        def _process_content(self, value, items):
+            """Internal method to normalise list and function content into a
+            list of str, tuple and Canvas items."""
             if type(value) is list:
                 for list_item in value:
-                    self._process_content(list_item)
+                    self._process_content(list_item, items)
             elif callable(value):
                 self._process_content(
-                    value(*self.content_args, **self.content_kwargs))
+                    value(*self.content_args, **self.content_kwargs), items)
+            elif isinstance(value, types.CoroutineType):
+                import asyncio
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:  # no event loop in this thread
+                    self._process_content(asyncio.run(value), items)
+                else:
+                    value.close()
+                    raise ValueError((
+                        "Can't await coroutine content in a running event "
+                        "loop; add it with add_row_async"))
             else:
-                self._append_content(value)
+                items.append(value)
 
-        def _append_content(self, value):
-            """Internal method to append normalised content to canvas."""
-            if not self.initialised and len(self.canvas.rows) == 0:
-                # Size canvas on first use according to content type
-                if isinstance(value, Canvas):
-                    self.canvas.add_rows(value.height())
+        @staticmethod
+        def _measure_height(items):
+            """Internal method returning the number of rows of a canvas for
+            items: the first Canvas item sets the height, else the charset.
+
+            Parameters
+            ----------
+            items : list of str or tuple or Canvas
+                Normalised content items
+            """
+            if len(items) == 0:
+                return 0
+            elif isinstance(items[0], Canvas):  # first content sets height
+                return items[0].height()
+            return compiled_font.charset_height(compiled_font.load_font_5())
+
+        @staticmethod
+        def _measure_content(items, charset=None):
+            """Internal method returning the width items will have when
+            appended to an empty canvas, without drawing them.
+
+            Parameters
+            ----------
+            items : list of str or tuple or Canvas
+                Normalised content items
+            charset : dict
+                Optional charset of the canvas; defaults to the compiled
+                font_5 font, as for the canvas classes
+            """
+            width = 0
+            appended = 0  # items that add a preceding blank column
+            for value in items:
+                if type(value) is str or type(value) is tuple:
+                    text = value if type(value) is str else value[0]
+                    if len(text) == 0:
+                        continue  # appending empty text changes nothing
+                    width += measure_text(text, charset)[0]
+                elif isinstance(value, Canvas):
+                    width += value.width()
                 else:
-                    self.canvas.add_rows(len(self.canvas.charset['0']))
+                    continue  # not valid content; rejected when appended
+                appended += 1
+            return width + max(appended - 1, 0)
 
+        def _append_content(self, value, canvas):
+            """Internal method to append normalised content to canvas."""
             if type(value) is str:
-                self.canvas.append_text(value)
+                canvas.append_text(value)
             elif type(value) is tuple:
-                self.canvas.append_text(value[0], value[1])
+                canvas.append_text(value[0], value[1])
             elif isinstance(value, Canvas):
-                if value.height() > self.canvas.height():
+                if value.height() > canvas.height():
                     if self.initialised:
                         # canvas already assigned to display, truncate to fit
-                        value.delete_rows(
-                            value.height() - self.canvas.height())
-                self.canvas.append_canvas(value)
+                        value.delete_rows(value.height() - canvas.height())
+                canvas.append_canvas(value)
             else:
                 raise ValueError((
                     f"Can't append content type \"{type(value)}\" (with "
                     f"value \"{value}\"); require str, tuple or Canvas "
                     f"(id(Canvas)=\"{id(Canvas)}\", "
                     f"id(value.__class__)=\"{id(value.__class__)}\")"))
+
+    class ProcessSource(DisplaySource):
+        """Represents a row whose content function runs, and whose canvas is
+        drawn, in a worker process; see add_process_row."""
+        def __init__(self, *args, **kwargs):
+            """Initialise this display row, drawing its initial canvas in a
+            worker process; parameters are as for DisplaySource, with
+            executor a concurrent.futures.ProcessPoolExecutor."""
+            self._job = None  # worker process reload in progress
+            super().__init__(*args, **kwargs)
+
+        def _measure(self, content):
+            """Internal method to measure the row's initial content; it is
+            only evaluated in a worker process, so is drawn there to measure
+            it, and the canvas kept for render.
+
+            Returns
+            -------
+            row_count : int
+            content_width : int
+            """
+            self._first = self._render_canvas(content)
+            return self._first.height(), self._loaded_width
+
+        def render(self):
+            """Show the row's initial canvas, drawn when it was measured."""
+            self.canvas, self._first = self._first, None
+            self.content_width = self._loaded_width
+            self.initialised = True
+
+        def _render_canvas(self, content=None):
+            """Internal method to draw and return a new canvas for the row;
+            the row's content is drawn in a worker process, waiting for the
+            result, while content passed in is drawn in this process.
+
+            Parameters
+            ----------
+            content : str or tuple or function or list or Canvas
+                Optional content to draw; defaults to the row's content
+            """
+            if content is not None:
+                return super()._render_canvas(content)
+            job = self.executor.submit(
+                _render_shared, self.content, self.content_args,
+                self.content_kwargs)
+            return self._receive_canvas(*job.result()[:3])
+
+        def _submit_reload(self):
+            """Internal method to start a reload in a worker process.
+
+            Returns
+            -------
+            future : concurrent.futures.Future
+                Completes with the reloaded canvas
+            """
+            from concurrent.futures import Future
+            future = Future()
+            self._job = self.executor.submit(
+                _render_shared, self.content, self.content_args,
+                self.content_kwargs)
+            self._job.add_done_callback(
+                functools.partial(self._reload_done, future))
+            return future
+
+        def cancel_reload(self):
+            """Cancel a pending background reload, if it has not started."""
+            if self._pending is not None and self._job.cancel():
+                self._pending = None
+
+        def _reload_done(self, future, job):
+            """Internal method called when a worker process reload finishes;
+            copies the canvas from shared memory and completes future."""
+            if job.cancelled():
+                return
+            load_seconds = render_seconds = 0.0
+            error = None
+            try:
+                name, width, height, load_seconds, render_seconds = \
+                    job.result()
+                start = time.perf_counter()
+                canvas = self._receive_canvas(name, width, height)
+                render_seconds += time.perf_counter() - start
+            except Exception as e:
+                error = e
+            if self.reload_hook is not None:
+                self.reload_hook(load_seconds, render_seconds, error)
+            if error is None:
+                future.set_result(canvas)
+            else:
+                future.set_exception(error)
+
+        def _receive_canvas(self, name, width, height):
+            """Internal method to copy a canvas drawn by a worker process out
+            of shared memory into a canvas of the row's height, reusing the
+            spare canvas when possible; taller canvases are truncated.
+
+            Parameters
+            ----------
+            name : str
+                The shared memory block's name; see shared_pixels
+            width : int
+                The drawn canvas's width
+            height : int
+                The drawn canvas's height
+
+            Returns
+            -------
+            canvas : Canvas
+            """
+            from matrix_display.shared_pixels import take_pixels
+            pixels = take_pixels(name, width, height)
+            row_count = self.canvas.height() if self.initialised else height
+            size = row_count * width * 3
+            pixels = pixels[:size].ljust(size, b'\x00')  # black extra rows
+
+            canvas, self._spare = self._spare, None
+            self._spare_items = self._loaded_items = None  # not known here
+            self._loaded_width = width
+            if canvas is not None and canvas.height() == row_count:
+                canvas.clear()
+            else:
+                canvas = self.canvas_class(row_count=row_count)
+            canvas.reserve(width)
+            canvas._append_pixels(width, pixels)
+            return canvas
+
+    class StreamSource:
+        """Represents a source of streamed content for a row on the display;
+        see add_stream_row."""
+        def __init__(self, content, display_width, *args, **kwargs):
+            """Initialise this display row; content is not read until the
+            row is first displayed.
+
+            Parameters
+            ----------
+            content : iterable or function
+                A content item assigned to the display by add_stream_row; not
+                an iterator, which could only be read once
+            display_width : int
+                The width of the display being used (required for scrolling)
+            *args
+                Optional list of arguments to pass to content function
+            **kwargs
+                Optional list of keyword arguments to pass to content function
+            """
+            if not callable(content) and iter(content) is content:
+                raise ValueError((
+                    "Can't restream an iterator; pass a function "
+                    "returning it"))
+            self.content = content
+            self.content_args = args
+            self.content_kwargs = kwargs
+            self.display_width = display_width
+            self.scroll_ptr = 0
+            self.stale = False  # streamed rows are never stale
+            self.reload_hook = None  # streamed rows are never reloaded
+            self.canvas = self._open_stream()
+            self.row_count = self.canvas.height()
+
+        def render(self):
+            """Called by Conveyor once the row is added; streamed content is
+            drawn as it scrolls, so there is nothing to draw yet."""
+
+        def scroll_handler(self, elapsed=None, steps=1):
+            """Called on each display redraw to scroll the row.
+
+            Parameters
+            ----------
+            elapsed : float
+                Optional seconds since the previous redraw; unused
+            steps : int
+                Optional number of columns to scroll by; defaults to 1
+            """
+            self.scroll_ptr += steps
+            if self.canvas.exhausted \
+                    and self.scroll_ptr > self.canvas.width():
+                self.canvas = self._open_stream()  # scrolled off, restart
+                self.scroll_ptr = 0
+
+        def viewport(self, width):
+            """Return the row's pixels currently on the display; see
+            DisplaySource.viewport.
+
+            Parameters
+            ----------
+            width : int
+                The display width
+
+            Returns
+            -------
+            column : int
+                The display column the pixels start at
+            rows : list of memoryview
+                Packed RGB pixels for each row
+            """
+            return 0, self.canvas.viewport(self.scroll_ptr, width)
+
+        def cancel_reload(self):
+            """Streamed rows have no background reloads to cancel."""
+            pass
+
+        def canvas_bytes(self):
+            """Return the number of bytes of pixel storage used by the row's
+            canvas; see StreamCanvas.nbytes.
+
+            Returns
+            -------
+            nbytes : int
+            """
+            return self.canvas.nbytes()
+
+        def _open_stream(self):
+            """Internal method returning a new canvas reading the content."""
+            if callable(self.content):
+                items = self.content(*self.content_args, **self.content_kwargs)
+            else:
+                items = self.content
+            return StreamCanvas(items, lpad_count=self.display_width)
+
+
+def _render_shared(content, args, kwargs):
+    """Internal function run in a worker process for Conveyor.ProcessSource;
+    evaluates a content function and draws its canvas in shared memory.
+
+    Parameters
+    ----------
+    content : function
+        The row's content function
+    args : tuple
+        Arguments to pass to the content function
+    kwargs : dict
+        Keyword arguments to pass to the content function
+
+    Returns
+    -------
+    name : str
+        The shared memory block's name; see shared_pixels.take_pixels
+    width : int
+        The canvas width
+    height : int
+        The canvas height
+    load_seconds : float
+        Time taken by the content function
+    render_seconds : float
+        Time taken to draw the canvas
+    """
+    from matrix_display.shared_pixels import share_canvas
+    start = time.perf_counter()
+    value = content(*args, **kwargs)
+    loaded = time.perf_counter()
+    source = Conveyor.DisplaySource(value, 0, 0, 0)
+    source.render()
+    canvas = source.canvas
+    name, width, height = share_canvas(canvas)
+    return name, width, height, loaded - start, time.perf_counter() - loaded
+
+
+def _iscoroutinefunction(function):
+    """Internal function returning True if function is a coroutine function
+    (async def), including bound methods and functools.partial objects of
+    one; as asyncio.iscoroutinefunction, without importing asyncio."""
+    while isinstance(function, functools.partial):
+        function = function.func
+    function = getattr(function, '__func__', function)  # bound methods
+    code = getattr(function, '__code__', None)
+    return code is not None and bool(code.co_flags & _CO_COROUTINE)
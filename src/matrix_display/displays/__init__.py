@@ -1,3 +1,8 @@
 from .display import Display
 from .terminal import Terminal
 from .unicornhathd import UnicornHATHD
+from .null import Null
+from .tiled import TiledDisplay, Tile
+from .recorder import Recorder, Replay
+from .gif import GifWriter
+from .threaded import ThreadedDisplay
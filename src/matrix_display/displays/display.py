@@ -38,6 +38,109 @@ class Display:
         """
         pass
 
+    def set_pixels(self, x, y, pixels):
+        """Set a run of pixels along a display row (use draw method to
+        display). Drivers able to update several pixels in one call should
+        override this; the default calls set_pixel for each pixel.
+
+        Parameters
+        ----------
+        x : int
+            The x coordinate of the pixels to be updated
+        y : int
+            The y coordinate of the first pixel to be updated; subsequent
+            pixels have y coordinates y + 1, y + 2, etc.
+        pixels : list of (int, int, int)
+            RGB tuples of the pixels to be updated; each component 0-255
+        """
+        for rgb in pixels:
+            self.set_pixel(x, y, rgb[0], rgb[1], rgb[2])
+            y += 1
+
+    def blit(self, buffer, x0, y0, width, height):
+        """Copy a block of packed RGB pixels to the display (use draw method
+        to display). Drivers with a native bulk update should override this;
+        the default passes each buffer row to set_pixels.
+
+        The buffer holds height rows of width pixels, row by row, with 3
+        bytes (red, green, blue) per pixel. Buffer rows map to display x
+        coordinates, as for set_pixel calls made by Conveyor.
+
+        Parameters
+        ----------
+        buffer : bytes or bytearray or memoryview or numpy.ndarray
+            Packed RGB pixels; NumPy arrays must have dtype uint8
+        x0 : int
+            The x coordinate of the block's first row
+        y0 : int
+            The y coordinate of the block's first column
+        width : int
+            The number of pixels in each block row
+        height : int
+            The number of rows in the block
+
+        Examples
+        --------
+        >>> from matrix_display.displays import Display
+        >>> class Printer(Display):
+        ...     def set_pixel(self, x, y, r, g, b):
+        ...         print(x, y, (r, g, b))
+        ...
+        >>> Printer(2, 2).blit(bytes([1, 2, 3, 4, 5, 6]), 1, 0, 2, 1)
+        1 0 (1, 2, 3)
+        1 1 (4, 5, 6)
+        >>>
+        """
+        data = self._packed_bytes(buffer, width, height)
+        row_size = width * 3
+        for row_ctr in range(height):
+            row = data[row_ctr * row_size:(row_ctr + 1) * row_size]
+            self.set_pixels(
+                x0 + row_ctr, y0, list(zip(row[0::3], row[1::3], row[2::3])))
+
+    def set_frame(self, buffer):
+        """Copy a whole display's worth of packed RGB pixels to the display
+        (use draw method to display); see blit.
+
+        Parameters
+        ----------
+        buffer : bytes or bytearray or memoryview or numpy.ndarray
+            row_count rows of col_count pixels, 3 bytes per pixel
+        """
+        self.blit(buffer, 0, 0, self.col_count, self.row_count)
+
     def draw(self):
         """Show current pixel colours (set with set_pixel) on the display."""
         pass
+
+    def skip_draw(self):
+        """Called by Conveyor instead of draw for frames in which no pixels
+        changed; drivers that need every frame (e.g. to record it) should
+        override this. The default does nothing."""
+        pass
+
+    @staticmethod
+    def _packed_bytes(buffer, width, height):
+        """Return buffer as a flat memoryview of width * height RGB pixels.
+
+        Parameters
+        ----------
+        buffer : bytes or bytearray or memoryview or numpy.ndarray
+            Packed RGB pixels
+        width : int
+            The number of pixels in each row
+        height : int
+            The number of rows
+
+        Returns
+        -------
+        data : memoryview
+            Exactly width * height * 3 bytes
+        """
+        data = memoryview(buffer).cast('B')
+        size = width * height * 3
+        if len(data) < size:
+            raise ValueError((
+                f"Buffer too small; require \"{size}\" bytes for "
+                f"{width}x{height} pixels, got \"{len(data)}\""))
+        return data[:size]
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""Module defining GifWriter display driver class, which writes the frames
+it is sent to an animated GIF file; useful to make previews of a sign's
+content without display hardware or screen recording.
+
+Examples
+--------
+>>> import os, tempfile
+>>> from matrix_display import Conveyor
+>>> from matrix_display.displays import GifWriter
+>>> path = os.path.join(tempfile.mkdtemp(), 'hello.gif')
+>>> with GifWriter(16, 16, path, scale=4) as gif:
+...     conveyor = Conveyor(gif)
+...     conveyor.add_row(('Hello, World!', (255, 255, 0)))
+...     gif.record(conveyor, 100)
+...
+True
+>>> with open(path, 'rb') as fh:
+...     fh.read(6)
+...
+b'GIF89a'
+>>> gif.frame_count
+99
+>>>
+"""
+from matrix_display.displays import Display
+import matrix_display.rgb_colours as rgb_colours
+import struct
+import time
+
+_TRANSPARENT = 0  # palette index of unchanged pixels
+_MAX_COLOURS = 256
+
+
+class GifWriter(Display):
+    """A display that writes each frame it draws to an animated GIF file.
+
+    Frames are written as they are drawn, so memory use does not depend on
+    the number of frames. Each frame only covers the rectangle of pixels
+    that changed since the previous frame, and pixels in it that did not
+    change are transparent, which keeps files small. Each frame is shown
+    for the time until the next draw.
+
+    Colours are taken from a palette of the rgb_colours colours plus colours
+    seen in frames, up to the GIF limit of 256 colours; further colours are
+    shown as the nearest palette colour.
+    """
+    def __init__(self, row_count, col_count, path, scale=1, loop=True,
+                 clock=time.monotonic):
+        """Initialise the writer and start the GIF file.
+
+        Parameters
+        ----------
+        row_count : int
+            The number of display rows
+        col_count : int
+            The number of display columns
+        path : str
+            The GIF file's path; an existing file is replaced
+        scale : int
+            Optional width and height in GIF pixels of each display pixel;
+            default 1
+        loop : bool
+            Optional; if True (default), the animation repeats forever
+        clock : Callable
+            Optional function returning the current time in seconds, used
+            to time frames; defaults to time.monotonic. See record to time
+            frames by Conveyor frame instead
+        """
+        super().__init__(row_count, col_count)
+        self.scale = scale
+        self.clock = clock
+        self.frame = bytearray(row_count * col_count * 3)  # current pixels
+        self.frame_count = 0
+        self._shown = None  # pixels of the last frame written
+        self._pending = None  # (draw time, encoded image) awaiting its delay
+        self._start = None  # draw time of the first frame
+        self._centiseconds = 0  # total delay written so far
+        self._palette = [rgb_colours.black]  # entry 0 is transparent
+        self._indexes = {}  # packed RGB bytes: palette index
+        for value in vars(rgb_colours).values():
+            if type(value) is tuple:
+                self._palette_index(bytes(value))
+        self._global_size = len(self._palette)  # entries in global table
+
+        self._file = open(path, 'wb')
+        table_bits = self._table_bits(self._global_size)
+        self._file.write(b'GIF89a' + struct.pack(
+            '<HHBBB', col_count * scale, row_count * scale,
+            0xf0 | (table_bits - 1), 0, 0))
+        self._file.write(self._colour_table(self._global_size))
+        if loop:
+            self._file.write(
+                b'\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00')
+
+    def set_pixel(self, x, y, r, g, b):
+        """Set a pixel's RGB value; see Display.set_pixel."""
+        offset = (x * self.col_count + y) * 3
+        self.frame[offset:offset + 3] = bytes((r, g, b))
+
+    def blit(self, buffer, x0, y0, width, height):
+        """Copy a block of packed RGB pixels to the frame; see Display.blit.
+        """
+        data = self._packed_bytes(buffer, width, height)
+        row_size = width * 3
+        for row_ctr in range(height):
+            offset = ((x0 + row_ctr) * self.col_count + y0) * 3
+            self.frame[offset:offset + row_size] = \
+                data[row_ctr * row_size:(row_ctr + 1) * row_size]
+
+    def draw(self):
+        """Add the current frame to the GIF; nothing is added if no pixels
+        changed since the last frame."""
+        now = self.clock()
+        if self._shown == self.frame:
+            return
+
+        image = self._encode_frame()
+        self._write_pending(now)
+        self._pending = (now, image)
+        self._shown = bytes(self.frame)
+        self.frame_count += 1
+
+    def record(self, conveyor, frames):
+        """Show frames of a Conveyor using this display, as fast as
+        possible, timing the GIF as if conveyor.scroll_delay seconds passed
+        between frames; see Conveyor.run_for.
+
+        Parameters
+        ----------
+        conveyor : matrix_display.Conveyor
+            The conveyor to run; its display must be this writer
+        frames : int
+            The number of frames to show
+        """
+        now = [0.0]
+        clock, self.clock = self.clock, lambda: now[0]
+        try:
+            if self._pending is not None:
+                self._write_pending(self._pending[0])  # end previous frames
+            for __ in range(frames):
+                conveyor.run_for(1)
+                now[0] += conveyor.scroll_delay
+            self._write_pending(now[0])
+        finally:
+            self.clock = clock
+
+    def close(self):
+        """Finish the GIF and close its file."""
+        self._write_pending(self.clock())
+        self._file.write(b'\x3b')  # trailer
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_pending(self, now):
+        """Internal method to write the pending frame, shown until now."""
+        if self._pending is None:
+            return
+        drawn, image = self._pending
+        self._pending = None
+        if self._start is None:
+            self._start = drawn
+        # Delays are whole centiseconds; keep their total in step with time
+        end = max(round((now - self._start) * 100), self._centiseconds + 1)
+        delay = min(end - self._centiseconds, 0xffff)
+        self._centiseconds += delay
+        self._file.write(struct.pack(
+            '<BBBBHBB', 0x21, 0xf9, 4, 0x05, delay, _TRANSPARENT, 0))
+        self._file.write(image)
+
+    def _encode_frame(self):
+        """Internal method to encode the pixels that changed since the last
+        frame as a GIF image.
+
+        Returns
+        -------
+        image : bytes
+            The image descriptor, any local colour table and the image data
+        """
+        row_size = self.col_count * 3
+        frame, shown = self.frame, self._shown
+        if shown is None:  # first frame covers the whole display
+            top, bottom, left, right = 0, self.row_count, 0, self.col_count
+        else:
+            changed = [row for row in range(self.row_count)
+                       if frame[row * row_size:(row + 1) * row_size]
+                       != shown[row * row_size:(row + 1) * row_size]]
+            top, bottom = changed[0], changed[-1] + 1
+            left, right = self.col_count, 0
+            for row in changed:
+                offset = row * row_size
+                col = 0
+                while frame[offset + col * 3:offset + col * 3 + 3] == \
+                        shown[offset + col * 3:offset + col * 3 + 3]:
+                    col += 1
+                left = min(left, col)
+                col = self.col_count
+                while frame[offset + col * 3 - 3:offset + col * 3] == \
+                        shown[offset + col * 3 - 3:offset + col * 3]:
+                    col -= 1
+                right = max(right, col)
+
+        scale = self.scale
+        indexes = bytearray()
+        for row in range(top, bottom):
+            offset = row * row_size
+            line = bytearray()
+            for i in range(offset + left * 3, offset + right * 3, 3):
+                pixel = frame[i:i + 3]
+                if shown is not None and pixel == shown[i:i + 3]:
+                    index = _TRANSPARENT
+                else:
+                    index = self._indexes.get(bytes(pixel))
+                    if index is None:
+                        index = self._palette_index(bytes(pixel))
+                line += bytes((index,)) * scale
+            indexes += line * scale
+
+        size = len(self._palette)
+        local = size > self._global_size  # colours beyond the global table
+        table_bits = self._table_bits(size if local else self._global_size)
+        descriptor = struct.pack(
+            '<BHHHHB', 0x2c, left * scale, top * scale,
+            (right - left) * scale, (bottom - top) * scale,
+            (0x80 | (table_bits - 1)) if local else 0)
+        min_code_size = max(table_bits, 2)
+        data = _lzw_encode(indexes, min_code_size)
+        blocks = [bytes((min_code_size,))]
+        for start in range(0, len(data), 255):
+            chunk = data[start:start + 255]
+            blocks.append(bytes((len(chunk),)) + chunk)
+        blocks.append(b'\x00')
+        return b''.join([
+            descriptor,
+            self._colour_table(size) if local else b'',
+            *blocks])
+
+    def _palette_index(self, rgb):
+        """Internal method returning the palette index for packed RGB bytes,
+        adding the colour if the palette has room, otherwise the index of
+        the nearest palette colour."""
+        index = self._indexes.get(rgb)
+        if index is not None:
+            return index
+        if len(self._palette) < _MAX_COLOURS:
+            index = len(self._palette)
+            self._palette.append(tuple(rgb))
+        else:
+            index = min(
+                range(1, len(self._palette)), key=lambda i: sum(
+                    (a - b) ** 2 for a, b in zip(self._palette[i], rgb)))
+        self._indexes[rgb] = index
+        return index
+
+    def _colour_table(self, size):
+        """Internal method returning the first size palette entries as a GIF
+        colour table, padded to a power of 2 entries."""
+        table = b''.join(bytes(rgb) for rgb in self._palette[:size])
+        return table.ljust(3 << self._table_bits(size), b'\x00')
+
+    @staticmethod
+    def _table_bits(size):
+        """Internal method returning the bits needed to index a colour table
+        of size entries; GIF colour tables have 2 to 256 entries."""
+        return max((size - 1).bit_length(), 1)
+
+
+def _lzw_encode(indexes, min_code_size):
+    """Internal function to compress palette indexes with the variable code
+    size LZW algorithm used by GIF images.
+
+    Parameters
+    ----------
+    indexes : bytes-like
+        The palette index of each pixel
+    min_code_size : int
+        The number of bits in a palette index, at least 2
+
+    Returns
+    -------
+    data : bytearray
+        The compressed codes, packed least significant bit first
+    """
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    bits = bit_count = 0
+
+    code_size = min_code_size + 1
+    next_code = end + 1
+    table = {}  # (prefix code << 8) | index: code
+    codes = [clear]  # codes to emit, with the code size for each
+    sizes = [code_size]
+    prefix = None
+    for index in indexes:
+        if prefix is None:
+            prefix = index
+            continue
+        key = (prefix << 8) | index
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        codes.append(prefix)
+        sizes.append(code_size)
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:  # table full; start again
+            codes.append(clear)
+            sizes.append(code_size)
+            table.clear()
+            code_size = min_code_size + 1
+            next_code = end + 1
+        prefix = index
+    if prefix is not None:
+        codes.append(prefix)
+        sizes.append(code_size)
+    codes.append(end)
+    sizes.append(code_size)
+
+    for code, size in zip(codes, sizes):
+        bits |= code << bit_count
+        bit_count += size
+        while bit_count >= 8:
+            out.append(bits & 0xff)
+            bits >>= 8
+            bit_count -= 8
+    if bit_count > 0:
+        out.append(bits & 0xff)
+    return out
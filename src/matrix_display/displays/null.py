@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Module defining Null display driver class."""
+from matrix_display.displays import Display
+
+
+class Null(Display):
+    """A display that discards its pixels; useful to measure the cost of
+    producing frames without the cost of showing them.
+
+    Examples
+    --------
+    >>> from matrix_display import Conveyor
+    >>> from matrix_display.displays import Null
+    >>> display = Null(16, 16)
+    >>> conveyor = Conveyor(display)
+    >>> conveyor.add_row('Hello, World!')
+    True
+    >>> conveyor.run_for(10)
+    >>> display.draw_count
+    10
+    >>>
+    """
+    def __init__(self, row_count, col_count):
+        """Initialise Null object with requested size."""
+        super().__init__(row_count, col_count)
+        self.draw_count = 0
+
+    def set_pixel(self, x, y, r, g, b):
+        """Ignore a pixel update; see Display.set_pixel."""
+        pass
+
+    def blit(self, buffer, x0, y0, width, height):
+        """Ignore a block of pixel updates; see Display.blit."""
+        pass
+
+    def draw(self):
+        """Count the number of times the display is drawn."""
+        self.draw_count += 1
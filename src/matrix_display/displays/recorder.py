@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Module defining Recorder display driver class, which saves the frames it
+is sent to a file, and Replay class, which plays a recording back on any
+display; useful to profile rendering without display hardware and to
+compare frames between library versions.
+
+A recording file holds, little-endian:
+
+* a header: the magic bytes b'MDRC', a format version (1), flags (bit 0 set
+  if frames are zlib compressed), the display's row count and column count
+  (uint16 each)
+* a record per frame: the seconds since recording started (float64), the
+  size of the frame data (uint32) and the frame data
+
+Frame data lists the pixels that changed since the previous frame (the first
+frame is compared with a black frame): for each display row with changes,
+the row, the first changed column and the number of columns (uint16 each),
+then those columns' packed RGB bytes. Frames in which nothing changed (see
+Display.skip_draw) have no spans, so the recording keeps every frame and its
+timing. If compressed, each frame's data is compressed separately.
+
+Examples
+--------
+>>> import os, tempfile
+>>> from matrix_display import Conveyor
+>>> from matrix_display.displays import Null, Recorder, Replay
+>>> path = os.path.join(tempfile.mkdtemp(), 'hello.mdr')
+>>> with Recorder(16, 16, path) as recorder:
+...     conveyor = Conveyor(recorder)
+...     conveyor.add_row('Hello, World!')
+...     conveyor.run_for(100)
+...
+True
+>>> recorder.frame_count  # including frames where nothing changed
+100
+>>> with Replay(path) as replay:
+...     display = Null(replay.row_count, replay.col_count)
+...     replay.play(display, speed=None)  # as fast as possible
+...     frames = [bytes(frame) for __, frame in replay.frames()]
+...
+>>> display.draw_count, len(frames), frames[-1] == recorder.frame
+(98, 100, True)
+>>>
+"""
+from matrix_display.displays import Display
+import mmap
+import struct
+import time
+import zlib
+
+MAGIC = b'MDRC'
+VERSION = 1
+FLAG_COMPRESSED = 1
+_HEADER = struct.Struct('<4sBBHH')
+_FRAME = struct.Struct('<dI')  # timestamp, frame data size
+_SPAN = struct.Struct('<HHH')  # row, first column, column count
+
+
+class Recorder(Display):
+    """A display that saves each frame it draws to a recording file.
+
+    Pixels are kept in an in-memory frame; each call to draw appends the
+    pixels that changed since the previous draw to the file, with the time
+    since the recording started. Conveyor calls skip_draw instead of draw
+    for frames where nothing changed; these are recorded too, with no
+    pixels.
+    """
+    def __init__(self, row_count, col_count, path, compress=True,
+                 clock=time.monotonic):
+        """Initialise the recorder and create the recording file.
+
+        Parameters
+        ----------
+        row_count : int
+            The number of display rows
+        col_count : int
+            The number of display columns
+        path : str
+            The recording file's path; an existing file is replaced
+        compress : bool
+            Optional; if True (default), compress each frame with zlib
+        clock : Callable
+            Optional function returning the current time in seconds, used
+            to timestamp frames; defaults to time.monotonic
+        """
+        super().__init__(row_count, col_count)
+        self.compress = compress
+        self.clock = clock
+        self.frame = bytearray(row_count * col_count * 3)  # current pixels
+        self.frame_count = 0
+        self._recorded = bytearray(len(self.frame))  # pixels last recorded
+        self._dirty = set()  # rows changed since the last draw
+        self._start = None  # clock time of the first frame
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(
+            MAGIC, VERSION, FLAG_COMPRESSED if compress else 0,
+            row_count, col_count))
+
+    def set_pixel(self, x, y, r, g, b):
+        """Set a pixel's RGB value; see Display.set_pixel."""
+        offset = (x * self.col_count + y) * 3
+        self.frame[offset:offset + 3] = bytes((r, g, b))
+        self._dirty.add(x)
+
+    def blit(self, buffer, x0, y0, width, height):
+        """Copy a block of packed RGB pixels to the frame; see Display.blit.
+        """
+        data = self._packed_bytes(buffer, width, height)
+        row_size = width * 3
+        for row_ctr in range(height):
+            offset = ((x0 + row_ctr) * self.col_count + y0) * 3
+            self.frame[offset:offset + row_size] = \
+                data[row_ctr * row_size:(row_ctr + 1) * row_size]
+            self._dirty.add(x0 + row_ctr)
+
+    def draw(self):
+        """Append the pixels that changed since the last draw to the
+        recording file."""
+        now = self.clock()
+        if self._start is None:
+            self._start = now
+
+        row_size = self.col_count * 3
+        spans = []
+        for row in sorted(self._dirty):
+            offset = row * row_size
+            pixels = self.frame[offset:offset + row_size]
+            recorded = self._recorded[offset:offset + row_size]
+            if pixels == recorded:
+                continue
+            start = 0  # first changed column
+            while pixels[start * 3:start * 3 + 3] == \
+                    recorded[start * 3:start * 3 + 3]:
+                start += 1
+            end = self.col_count  # column after the last changed column
+            while pixels[end * 3 - 3:end * 3] == recorded[end * 3 - 3:end * 3]:
+                end -= 1
+            spans.append(_SPAN.pack(row, start, end - start))
+            spans.append(pixels[start * 3:end * 3])
+            self._recorded[offset:offset + row_size] = pixels
+        self._dirty.clear()
+
+        data = b''.join(spans)
+        if self.compress:
+            data = zlib.compress(data)
+        self._file.write(_FRAME.pack(now - self._start, len(data)))
+        self._file.write(data)
+        self.frame_count += 1
+
+    def skip_draw(self):
+        """Record a frame in which no pixels changed; see
+        Display.skip_draw."""
+        self.draw()
+
+    def close(self):
+        """Finish the recording and close its file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Replay:
+    """Plays a recording made by Recorder back on a display, or iterates
+    over its frames.
+
+    The file is memory mapped, so frames are read as they are needed and
+    recordings of any length can be replayed.
+    """
+    def __init__(self, path):
+        """Open a recording.
+
+        Parameters
+        ----------
+        path : str
+            The recording file's path
+        """
+        with open(path, 'rb') as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < _HEADER.size:
+                raise ValueError('File is too short to be a recording')
+            magic, version, flags, self.row_count, self.col_count = \
+                _HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise ValueError('File is not a recording')
+            if version != VERSION:
+                raise ValueError(
+                    f"Unsupported recording version \"{version}\"")
+        except ValueError:
+            self._map.close()
+            raise
+        self.compressed = bool(flags & FLAG_COMPRESSED)
+
+    def frames(self):
+        """Iterate over the recording's frames.
+
+        Yields
+        ------
+        timestamp : float
+            Seconds from the start of the recording
+        frame : bytearray
+            The whole frame's packed RGB pixels, row by row; updated in
+            place by the next iteration, so copy it to keep it
+        """
+        frame = bytearray(self.row_count * self.col_count * 3)
+        for timestamp, __ in self._records(frame):
+            yield timestamp, frame
+
+    def play(self, display, speed=1.0, clock=time.monotonic,
+             sleep=time.sleep):
+        """Show the recording's frames on a display.
+
+        Parameters
+        ----------
+        display : matrix_display.Display
+            The display to show frames on; it should be at least as large as
+            the recording
+        speed : float
+            Optional playback speed; 1 (default) for the original speed, 2
+            for twice as fast, etc. None shows frames as fast as possible
+        clock : Callable
+            Optional function returning the current time in seconds;
+            defaults to time.monotonic
+        sleep : Callable
+            Optional function to sleep for a number of seconds; defaults to
+            time.sleep
+        """
+        frame = bytearray(self.row_count * self.col_count * 3)
+        row_size = self.col_count * 3
+        start = clock()
+        for timestamp, spans in self._records(frame):
+            if speed is not None:
+                delay = start + timestamp / speed - clock()
+                if delay > 0:
+                    sleep(delay)
+            for row, col, count in spans:
+                offset = row * row_size + col * 3
+                display.blit(
+                    frame[offset:offset + count * 3], row, col, count, 1)
+            if spans:
+                display.draw()
+            else:
+                display.skip_draw()  # as Conveyor does for unchanged frames
+
+    def _records(self, frame):
+        """Internal generator applying each frame's changes to frame.
+
+        Parameters
+        ----------
+        frame : bytearray
+            Packed RGB pixels of the frame, initially black
+
+        Yields
+        ------
+        timestamp : float
+            Seconds from the start of the recording
+        spans : list of (int, int, int)
+            The (row, first column, column count) of each changed span
+        """
+        row_size = self.col_count * 3
+        position = _HEADER.size
+        while position + _FRAME.size <= len(self._map):
+            timestamp, size = _FRAME.unpack_from(self._map, position)
+            position += _FRAME.size
+            data = self._map[position:position + size]  # bytes, not a view
+            position += size
+            if self.compressed:
+                data = zlib.decompress(data)
+
+            spans = []
+            offset = 0
+            while offset < len(data):
+                row, col, count = _SPAN.unpack_from(data, offset)
+                offset += _SPAN.size
+                start = row * row_size + col * 3
+                frame[start:start + count * 3] = \
+                    data[offset:offset + count * 3]
+                offset += count * 3
+                spans.append((row, col, count))
+            yield timestamp, spans
+
+    def close(self):
+        """Close the recording."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
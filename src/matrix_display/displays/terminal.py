@@ -2,6 +2,7 @@
 """Module defining Terminal display driver class."""
 from matrix_display import Canvas
 from matrix_display.displays import Display
+import sys
 
 
 class Terminal(Display):
@@ -35,10 +36,31 @@ class Terminal(Display):
     """
     canvas = None
 
-    def __init__(self, row_count, col_count):
-        """Initialise Terminal object with requested size."""
+    def __init__(self, row_count, col_count, colour_mode='16',
+                 differential=False):
+        """Initialise Terminal object with requested size.
+
+        Parameters
+        ----------
+        row_count : int
+            The number of display rows
+        col_count : int
+            The number of display columns
+        colour_mode : str
+            Optional terminal colour support; '16' (default), '256' or
+            'truecolour', see Canvas.to_str
+        differential : bool
+            Optional; if True, after the first frame draw only rewrites the
+            pixels that changed since the previous draw, positioning the
+            cursor on each, which greatly reduces the amount of output (e.g.
+            over a slow SSH link); defaults to False
+        """
         super().__init__(row_count, col_count)
         self.canvas = Canvas(row_count=row_count, lpad_count=col_count)
+        self.colour_mode = colour_mode
+        self.differential = differential
+        self._shown = None  # copy of the canvas rows last drawn
+        self._shown_wide = None  # wide setting of the last draw
 
     def set_pixel(self, x, y, r, g, b):
         """Sets a pixel's RGB value.
@@ -58,29 +80,129 @@ class Terminal(Display):
         """
         self.canvas.rows[x][y] = (r, g, b)
 
+    def set_pixels(self, x, y, pixels):
+        """Sets a run of pixels along a row.
+
+        Parameters
+        ----------
+        x : int
+            The x coordinate of the pixels to be updated
+        y : int
+            The y coordinate of the first pixel to be updated
+        pixels : list of (int, int, int)
+            RGB tuples of the pixels to be updated; each component 0-255
+        """
+        self.canvas.rows[x][y:y + len(pixels)] = pixels
+
+    def blit(self, buffer, x0, y0, width, height):
+        """Copy a block of packed RGB pixels; see Display.blit.
+
+        Parameters
+        ----------
+        buffer : bytes or bytearray or memoryview or numpy.ndarray
+            Packed RGB pixels; NumPy arrays must have dtype uint8
+        x0 : int
+            The x coordinate of the block's first row
+        y0 : int
+            The y coordinate of the block's first column
+        width : int
+            The number of pixels in each block row
+        height : int
+            The number of rows in the block
+        """
+        data = bytes(self._packed_bytes(buffer, width, height))
+        row_size = width * 3
+        for row_ctr in range(height):
+            row = data[row_ctr * row_size:(row_ctr + 1) * row_size]
+            self.canvas.rows[x0 + row_ctr][y0:y0 + width] = zip(
+                row[0::3], row[1::3], row[2::3])
+
     def draw(self, move_cursor=True, wide=True):
-        """Prints a textual representation of the display.
+        """Prints a textual representation of the display; the frame is
+        written to stdout in one write and flushed.
 
         Parameters
         ----------
         move_cursor : bool
             Determines if the cursor is moved to the top left of the screen
-            before the textual representation of the display is printed
+            before the textual representation of the display is printed;
+            differential drawing is only used if True
         wide : bool
             If True (default) use 2 terminal characters per pixel to try and
             get row and column size more equal; set to False to optimise space
         """
-        if move_cursor:
-            print('\033[1;1H')  # move cursor to top left of terminal
-
-        if wide:
-            print(self.canvas.to_str(
-                show_colour=True, pixel_on='\u2588\u2588', pixel_off='  '))
+        if move_cursor and self.differential and self._shown is not None \
+                and wide == self._shown_wide:
+            text = self._changes_str(wide)
         else:
-            print(self.canvas.to_str(show_colour=True))
+            pixel_on, pixel_off = ('\u2588\u2588', '  ') if wide else (
+                '\u2588', ' ')
+            text = ''.join([
+                '\033[1;1H\n' if move_cursor else '',  # top left of terminal
+                self.canvas.to_str(
+                    show_colour=True, pixel_on=pixel_on, pixel_off=pixel_off,
+                    colour_mode=self.colour_mode),
+                '\n',
+                '\nCTRL-C to exit\n' if move_cursor else ''
+            ])
+
+        if move_cursor and self.differential:
+            self._shown = [list(row) for row in self.canvas.rows]
+            self._shown_wide = wide
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def _changes_str(self, wide):
+        """Internal method returning terminal output that redraws only the
+        pixels changed since the last draw, leaving the cursor where a full
+        draw would.
+
+        Parameters
+        ----------
+        wide : bool
+            If True use 2 terminal characters per pixel; see draw
+
+        Returns
+        -------
+        text : str
+            Cursor positioning, colour codes and pixel characters
+        """
+        pixel_on, pixel_off = ('\u2588\u2588', '  ') if wide else (
+            '\u2588', ' ')
+        pixel_size = len(pixel_on)
+        parts = []
+        colour = None  # colour code in effect at this point of the output
+        for row_ctr, (row, shown) in enumerate(zip(
+                self.canvas.rows, self._shown)):
+            if row == shown:
+                continue
+
+            next_col = None  # column the cursor is at after the last write
+            for col_ctr, rgb in enumerate(row):
+                if rgb == shown[col_ctr]:
+                    continue
+
+                if col_ctr != next_col:
+                    # Frame starts on terminal line 2, after a '[' column
+                    parts.append(
+                        f'\033[{row_ctr + 2};{col_ctr * pixel_size + 2}H')
+                if rgb[0] == 0 and rgb[1] == 0 and rgb[2] == 0:
+                    if colour is not None:
+                        parts.append('\033[0m')
+                        colour = None
+                    parts.append(pixel_off)
+                else:
+                    code = Canvas._colour_code(tuple(rgb), self.colour_mode)
+                    if code != colour:
+                        parts.append(code)
+                        colour = code
+                    parts.append(pixel_on)
+                next_col = col_ctr + 1
 
-        if move_cursor:
-            print('\nCTRL-C to exit')
+        if colour is not None:
+            parts.append('\033[0m')
+        parts.append(f'\033[{len(self._shown) + 4};1H')  # below the frame
+        return ''.join(parts)
 
     @staticmethod
     def clear_screen():
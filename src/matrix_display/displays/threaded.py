@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Module defining ThreadedDisplay class, which sends frames to a display
+driver from a separate thread."""
+from matrix_display.displays import Display
+import threading
+
+
+class ThreadedDisplay(Display):
+    """A display that passes frames to another display driver in a separate
+    output thread, so the next frame can be composed while the driver sends
+    the last one (e.g. over SPI); see Conveyor's draw_thread parameter.
+
+    Pixels are written to a back buffer; draw hands the pixels that changed
+    since the previous draw to the output thread as a front buffer, which
+    the thread copies to the driver with blit before calling its draw. All
+    calls to the driver are made from the output thread. If the driver is
+    still sending a frame when the next is drawn, draw waits for it to
+    finish, so composing never runs more than one frame ahead; with
+    drop_frames, draw instead merges the new frame into any frame still
+    waiting to be sent, and returns at once.
+
+    An exception raised by the driver is raised again by the next call to
+    draw, flush or close.
+
+    Examples
+    --------
+    >>> from matrix_display import Conveyor
+    >>> from matrix_display.displays import Recorder, ThreadedDisplay
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'hello.mdr')
+    >>> recorder = Recorder(16, 16, path)
+    >>> with ThreadedDisplay(recorder) as display:
+    ...     conveyor = Conveyor(display)
+    ...     conveyor.add_row('Hello, World!')
+    ...     conveyor.run_for(100)
+    ...
+    True
+    >>> recorder.close()
+    >>> display.frame_count, recorder.frame_count, display.frames_merged
+    (100, 100, 0)
+    >>> recorder.frame == display.frame
+    True
+    >>>
+    """
+    def __init__(self, display, drop_frames=False):
+        """Initialise the display and start its output thread.
+
+        Parameters
+        ----------
+        display : matrix_display.Display
+            The display driver to send frames to
+        drop_frames : bool
+            Optional; if True, draw does not wait for the driver: frames not
+            yet sent are merged with the next frame. Defaults to False
+        """
+        super().__init__(display.row_count, display.col_count)
+        self.display = display
+        self.drop_frames = drop_frames
+        self.frame = bytearray(self.row_count * self.col_count * 3)  # back
+        self.frame_count = 0  # frames sent to the driver
+        self.frames_merged = 0  # frames merged into the next frame
+        self._spans = {}  # row: [start, end] columns changed since draw
+        self._front = None  # spans of (row, col, pixels) awaiting output
+        self._front_changed = False  # True to draw the front, else skip
+        self._drawing = False  # True while the driver is sending a frame
+        self._error = None  # exception raised by the driver
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._output, name='matrix_display_output', daemon=True)
+        self._thread.start()
+
+    def set_pixel(self, x, y, r, g, b):
+        """Set a pixel's RGB value; see Display.set_pixel."""
+        self.blit(bytes((r, g, b)), x, y, 1, 1)
+
+    def blit(self, buffer, x0, y0, width, height):
+        """Copy a block of packed RGB pixels to the back buffer; see
+        Display.blit."""
+        data = self._packed_bytes(buffer, width, height)
+        row_size = width * 3
+        for row_ctr in range(height):
+            row = x0 + row_ctr
+            offset = (row * self.col_count + y0) * 3
+            self.frame[offset:offset + row_size] = \
+                data[row_ctr * row_size:(row_ctr + 1) * row_size]
+            span = self._spans.get(row)
+            if span is None:
+                self._spans[row] = [y0, y0 + width]
+            else:
+                span[0] = min(span[0], y0)
+                span[1] = max(span[1], y0 + width)
+
+    def draw(self):
+        """Hand the back buffer's changes to the output thread to send to
+        the driver; waits while the driver is sending the previous frame,
+        unless drop_frames is set."""
+        self._hand_off(True)
+
+    def skip_draw(self):
+        """Pass a frame with no changes to the output thread, which calls
+        the driver's skip_draw in turn; see Display.skip_draw."""
+        self._hand_off(False)
+
+    def _hand_off(self, changed):
+        """Internal method to hand the back buffer's changes to the output
+        thread, which calls the driver's draw if changed, otherwise its
+        skip_draw."""
+        row_size = self.col_count * 3
+        front = [
+            (row, start, bytes(
+                self.frame[row * row_size + start * 3:
+                           row * row_size + end * 3]))
+            for row, (start, end) in sorted(self._spans.items())]
+        self._spans.clear()
+
+        with self._condition:
+            self._raise_error()
+            if self.drop_frames and self._front is not None:
+                self._front.extend(front)  # newer pixels are sent last
+                self._front_changed = self._front_changed or changed
+                self.frames_merged += 1
+                return
+            while not self.drop_frames \
+                    and (self._front is not None or self._drawing):
+                self._condition.wait()  # back-pressure: driver is behind
+                self._raise_error()
+            self._front = front
+            self._front_changed = changed
+            self._condition.notify_all()
+
+    def flush(self):
+        """Wait until every frame drawn has been sent to the driver."""
+        with self._condition:
+            while self._front is not None or self._drawing:
+                self._condition.wait()
+            self._raise_error()
+
+    def close(self):
+        """Send any remaining frame to the driver and stop the output
+        thread."""
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _output(self):
+        """Internal method run by the output thread: send each front buffer
+        to the driver."""
+        while True:
+            with self._condition:
+                while self._front is None and not self._closed:
+                    self._condition.wait()
+                if self._front is None:  # closed
+                    return
+                front, self._front = self._front, None
+                changed = self._front_changed
+                self._drawing = True
+
+            try:
+                for row, col, pixels in front:
+                    self.display.blit(pixels, row, col, len(pixels) // 3, 1)
+                if changed:
+                    self.display.draw()
+                else:
+                    self.display.skip_draw()
+            except Exception as e:
+                with self._condition:
+                    self._error = e
+            finally:
+                with self._condition:
+                    self._drawing = False
+                    self.frame_count += 1
+                    self._condition.notify_all()
+
+    def _raise_error(self):
+        """Internal method to raise, once, an exception raised by the
+        driver; call while holding the condition's lock."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Module defining TiledDisplay class, a display made of several panels."""
+from matrix_display.displays import Display
+
+_rotations = (0, 90, 180, 270)
+
+
+class Tile:
+    """A child display's place in a TiledDisplay."""
+    def __init__(self, display, row=0, col=0, rotation=0):
+        """Initialise a tile.
+
+        Parameters
+        ----------
+        display : matrix_display.Display
+            The child display driver
+        row : int
+            Optional row of the tiled display shown on the tile's top row
+        col : int
+            Optional column of the tiled display shown on the tile's left
+            column
+        rotation : int
+            Optional degrees (0, 90, 180 or 270) the tile's pixels are
+            rotated clockwise by before they are sent to the child display;
+            e.g. 180 for a panel mounted upside down. With 90 or 270 the
+            tile covers child col_count rows and row_count columns
+        """
+        if rotation not in _rotations:
+            raise ValueError((
+                f"Can't rotate tile by \"{rotation}\" degrees; require one "
+                f"of {_rotations}"))
+        self.display = display
+        self.row = row
+        self.col = col
+        self.rotation = rotation
+        if rotation in (0, 180):
+            self.row_count = display.row_count
+            self.col_count = display.col_count
+        else:
+            self.row_count = display.col_count
+            self.col_count = display.row_count
+
+    def child_block(self, row, col, height, width):
+        """Return where a block of the tile's pixels goes on the child
+        display, and how its pixels are arranged there.
+
+        Parameters
+        ----------
+        row : int
+            The block's first row, relative to the tile's top row
+        col : int
+            The block's first column, relative to the tile's left column
+        height : int
+            The number of rows in the block
+        width : int
+            The number of columns in the block
+
+        Returns
+        -------
+        child_row : int
+            The child display row of the rotated block's first row
+        child_col : int
+            The child display column of the rotated block's first column
+        child_height : int
+            The number of rows in the rotated block
+        child_width : int
+            The number of columns in the rotated block
+        steps : (int, int, int)
+            (base, row step, column step); block pixel (i, j) is pixel
+            base + i * row step + j * column step of the rotated block
+        """
+        if self.rotation == 0:
+            return row, col, height, width, (0, width, 1)
+        elif self.rotation == 90:
+            return (col, self.row_count - row - height, width, height,
+                    (height - 1, -1, height))
+        elif self.rotation == 180:
+            return (self.row_count - row - height,
+                    self.col_count - col - width, height, width,
+                    (height * width - 1, -width, -1))
+        return (self.col_count - col - width, row, width, height,
+                ((width - 1) * height, 1, -height))
+
+
+class TiledDisplay(Display):
+    """A display made of several child displays (e.g. chained panels of
+    different sizes) that Conveyor can treat as one large display.
+
+    Each tile shows a rectangle of the tiled display, optionally rotated;
+    blocks of pixels are sent to each child display with its blit method,
+    and child displays are drawn in parallel threads, so slow drivers (e.g.
+    separate SPI buses) update at the same time. Only tiles whose pixels
+    changed are drawn. Parts of the tiled display not covered by a tile are
+    not shown.
+
+    Examples
+    --------
+    >>> from matrix_display import Canvas, Conveyor
+    >>> from matrix_display.displays import Display, TiledDisplay, Tile
+    >>> class Panel(Display):
+    ...     def __init__(self, row_count, col_count):
+    ...         super().__init__(row_count, col_count)
+    ...         self.canvas = Canvas(col_count, row_count)
+    ...     def set_pixel(self, x, y, r, g, b):
+    ...         self.canvas.rows[x][y] = (r, g, b)
+    ...
+    >>> left, right = Panel(5, 7), Panel(5, 7)
+    >>> display = TiledDisplay(5, 14, [
+    ...     Tile(left), Tile(right, col=7, rotation=180)])
+    >>> conveyor = Conveyor(display)
+    >>> conveyor.add_row('Hey!')
+    True
+    >>> conveyor.run_for(1)
+    >>> print(left.canvas.to_str())
+    [█ █  █ ]
+    [█ █ █ █]
+    [███ ███]
+    [█ █ █  ]
+    [█ █  ██]
+    >>> print(right.canvas.to_str())  # upside down
+    [ █  ██ ]
+    [   █   ]
+    [ █ ██  ]
+    [ █ █ █ ]
+    [ █ █ █ ]
+    >>>
+    """
+    def __init__(self, row_count, col_count, tiles, parallel=True):
+        """Initialise the tiled display.
+
+        Parameters
+        ----------
+        row_count : int
+            The number of rows in the tiled display
+        col_count : int
+            The number of columns in the tiled display
+        tiles : list of Tile
+            The child displays and where they are placed
+        parallel : bool
+            Optional; if True (default), draw child displays in parallel
+            threads, otherwise one after another
+        """
+        super().__init__(row_count, col_count)
+        self.tiles = tiles
+        self.parallel = parallel
+        self._dirty = set()  # indexes of tiles changed since last draw
+        self._executor = None  # thread pool for parallel draws
+
+    def set_pixel(self, x, y, r, g, b):
+        """Set a pixel's RGB value on the tile that shows it; see
+        Display.set_pixel."""
+        self.blit(bytes((r, g, b)), x, y, 1, 1)
+
+    def blit(self, buffer, x0, y0, width, height):
+        """Copy a block of packed RGB pixels to the tiles it overlaps; see
+        Display.blit.
+
+        Parameters
+        ----------
+        buffer : bytes or bytearray or memoryview or numpy.ndarray
+            Packed RGB pixels
+        x0 : int
+            The row of the block's first row
+        y0 : int
+            The column of the block's first column
+        width : int
+            The number of pixels in each block row
+        height : int
+            The number of rows in the block
+        """
+        data = self._packed_bytes(buffer, width, height)
+        row_size = width * 3
+        for index, tile in enumerate(self.tiles):
+            top = max(x0, tile.row)
+            bottom = min(x0 + height, tile.row + tile.row_count)
+            left = max(y0, tile.col)
+            right = min(y0 + width, tile.col + tile.col_count)
+            if top >= bottom or left >= right:
+                continue  # block does not overlap tile
+
+            h, w = bottom - top, right - left
+            child_row, child_col, child_height, child_width, steps = \
+                tile.child_block(top - tile.row, left - tile.col, h, w)
+            rows = (
+                data[(r - x0) * row_size + (left - y0) * 3:
+                     (r - x0) * row_size + (right - y0) * 3]
+                for r in range(top, bottom))
+            if tile.rotation == 0 and w == width:  # rows are contiguous
+                block = data[(top - x0) * row_size:(bottom - x0) * row_size]
+            elif tile.rotation == 0:
+                block = b''.join(rows)
+            else:
+                block = self._rotate(rows, w, h * w, steps)
+            tile.display.blit(
+                block, child_row, child_col, child_width, child_height)
+            self._dirty.add(index)
+
+    def draw(self):
+        """Draw the child displays whose pixels changed since the last
+        draw, in parallel if enabled; see skip_draw for the others."""
+        displays = [self.tiles[index].display for index in sorted(self._dirty)]
+        for index, tile in enumerate(self.tiles):
+            if index not in self._dirty:
+                tile.display.skip_draw()
+        self._dirty.clear()
+        if not self.parallel or len(displays) < 2:
+            for display in displays:
+                display.draw()
+            return
+
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor  # slow import
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.tiles),
+                thread_name_prefix='matrix_display_tiles')
+        futures = [self._executor.submit(display.draw)
+                   for display in displays]
+        for future in futures:
+            future.result()  # wait for all tiles; raise any driver error
+
+    def skip_draw(self):
+        """Tell every child display no pixels changed; see
+        Display.skip_draw."""
+        for tile in self.tiles:
+            tile.display.skip_draw()
+
+    @staticmethod
+    def _rotate(rows, width, count, steps):
+        """Internal method to arrange rows of a block's pixels for a rotated
+        tile.
+
+        Parameters
+        ----------
+        rows : iterable of bytes-like
+            Packed RGB pixels of each block row
+        width : int
+            The number of pixels in each block row
+        count : int
+            The number of pixels in the block
+        steps : (int, int, int)
+            (base, row step, column step); see Tile.child_block
+
+        Returns
+        -------
+        block : bytearray
+            The rotated block's packed RGB pixels
+        """
+        base, row_step, col_step = steps
+        block = bytearray(count * 3)
+        for i, row in enumerate(rows):
+            first = (base + i * row_step) * 3
+            last = first + (width - 1) * col_step * 3
+            for channel in range(3):
+                stop = last + channel + (1 if col_step > 0 else -1)
+                block[first + channel:stop if stop >= 0 else None:
+                      col_step * 3] = row[channel::3]
+        return block
@@ -20,6 +20,20 @@ class UnicornHATHD(Display):
         unicornhathd.set_pixel(x, y, r, g, b)
         return self
 
+    def blit(self, buffer, x0, y0, width, height):
+        # Write straight into unicornhathd's private pixel buffer: a NumPy
+        # array indexed [x][y], as set_pixel writes it, in unicornhathd
+        # releases 0.0.1 to 0.0.4. Fall back to set_pixel if it changes.
+        buf = getattr(unicornhathd, '_buf', None)
+        if getattr(buf, 'shape', None) != (self.row_count, self.col_count, 3):
+            return super().blit(buffer, x0, y0, width, height)
+
+        import numpy  # required by unicornhathd; slow to import
+        pixels = numpy.frombuffer(
+            self._packed_bytes(buffer, width, height), dtype=numpy.uint8)
+        buf[x0:x0 + height, y0:y0 + width] = pixels.reshape(height, width, 3)
+        return self
+
     # noinspection PyMethodMayBeStatic
     def draw(self):
         unicornhathd.show()
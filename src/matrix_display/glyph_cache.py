@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Module defining GlyphCache class, used by Canvas to reuse rendered
+characters.
+
+Examples
+--------
+>>> from matrix_display import Canvas
+>>> from matrix_display.glyph_cache import GlyphCache
+>>> shared_cache = Canvas.glyph_cache
+>>> Canvas.glyph_cache = GlyphCache(maxsize=8)
+>>> __ = Canvas().append_text('abab', (0, 255, 0))
+>>> Canvas.glyph_cache.hits, Canvas.glyph_cache.misses
+(2, 2)
+>>> len(Canvas.glyph_cache)
+2
+>>> Canvas.glyph_cache = shared_cache
+>>>
+"""
+from collections import OrderedDict
+import threading
+
+
+class GlyphCache:
+    """Least recently used cache of rendered characters.
+
+    Each entry holds a character's pixels as ready-to-append strips, one per
+    character row, that start with the blank column used to separate the
+    character from preceding content. Entries are keyed by the charset
+    object, the character, its colour and the strip format so one cache can
+    be shared by different Canvas classes. measure_text also keeps each
+    charset's table of character widths here.
+    """
+    def __init__(self, maxsize=1024):
+        """Initialise an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Optional maximum number of entries kept; the least recently used
+            entry is discarded when the cache is full
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()  # canvases may be drawn in threads
+
+    def lookup(self, charset, key, build, *args):
+        """Return cached strips for key, building and storing them if absent.
+
+        Parameters
+        ----------
+        charset : dict
+            The charset the character is drawn from
+        key : tuple
+            Hashable description of the character, e.g. its text, colour and
+            strip format
+        build : Callable
+            Function called with *args to build the strips on a cache miss
+        *args
+            Optional arguments to pass to build
+
+        Returns
+        -------
+        strips : tuple
+            The character's strips, one per character row
+        """
+        full_key = (id(charset), key)
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None and entry[0] is charset:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        strips = build(*args)
+        with self._lock:
+            self._entries[full_key] = (charset, strips)
+            self._entries.move_to_end(full_key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return strips
+
+    def clear(self):
+        """Discard all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __repr__(self):
+        """Return a summary of the cache's size and counters."""
+        return (
+            f'GlyphCache(size={len(self)}, maxsize={self.maxsize}, '
+            f'hits={self.hits}, misses={self.misses})')
+
+
+default = GlyphCache()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Module to decode and scale images for Canvas.from_image: PPM and PGM
+files (binary or ASCII), and PNG files, decoded in pure Python.
+
+Images are decoded to packed RGB bytes, row by row. Transparent pixels are
+blended with black, the colour of an unlit LED. PNG files may use any
+colour type and bit depth, but must not be interlaced.
+
+Examples
+--------
+>>> from matrix_display import image
+>>> ppm = b'P6 2 1 255 ' + bytes([255, 0, 0, 0, 0, 255])
+>>> image.decode_image(ppm)
+(2, 1, b'\\xff\\x00\\x00\\x00\\x00\\xff')
+>>> image.scale_image(2, 1, image.decode_image(ppm)[2], 1, 1)
+(1, 1, b'\\x7f\\x00\\x7f')
+>>>
+"""
+import functools
+import os
+import struct
+import zlib
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_methods = ('box', 'nearest')  # scale_image methods
+
+
+def load_image(image, width=None, height=None, method='box'):
+    """Decode an image and scale it; decoded image files are cached, so
+    loading an unchanged file again (e.g. when a row reloads) is quick.
+
+    Parameters
+    ----------
+    image : str or bytes-like
+        The image file's path, or its contents
+    width : int
+        Optional width to scale the image to; see scale_image
+    height : int
+        Optional height to scale the image to; see scale_image
+    method : str
+        Optional scaling method; see scale_image
+
+    Returns
+    -------
+    width : int
+    height : int
+    pixels : bytes
+        Packed RGB pixels, row by row
+    """
+    if isinstance(image, str):
+        stat = os.stat(image)
+        return _load_file(
+            image, stat.st_mtime_ns, stat.st_size, width, height, method)
+    return scale_image(*decode_image(bytes(image)), width, height, method)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_file(path, mtime, size, width, height, method):
+    """Internal function to load an image file; the file's modification time
+    and size are part of the cache key, so changed files are reloaded."""
+    with open(path, 'rb') as fh:
+        return scale_image(*decode_image(fh.read()), width, height, method)
+
+
+def decode_image(data):
+    """Decode a PPM, PGM or PNG image.
+
+    Parameters
+    ----------
+    data : bytes
+        The image file's contents
+
+    Returns
+    -------
+    width : int
+    height : int
+    pixels : bytes
+        Packed RGB pixels, row by row
+    """
+    if data.startswith(PNG_SIGNATURE):
+        return _decode_png(data)
+    elif data[:2] in (b'P2', b'P3', b'P5', b'P6'):
+        return _decode_pnm(data)
+    raise ValueError('Unsupported image format; require PPM, PGM or PNG')
+
+
+def scale_image(width, height, pixels, new_width=None, new_height=None,
+                method='box'):
+    """Scale an image.
+
+    Parameters
+    ----------
+    width : int
+        The image's width
+    height : int
+        The image's height
+    pixels : bytes
+        Packed RGB pixels, row by row
+    new_width : int
+        Optional width to scale to; if None and new_height is given, the
+        width that keeps the image's aspect ratio
+    new_height : int
+        Optional height to scale to; if None and new_width is given, the
+        height that keeps the image's aspect ratio
+    method : str
+        Optional; 'box' (default) averages the pixels each new pixel
+        covers, which suits shrinking photos and logos to panel size;
+        'nearest' picks one pixel, which keeps pixel art sharp
+
+    Returns
+    -------
+    width : int
+    height : int
+    pixels : bytes
+        Packed RGB pixels, row by row
+    """
+    if method not in _methods:
+        raise ValueError((
+            f"Can't scale image with method \"{method}\"; require one of "
+            f"{_methods}"))
+    if new_width is None and new_height is None:
+        return width, height, pixels
+    if new_width is None:
+        new_width = max(1, round(width * new_height / height))
+    if new_height is None:
+        new_height = max(1, round(height * new_width / width))
+    if (new_width, new_height) == (width, height):
+        return width, height, pixels
+
+    row_size = width * 3
+    if method == 'nearest':
+        columns = [x * width // new_width * 3 for x in range(new_width)]
+        rows = []
+        for y in range(new_height):
+            offset = y * height // new_height * row_size
+            rows.append(b''.join([
+                pixels[offset + x:offset + x + 3] for x in columns]))
+        return new_width, new_height, b''.join(rows)
+
+    # Box: average the source pixels under each new pixel
+    x_ranges = _box_ranges(width, new_width)
+    scaled = bytearray()
+    for y0, y1 in _box_ranges(height, new_height):
+        sums = [[0, 0, 0] for __ in range(new_width)]
+        for y in range(y0, y1):
+            row = pixels[y * row_size:(y + 1) * row_size]
+            for sum_rgb, (x0, x1) in zip(sums, x_ranges):
+                sum_rgb[0] += sum(row[x0 * 3:x1 * 3:3])
+                sum_rgb[1] += sum(row[x0 * 3 + 1:x1 * 3:3])
+                sum_rgb[2] += sum(row[x0 * 3 + 2:x1 * 3:3])
+        for sum_rgb, (x0, x1) in zip(sums, x_ranges):
+            count = (x1 - x0) * (y1 - y0)
+            scaled += bytes(value // count for value in sum_rgb)
+    return new_width, new_height, bytes(scaled)
+
+
+def _box_ranges(size, new_size):
+    """Internal function returning the (start, end) source pixels under
+    each of new_size pixels; each range has at least one pixel."""
+    return [(i * size // new_size,
+             max(i * size // new_size + 1, (i + 1) * size // new_size))
+            for i in range(new_size)]
+
+
+def _decode_pnm(data):
+    """Internal function to decode a PPM (P3, P6) or PGM (P2, P5) image."""
+    magic = data[:2]
+    tokens = []
+    position = 2
+    while len(tokens) < 3:  # width, height and maximum value
+        while position < len(data) and data[position:position + 1].isspace():
+            position += 1
+        if data[position:position + 1] == b'#':  # comment to end of line
+            while position < len(data) and data[position] not in b'\r\n':
+                position += 1
+            continue
+        start = position
+        while position < len(data) \
+                and not data[position:position + 1].isspace():
+            position += 1
+        if start == position:
+            raise ValueError('PPM/PGM header is incomplete')
+        tokens.append(int(data[start:position]))
+    width, height, max_value = tokens
+    channels = 3 if magic in (b'P3', b'P6') else 1
+    count = width * height * channels
+
+    if magic in (b'P5', b'P6'):
+        position += 1  # a single whitespace character ends the header
+        if max_value < 256:
+            samples = data[position:position + count]
+        else:  # 2 bytes per sample, most significant first
+            samples = struct.unpack(
+                f'>{count}H', data[position:position + count * 2])
+    else:
+        samples = [int(value) for value in data[position:].split()[:count]]
+    if len(samples) < count:
+        raise ValueError('PPM/PGM image data is incomplete')
+    if max_value != 255:
+        samples = [value * 255 // max_value for value in samples]
+    if channels == 1:
+        return width, height, bytes(
+            value for value in samples for __ in range(3))
+    return width, height, bytes(samples)
+
+
+def _decode_png(data):
+    """Internal function to decode a non-interlaced PNG image."""
+    position = len(PNG_SIGNATURE)
+    header = None
+    palette = b''
+    transparency = None
+    compressed = []
+    while position + 8 <= len(data):
+        length, chunk_type = struct.unpack_from('>I4s', data, position)
+        chunk = data[position + 8:position + 8 + length]
+        crc = data[position + 8 + length:position + 12 + length]
+        if len(crc) < 4 or zlib.crc32(chunk_type + chunk) \
+                != struct.unpack('>I', crc)[0]:
+            raise ValueError(f"PNG chunk \"{chunk_type}\" is corrupt")
+        position += 12 + length
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', chunk)
+        elif chunk_type == b'PLTE':
+            palette = chunk
+        elif chunk_type == b'tRNS':
+            transparency = chunk
+        elif chunk_type == b'IDAT':
+            compressed.append(chunk)
+        elif chunk_type == b'IEND':
+            break
+    if header is None:
+        raise ValueError('PNG image has no header')
+
+    width, height, bit_depth, colour_type, __, __, interlace = header
+    if interlace:
+        raise ValueError("Can't decode interlaced PNG images")
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}.get(colour_type)
+    if channels is None:
+        raise ValueError(f"Unsupported PNG colour type \"{colour_type}\"")
+    bits = channels * bit_depth  # per pixel
+    pixel_size = max(bits // 8, 1)  # filter byte distance
+    stride = (width * bits + 7) // 8
+    raw = zlib.decompress(b''.join(compressed))
+
+    max_value = (1 << bit_depth) - 1
+    pixels = bytearray()
+    previous = bytearray(stride)
+    for y in range(height):
+        offset = y * (stride + 1)
+        line = _unfilter(raw[offset], bytearray(
+            raw[offset + 1:offset + 1 + stride]), previous, pixel_size)
+        previous = line
+
+        if bit_depth == 16:
+            samples = line[0::2]
+            values = struct.unpack(f'>{len(line) // 2}H', line)
+        elif bit_depth == 8:
+            samples = values = line
+        else:  # 1, 2 or 4 bits; unpack most significant bits first
+            per_byte = 8 // bit_depth
+            values = [
+                (byte >> (8 - bit_depth * (i + 1))) & max_value
+                for byte in line for i in range(per_byte)][:width]
+            samples = [value * 255 // max_value for value in values]
+
+        if colour_type == 3:  # palette
+            alpha = transparency or b''
+            for index in values:
+                rgb = palette[index * 3:index * 3 + 3]
+                a = alpha[index] if index < len(alpha) else 255
+                pixels += _blend(rgb, a)
+        elif colour_type in (0, 2):  # grey or RGB, optional key colour
+            key = None
+            if transparency is not None:
+                key = tuple(struct.unpack(f'>{channels}H', transparency))
+            for x in range(width):
+                rgb = samples[x * channels:(x + 1) * channels]
+                if key is not None \
+                        and tuple(values[x * channels:(x + 1) * channels]) \
+                        == key:
+                    rgb = b'\x00' * channels
+                pixels += bytes(rgb) * 3 if channels == 1 else bytes(rgb)
+        else:  # grey or RGB with alpha
+            for x in range(width):
+                pixel = samples[x * channels:(x + 1) * channels]
+                rgb = pixel[:-1] * 3 if channels == 2 else pixel[:-1]
+                pixels += _blend(rgb, pixel[-1])
+    return width, height, bytes(pixels)
+
+
+def _unfilter(filter_type, line, previous, pixel_size):
+    """Internal function to reverse a PNG scanline filter in place."""
+    if filter_type == 0:
+        pass
+    elif filter_type == 1:  # sub
+        for i in range(pixel_size, len(line)):
+            line[i] = (line[i] + line[i - pixel_size]) & 0xff
+    elif filter_type == 2:  # up
+        line[:] = bytes(
+            (a + b) & 0xff for a, b in zip(line, previous))
+    elif filter_type == 3:  # average
+        for i in range(len(line)):
+            left = line[i - pixel_size] if i >= pixel_size else 0
+            line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xff
+    elif filter_type == 4:  # Paeth
+        for i in range(len(line)):
+            a = line[i - pixel_size] if i >= pixel_size else 0
+            b = previous[i]
+            c = previous[i - pixel_size] if i >= pixel_size else 0
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            if pa <= pb and pa <= pc:
+                predictor = a
+            elif pb <= pc:
+                predictor = b
+            else:
+                predictor = c
+            line[i] = (line[i] + predictor) & 0xff
+    else:
+        raise ValueError(f"Unsupported PNG filter type \"{filter_type}\"")
+    return line
+
+
+def _blend(rgb, alpha):
+    """Internal function returning rgb blended with black by alpha."""
+    if alpha == 255:
+        return bytes(rgb)
+    return bytes(value * alpha // 255 for value in rgb)
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""Module defining Metrics class, which records where a Conveyor spends its
+time: each frame's timing breakdown, each row's content reloads, late and
+dropped frames and the memory used by row canvases.
+
+Metrics can be read directly, passed to hook functions after each frame,
+summarised periodically and exported in the Prometheus text format, either
+written to a file (e.g. for the node_exporter textfile collector) or served
+over HTTP.
+
+Frame timings are split into phases:
+
+* advance: scrolling rows and reloading content on the display thread
+* compose: copying row pixels into the frame
+* blit: sending changed pixels to the display driver (e.g. set_pixel)
+* draw: the display driver's draw method
+
+Examples
+--------
+>>> from matrix_display import Conveyor
+>>> from matrix_display.displays import Null
+>>> from matrix_display.metrics import Metrics
+>>> def greeting():
+...     return 'Hi'
+...
+>>> metrics = Metrics()
+>>> conveyor = Conveyor(Null(16, 16), metrics=metrics)
+>>> conveyor.add_row(greeting, 0.09)
+True
+>>> conveyor.run_for(10)
+>>> metrics.frames, sorted(metrics.frame_seconds)
+(10, ['advance', 'blit', 'compose', 'draw'])
+>>> metrics.reloads[('0', 'greeting')]['count']
+3
+>>> print(metrics.to_prometheus())  # doctest: +ELLIPSIS
+# HELP matrix_display_frames_total Frames rendered.
+# TYPE matrix_display_frames_total counter
+matrix_display_frames_total 10
+...
+matrix_display_reloads_total{row="0",content="greeting"} 3
+...
+>>>
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+
+DEFAULT_PORT = 9142  # serve port; 9100 is node_exporter's
+_PREFIX = 'matrix_display_'
+_HELP = {  # metric name (without prefix): help text
+    'frames_total': 'Frames rendered.',
+    'frame_seconds_total': 'Time spent in each phase of rendering frames.',
+    'frame_max_seconds': 'Longest time spent in each phase of one frame.',
+    'reloads_total': 'Content reloads of each row.',
+    'reload_errors_total': 'Content reloads of each row that failed.',
+    'reload_seconds_total': (
+        'Time spent reloading each row, loading content and rendering it.'),
+    'reload_max_seconds': 'Longest time taken by one reload of each row.',
+    'frames_late_total': 'Frames due before the previous frame finished.',
+    'frames_dropped_total': 'Frames skipped to catch up with the schedule.',
+    'canvas_bytes': 'Bytes of pixel storage used by row canvases.',
+}
+
+
+class Metrics:
+    """Records a Conveyor's frame timings and row reloads; pass it to the
+    Conveyor's metrics parameter.
+
+    Reloads may be recorded from background threads, so records are updated
+    under a lock; read them with to_prometheus or summary, or hold lock
+    while reading the attributes of a running Conveyor's metrics.
+    """
+    def __init__(self, summary_interval=None, summary_callback=print,
+                 export_path=None, export_interval=15, clock=time.monotonic):
+        """Initialise empty metrics.
+
+        Parameters
+        ----------
+        summary_interval : float
+            Optional seconds between calls to summary_callback with the
+            output of summary; defaults to None, i.e. no summaries
+        summary_callback : Callable
+            Optional function called with each periodic summary; defaults to
+            print
+        export_path : str
+            Optional file path the Prometheus text format is written to
+            every export_interval seconds; defaults to None, i.e. no file
+        export_interval : float
+            Optional seconds between writes to export_path; default 15
+        clock : Callable
+            Optional function returning the current time in seconds, used to
+            schedule summaries and exports; defaults to time.monotonic
+        """
+        self.summary_interval = summary_interval
+        self.summary_callback = summary_callback
+        self.export_path = export_path
+        self.export_interval = export_interval
+        self.clock = clock
+        self.lock = threading.Lock()  # reloads are recorded in threads
+        self.frames = 0
+        self.frame_seconds = {}  # phase: total seconds
+        self.frame_max_seconds = {}  # phase: longest time in one frame
+        self.last_frame = {}  # phase: seconds in the latest frame
+        self.reloads = {}  # (row, content name): dictionary of totals
+        self.hooks = []  # functions called as hook(phases) after each frame
+        self.collectors = []  # functions returning {metric name: value}
+        self._last_summary = self._last_export = clock()
+
+    def record_frame(self, phases):
+        """Record the timing breakdown of a frame, then call hooks and any
+        periodic summary or export that is due.
+
+        Parameters
+        ----------
+        phases : dict
+            Seconds spent in each phase of the frame, keyed by phase name
+        """
+        with self.lock:
+            self.frames += 1
+            for phase, seconds in phases.items():
+                self.frame_seconds[phase] = \
+                    self.frame_seconds.get(phase, 0.0) + seconds
+                if seconds > self.frame_max_seconds.get(phase, 0.0):
+                    self.frame_max_seconds[phase] = seconds
+            self.last_frame = phases
+
+        for hook in self.hooks:
+            hook(phases)
+
+        if self.summary_interval is None and self.export_path is None:
+            return
+        now = self.clock()
+        if self.summary_interval is not None \
+                and now - self._last_summary >= self.summary_interval:
+            self._last_summary = now
+            self.summary_callback(self.summary())
+        if self.export_path is not None \
+                and now - self._last_export >= self.export_interval:
+            self._last_export = now
+            self.write_prometheus(self.export_path)
+
+    def record_reload(self, row, content, load_seconds, render_seconds,
+                      error=None):
+        """Record a row's content reload; may be called from any thread.
+
+        Parameters
+        ----------
+        row : str
+            The row's label, e.g. its index in the Conveyor
+        content : str
+            The name of the row's content function
+        load_seconds : float
+            Time spent evaluating the content function
+        render_seconds : float
+            Time spent drawing the content on the row's canvas
+        error : Exception
+            Optional exception raised by the reload; defaults to None
+        """
+        with self.lock:
+            totals = self.reloads.get((row, content))
+            if totals is None:
+                totals = self.reloads[(row, content)] = {
+                    'count': 0, 'errors': 0, 'load_seconds': 0.0,
+                    'render_seconds': 0.0, 'max_seconds': 0.0}
+            totals['count'] += 1
+            if error is not None:
+                totals['errors'] += 1
+            totals['load_seconds'] += load_seconds
+            totals['render_seconds'] += render_seconds
+            totals['max_seconds'] = max(
+                totals['max_seconds'], load_seconds + render_seconds)
+
+    def collect(self):
+        """Return the values reported by the collector functions, e.g. late
+        frames and canvas memory from a Conveyor.
+
+        Returns
+        -------
+        values : dict
+            Metric names (without the matrix_display_ prefix) and values
+        """
+        values = {}
+        for collector in self.collectors:
+            values.update(collector())
+        return values
+
+    def summary(self):
+        """Return a short human readable summary: mean and longest frame
+        phase times, and the rows whose reloads have taken longest.
+
+        Returns
+        -------
+        text : str
+        """
+        values = self.collect()
+        with self.lock:
+            frames = self.frames
+            phases = [
+                f'{phase} {seconds / frames * 1000:.2f}/'
+                f'{self.frame_max_seconds[phase] * 1000:.2f}'
+                for phase, seconds in self.frame_seconds.items()]
+            reloads = sorted(
+                self.reloads.items(), key=lambda item: -item[1]['max_seconds'])
+            rows = [
+                f"row {row} {content} x{totals['count']} "
+                f"max {totals['max_seconds'] * 1000:.1f} ms"
+                + (f" errors {totals['errors']}" if totals['errors'] else '')
+                for (row, content), totals in reloads[:3]]
+        lines = [f"{frames} frames; mean/max ms: {', '.join(phases)}"]
+        lines.append(', '.join(
+            f'{name} {value}' for name, value in values.items()))
+        lines.extend(rows)
+        return '\n'.join(line for line in lines if line)
+
+    def to_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        text : str
+        """
+        values = self.collect()
+        samples = {}  # metric name: list of (labels, value)
+        with self.lock:
+            samples['frames_total'] = [({}, self.frames)]
+            samples['frame_seconds_total'] = [
+                ({'phase': phase}, seconds)
+                for phase, seconds in self.frame_seconds.items()]
+            samples['frame_max_seconds'] = [
+                ({'phase': phase}, seconds)
+                for phase, seconds in self.frame_max_seconds.items()]
+            for name in ('reloads_total', 'reload_errors_total',
+                         'reload_seconds_total', 'reload_max_seconds'):
+                samples[name] = []
+            for (row, content), totals in self.reloads.items():
+                labels = {'row': row, 'content': content}
+                samples['reloads_total'].append((labels, totals['count']))
+                samples['reload_errors_total'].append(
+                    (labels, totals['errors']))
+                for stage in ('load', 'render'):
+                    samples['reload_seconds_total'].append((
+                        dict(labels, stage=stage),
+                        totals[f'{stage}_seconds']))
+                samples['reload_max_seconds'].append(
+                    (labels, totals['max_seconds']))
+        for name, value in values.items():
+            samples[name] = [({}, value)]
+
+        lines = []
+        for name, metric_samples in samples.items():
+            if not metric_samples:
+                continue
+            if name in _HELP:
+                lines.append(f'# HELP {_PREFIX}{name} {_HELP[name]}')
+            lines.append(f'# TYPE {_PREFIX}{name} '
+                         + ('counter' if name.endswith('_total') else 'gauge'))
+            for labels, value in metric_samples:
+                label_text = ','.join(
+                    f'{key}="{_escape(label)}"'
+                    for key, label in labels.items())
+                lines.append(f'{_PREFIX}{name}'
+                             + (f'{{{label_text}}}' if labels else '')
+                             + f' {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Write the metrics to a file in the Prometheus text format; the
+        file is replaced in one step, so readers never see partial data.
+
+        Parameters
+        ----------
+        path : str
+            The file's path
+        """
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w') as fh:
+            fh.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+    def serve(self, address=('127.0.0.1', DEFAULT_PORT)):
+        """Serve the metrics over HTTP in the Prometheus text format from a
+        background thread; any path returns the metrics.
+
+        Parameters
+        ----------
+        address : (str, int)
+            Optional host and port to listen on; defaults to DEFAULT_PORT
+            on this host only (not port 9100, which node_exporter uses). Use
+            host '' to serve on all interfaces; port 0 picks a free port
+
+        Returns
+        -------
+        server : http.server.ThreadingHTTPServer
+            The running server; its server_address attribute holds the port
+            and its shutdown method stops it
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header(
+                    'Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # scrapes are routine; don't log each one
+
+        server = ThreadingHTTPServer(address, Handler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever, name='matrix_display_metrics',
+            daemon=True).start()
+        return server
+
+
+def _escape(label):
+    """Internal function to escape a Prometheus label value."""
+    return str(label).replace('\\', r'\\').replace('"', r'\"').replace(
+        '\n', r'\n')
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""Module defining NumpyCanvas class; requires the numpy package, which is
+not otherwise needed by matrix_display, so import this module explicitly:
+
+Examples
+--------
+>>> from matrix_display.numpy_canvas import NumpyCanvas
+>>> c = NumpyCanvas().append_text('Hi', (0, 255, 0))
+>>> c.pixels.shape
+(5, 5, 3)
+>>> print(c.to_str())
+[█ █  ]
+[█ █ █]
+[███  ]
+[█ █ █]
+[█ █ █]
+>>> NumpyCanvas()
+[]
+[]
+[]
+[]
+[]
+>>> print(NumpyCanvas().append_text('Hi').clear().to_str())
+[]
+[]
+[]
+[]
+[]
+>>>
+"""
+from matrix_display.canvas import Canvas
+from matrix_display.packed_canvas import PackedCanvas, _RowsView
+import matrix_display.compiled_font as compiled_font
+import matrix_display.rgb_colours as rgb_colours
+import numpy
+
+
+class NumpyCanvas(Canvas):
+    """A Canvas that stores its pixels in a (height, width, 3) uint8 NumPy
+    array; content is appended and transformed with array operations, which
+    suits large canvases. Output is identical to Canvas for the same calls.
+
+    Each row reserves room for more columns than are in use so appending
+    content rarely needs to copy the array; unused columns are always black.
+    The pixels attribute is a (height, width, 3) view of the canvas that can
+    be sliced and assigned; the rows attribute remains available as a
+    read/write view of (r, g, b) tuples for code written against Canvas.
+    """
+    def __init__(
+            self,
+            lpad_count=0,
+            row_count=None,
+            pad_colour=rgb_colours.black,
+            charset=None
+    ):
+        """Initialise the canvas; parameters are as for Canvas.
+
+        Parameters
+        ----------
+        lpad_count : int
+            Optional number of empty columns to left-pad the canvas with
+        row_count : int
+            Optional number of rows; defaults to the charset height
+        pad_colour : (int, int, int)
+            Optional pad colour; defaults to rgb_colours.black, i.e. (0, 0, 0)
+        charset : dict
+            Optional dictionary of character shapes used to print text to the
+            canvas; defaults to the compiled font_5 font
+        """
+        self.charset = (compiled_font.load_font_5() if charset is None
+                        else charset)
+        row_count = (compiled_font.charset_height(self.charset)
+                     if row_count is None else row_count)
+        self._width = 0
+        self._array = numpy.zeros(
+            (row_count, max(lpad_count, 16), 3), dtype=numpy.uint8)
+        if lpad_count > 0:
+            self._reserve(lpad_count)
+            self._array[:, :lpad_count] = pad_colour
+            self._width = lpad_count
+
+        self.append_space = 0  # first character will have no preceding space
+
+    @property
+    def rows(self):
+        """A list-like view of the canvas rows; each row is a list-like view
+        of (r, g, b) tuples that can be read and assigned."""
+        return _RowsView(self)
+
+    @property
+    def pixels(self):
+        """A (height, width, 3) uint8 NumPy view of the canvas pixels."""
+        return self._array[:, :self._width]
+
+    def height(self):
+        """Return the current pixel height of the canvas.
+
+        Returns
+        -------
+        height : int
+        """
+        return self._array.shape[0]
+
+    def width(self):
+        """Return the current pixel width of the canvas.
+
+        Returns
+        -------
+        width : int
+        """
+        return self._width if self.height() > 0 else 0
+
+    def nbytes(self):
+        """Return the number of bytes of pixel storage, including room
+        reserved for more columns; see Canvas.nbytes.
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return self._array.nbytes
+
+    def row_bytes(self, y):
+        """Return a memoryview of a row's packed RGB bytes (no copy).
+
+        Parameters
+        ----------
+        y : int
+            The row index
+
+        Returns
+        -------
+        row : memoryview
+            3 * width() bytes of packed (r, g, b) values
+        """
+        return self._row_view(y, 0, self._width)
+
+    def _row_view(self, y, start, end):
+        """Internal method returning a memoryview of the packed RGB bytes of
+        columns start to end of row y; rows are cast via a flat view, so
+        empty ranges give an empty view."""
+        return memoryview(self._array[y].ravel()[start * 3:end * 3])
+
+    def reserve(self, width):
+        """Enlarge each row's column capacity to at least width columns, so
+        content up to that width (and viewports up to that edge) need no
+        further copying of the pixels.
+
+        Parameters
+        ----------
+        width : int
+            The number of columns to make room for
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        self._reserve(width)
+        return self
+
+    def viewport(self, x, width, y=0, height=None):
+        """Return views of a rectangular window onto the canvas; see
+        Canvas.viewport. No pixels are copied: the window is padded past the
+        canvas's right edge using the black columns reserved at the end of
+        each row. The canvas is never changed, so earlier views stay valid;
+        only if the window reaches past the reserved columns are its rows
+        copied, with black padding.
+
+        Parameters
+        ----------
+        x : int
+            The first canvas column of the window
+        width : int
+            The number of columns in the window
+        y : int
+            Optional first canvas row of the window; defaults to 0
+        height : int
+            Optional number of rows in the window; defaults to all rows from
+            y to the bottom of the canvas
+
+        Returns
+        -------
+        rows : list of memoryview
+            3 * width bytes of packed (r, g, b) values for each window row
+        """
+        height = self.height() - y if height is None else height
+        shown = max(0, min(width, self._array.shape[1] - x))  # in storage
+        pad = bytes((width - shown) * 3)  # black past the reserved columns
+        rows = []
+        for row_ctr in range(y, y + height):
+            row = self._row_view(row_ctr, x, x + shown)
+            rows.append(memoryview(bytes(row) + pad) if pad else row)
+        return rows
+
+    def append_canvas(self, canvas, lpad_count=None,
+                      pad_colour=rgb_colours.black):
+        """Append canvas to this canvas; see Canvas.append_canvas.
+
+        Parameters
+        ----------
+        canvas : Canvas
+            The canvas to append
+        lpad_count : int
+            Optional custom padding amount between the canvases; default value
+            of None lets target canvas decide
+        pad_colour : (int, int, int)
+            Optional pad colour; defaults to rgb_colours.black, i.e. (0, 0, 0)
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        if canvas.height() > self.height():
+            raise ValueError((
+                f"Can't append canvas with row count \"{canvas.height()}\" "
+                f"to canvas with row count \"{self.height()}\""
+            ))
+
+        lpad_count = self.append_space if lpad_count is None else lpad_count
+        if lpad_count > 0:
+            self._reserve(self._width + lpad_count)
+            self._array[:, self._width:self._width + lpad_count] = pad_colour
+            self._width += lpad_count
+
+        if isinstance(canvas, NumpyCanvas):
+            block = canvas.pixels
+        elif isinstance(canvas, PackedCanvas):
+            pixels = b''.join(
+                [canvas.row_bytes(y) for y in range(canvas.height())])
+            block = numpy.frombuffer(pixels, dtype=numpy.uint8).reshape(
+                canvas.height(), canvas.width(), 3)
+        else:
+            block = numpy.array(
+                [list(row) for row in canvas.rows], dtype=numpy.uint8
+            ).reshape(canvas.height(), canvas.width(), 3)
+        self._append_block(block)
+
+        self.append_space = 1  # Precede all subsequent content with a space
+        return self
+
+    def append_text(self, text, rgb=(255, 255, 255), unknown_char='█'):
+        """Append text using the specified RGB colour; see Canvas.append_text.
+
+        Parameters
+        ----------
+        text : str
+            The text to append to the canvas
+        rgb : (int, int, int)
+            Optional RGB colour tuple, defaults to white, i.e. (255, 255, 255)
+        unknown_char : str
+            Character printed instead of characters missing from the charset
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        if len(text) == 0:
+            return self
+
+        rgb = tuple(rgb)
+        block = numpy.concatenate([
+            self.glyph_cache.lookup(
+                self.charset, (c, unknown_char, rgb, 'numpy'),
+                self._glyph_strips, c, rgb, unknown_char)
+            for c in text
+        ], axis=1)
+        if self.append_space == 0:  # no leading space at canvas start
+            block = block[:, 1:]
+        self._append_block(block[:self.height()])
+
+        # Precede all subsequent content with a space
+        self.append_space = 1
+        return self
+
+    def draw_text(self, x, text, rgb=(255, 255, 255), unknown_char='█'):
+        """Draw text over the canvas's existing columns, starting at column
+        x; see Canvas.draw_text.
+
+        Parameters
+        ----------
+        x : int
+            The canvas column of the text's first pixel
+        text : str
+            The text to draw
+        rgb : (int, int, int)
+            Optional RGB colour tuple, defaults to white, i.e. (255, 255, 255)
+        unknown_char : str
+            Character printed instead of characters missing from the charset
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        self._check_draw(x, text, unknown_char)
+        if len(text) == 0:
+            return self
+
+        rgb = tuple(rgb)
+        block = numpy.concatenate([
+            self.glyph_cache.lookup(
+                self.charset, (c, unknown_char, rgb, 'numpy'),
+                self._glyph_strips, c, rgb, unknown_char)
+            for c in text
+        ], axis=1)[:self.height(), 1:]
+        self._array[:block.shape[0], x:x + block.shape[1]] = block
+        return self
+
+    def _glyph_strips(self, c, rgb, unknown_char):
+        """Internal method to render a character for the glyph cache.
+
+        Parameters
+        ----------
+        c : str
+            The character to render
+        rgb : (int, int, int)
+            The character's colour
+        unknown_char : str
+            Character to render if c is not in the charset
+
+        Returns
+        -------
+        strips : numpy.ndarray
+            (character height, character width + 1, 3) uint8 array; the first
+            column is blank
+        """
+        c_map = numpy.array(self._char_map(c, unknown_char), dtype=bool)
+        strips = numpy.zeros(
+            (c_map.shape[0], c_map.shape[1] + 1, 3), dtype=numpy.uint8)
+        strips[:, 1:][c_map] = rgb
+        strips.flags.writeable = False  # shared by all users of the cache
+        return strips
+
+    def clear(self):
+        """Remove all columns from the canvas, keeping its rows and storage;
+        see Canvas.clear.
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        self._array[:, :self._width] = 0
+        self._width = 0
+        self.append_space = 0  # first character will have no preceding space
+        return self
+
+    def add_rows(self, count=1, pad_colour=rgb_colours.black):
+        """Adds rows to the canvas.
+
+        Parameters
+        ----------
+        count : int
+            Optional number of rows to add; defaults to 1
+        pad_colour : (int, int, int)
+            Optional colour to use for new row; defaults to black
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        rows = numpy.zeros(
+            (count, self._array.shape[1], 3), dtype=numpy.uint8)
+        rows[:, :self._width] = pad_colour
+        self._array = numpy.concatenate([self._array, rows])
+        return self
+
+    def delete_rows(self, count=1):
+        """Delete rows from the canvas.
+
+        Parameters
+        ----------
+        count : int
+            Optional number of rows to delete; defaults to 1
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        if count > self.height():
+            raise ValueError((
+                f"Delete failed; delete count \"{count}\" exceeds canvas "
+                f"row count \"{self.height()}\""))
+
+        self._array = self._array[:self.height() - count].copy()
+        return self
+
+    def brightness(self, factor):
+        """Scale the red, green and blue values of every pixel; see
+        Canvas.brightness.
+
+        Parameters
+        ----------
+        factor : float
+            Multiplier for each colour component; results are truncated to
+            int and capped at 255
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        pixels = self.pixels
+        pixels[...] = numpy.minimum(pixels * float(factor), 255)
+        return self
+
+    def replace_colour(self, old_rgb, new_rgb):
+        """Change every pixel of one colour to another; see
+        Canvas.replace_colour.
+
+        Parameters
+        ----------
+        old_rgb : (int, int, int)
+            The colour to replace
+        new_rgb : (int, int, int)
+            The replacement colour
+
+        Returns
+        -------
+        self : NumpyCanvas
+        """
+        pixels = self.pixels
+        pixels[(pixels == old_rgb).all(axis=2)] = new_rgb
+        return self
+
+    def _reserve(self, width):
+        """Internal method to ensure each row has room for width columns."""
+        if width <= self._array.shape[1]:
+            return
+
+        array = numpy.zeros(
+            (self.height(), max(width, self._array.shape[1] * 2), 3),
+            dtype=numpy.uint8)
+        array[:, :self._width] = self.pixels
+        self._array = array
+
+    def _append_pixels(self, width, pixels):
+        """Internal method to append width columns of packed RGB pixels, row
+        by row; see Canvas._append_pixels."""
+        self._append_block(numpy.frombuffer(pixels, dtype=numpy.uint8)
+                           .reshape(self.height(), width, 3))
+
+    def _append_block(self, block):
+        """Internal method to append a (rows, columns, 3) block of pixels;
+        rows below the block are left black."""
+        count = block.shape[1]
+        self._reserve(self._width + count)
+        self._array[:block.shape[0], self._width:self._width + count] = block
+        self._width += count
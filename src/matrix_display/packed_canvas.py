@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""Module defining PackedCanvas class."""
+from matrix_display.canvas import Canvas
+import matrix_display.compiled_font as compiled_font
+import matrix_display.rgb_colours as rgb_colours
+
+
+class PackedCanvas(Canvas):
+    """A Canvas that stores its pixels in one contiguous bytearray instead of
+    a list of lists of RGB tuples.
+
+    Pixels are stored row-major using 3 bytes (red, green, blue) per pixel.
+    Each row reserves room for more columns than are in use so appending
+    content rarely needs to move existing pixels; unused columns are always
+    black. The rows attribute remains available as a read/write view of the
+    pixels for code written against Canvas.
+
+    Examples
+    --------
+    >>> from matrix_display import PackedCanvas
+    >>> c = PackedCanvas().append_text('Hi', (255, 0, 0))
+    >>> print(c.to_str())
+    [█ █  ]
+    [█ █ █]
+    [███  ]
+    [█ █ █]
+    [█ █ █]
+    >>> c.rows[0][0]
+    (255, 0, 0)
+    >>> c.rows[0][1] = (0, 255, 0)
+    >>> c.rows[0][:3]
+    [(255, 0, 0), (0, 255, 0), (255, 0, 0)]
+    >>> PackedCanvas(1).rows
+    [[(0, 0, 0)], [(0, 0, 0)], [(0, 0, 0)], [(0, 0, 0)], [(0, 0, 0)]]
+    >>>
+    """
+    def __init__(
+            self,
+            lpad_count=0,
+            row_count=None,
+            pad_colour=rgb_colours.black,
+            charset=None
+    ):
+        """Initialise the canvas; parameters are as for Canvas.
+
+        Parameters
+        ----------
+        lpad_count : int
+            Optional number of empty columns to left-pad the canvas with
+        row_count : int
+            Optional number of rows; defaults to the charset height
+        pad_colour : (int, int, int)
+            Optional pad colour; defaults to rgb_colours.black, i.e. (0, 0, 0)
+        charset : dict
+            Optional dictionary of character shapes used to print text to the
+            canvas; defaults to the compiled font_5 font
+        """
+        self.charset = (compiled_font.load_font_5() if charset is None
+                        else charset)
+        row_count = (compiled_font.charset_height(self.charset)
+                     if row_count is None else row_count)
+        self._row_count = row_count
+        self._width = 0
+        self._stride = max(lpad_count, 16)  # column capacity of each row
+        self._pixels = bytearray(row_count * self._stride * 3)
+        if lpad_count > 0:
+            self._append_pad(lpad_count, pad_colour)
+
+        self.append_space = 0  # first character will have no preceding space
+
+    @property
+    def rows(self):
+        """A list-like view of the canvas rows; each row is a list-like view
+        of (r, g, b) tuples that can be read and assigned."""
+        return _RowsView(self)
+
+    def height(self):
+        """Return the current pixel height of the canvas.
+
+        Returns
+        -------
+        height : int
+        """
+        return self._row_count
+
+    def width(self):
+        """Return the current pixel width of the canvas.
+
+        Returns
+        -------
+        width : int
+        """
+        return self._width if self._row_count > 0 else 0
+
+    def nbytes(self):
+        """Return the number of bytes of pixel storage, including room
+        reserved for more columns; see Canvas.nbytes.
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return len(self._pixels)
+
+    def row_bytes(self, y):
+        """Return a memoryview of a row's packed RGB bytes (no copy).
+
+        Parameters
+        ----------
+        y : int
+            The row index
+
+        Returns
+        -------
+        row : memoryview
+            3 * width() bytes of packed (r, g, b) values
+        """
+        start = y * self._stride * 3
+        return memoryview(self._pixels)[start:start + self._width * 3]
+
+    def reserve(self, width):
+        """Enlarge each row's column capacity to at least width columns, so
+        content up to that width (and viewports up to that edge) need no
+        further copying of the pixels.
+
+        Parameters
+        ----------
+        width : int
+            The number of columns to make room for
+
+        Returns
+        -------
+        self : PackedCanvas
+        """
+        self._reserve(width)
+        return self
+
+    def viewport(self, x, width, y=0, height=None):
+        """Return views of a rectangular window onto the canvas; see
+        Canvas.viewport. No pixels are copied: the window is padded past the
+        canvas's right edge using the black columns reserved at the end of
+        each row. The canvas is never changed, so earlier views stay valid;
+        only if the window reaches past the reserved columns are its rows
+        copied, with black padding.
+
+        Parameters
+        ----------
+        x : int
+            The first canvas column of the window
+        width : int
+            The number of columns in the window
+        y : int
+            Optional first canvas row of the window; defaults to 0
+        height : int
+            Optional number of rows in the window; defaults to all rows from
+            y to the bottom of the canvas
+
+        Returns
+        -------
+        rows : list of memoryview
+            3 * width bytes of packed (r, g, b) values for each window row
+
+        Examples
+        --------
+        >>> from matrix_display import PackedCanvas
+        >>> c = PackedCanvas(2, 2, (0, 0, 255))
+        >>> [list(row) for row in c.viewport(1, 2, 1)]
+        [[0, 0, 255, 0, 0, 0]]
+        >>> [list(row) for row in c.viewport(1, 40, 1)][0][:6]
+        [0, 0, 255, 0, 0, 0]
+        >>> c.viewport(1, 40)[0].nbytes, c.width()
+        (120, 2)
+        >>>
+        """
+        height = self._row_count - y if height is None else height
+        shown = max(0, min(width, self._stride - x))  # columns in storage
+        pad = bytes((width - shown) * 3)  # black past the reserved columns
+        pixels = memoryview(self._pixels)
+        rows = []
+        for row_ctr in range(y, y + height):
+            start = (row_ctr * self._stride + x) * 3
+            row = pixels[start:start + shown * 3]
+            rows.append(memoryview(bytes(row) + pad) if pad else row)
+        return rows
+
+    def append_canvas(self, canvas, lpad_count=None,
+                      pad_colour=rgb_colours.black):
+        """Append canvas to this canvas; see Canvas.append_canvas.
+
+        Parameters
+        ----------
+        canvas : Canvas
+            The canvas to append
+        lpad_count : int
+            Optional custom padding amount between the canvases; default value
+            of None lets target canvas decide
+        pad_colour : (int, int, int)
+            Optional pad colour; defaults to rgb_colours.black, i.e. (0, 0, 0)
+
+        Returns
+        -------
+        self : PackedCanvas
+
+        Examples
+        --------
+        >>> from matrix_display import Canvas, PackedCanvas
+        >>> c1 = Canvas().append_text('c1')
+        >>> c2 = PackedCanvas().append_text('c2', (0, 255, 255))
+        >>> print(PackedCanvas().append_canvas(c1).append_canvas(c2).to_str())
+        [    █     ███]
+        [    █       █]
+        [███ █ ███ ███]
+        [█   █ █   █  ]
+        [███ █ ███ ███]
+        >>>
+        """
+        if canvas.height() > self._row_count:
+            raise ValueError((
+                f"Can't append canvas with row count \"{canvas.height()}\" "
+                f"to canvas with row count \"{self._row_count}\""
+            ))
+
+        lpad_count = self.append_space if lpad_count is None else lpad_count
+        if lpad_count > 0:
+            self._append_pad(lpad_count, pad_colour)
+
+        strips = []
+        if hasattr(canvas, 'row_bytes'):  # packed pixels, no conversion
+            for y in range(canvas.height()):
+                strips.append(canvas.row_bytes(y))
+        else:
+            for row in canvas.rows:
+                strips.append(bytes([c for pixel in row for c in pixel]))
+        self._append_strips(strips, canvas.width())
+
+        self.append_space = 1  # Precede all subsequent content with a space
+        return self
+
+    def append_text(self, text, rgb=(255, 255, 255), unknown_char='█'):
+        """Append text using the specified RGB colour; see Canvas.append_text.
+
+        Parameters
+        ----------
+        text : str
+            The text to append to the canvas
+        rgb : (int, int, int)
+            Optional RGB colour tuple, defaults to white, i.e. (255, 255, 255)
+        unknown_char : str
+            Character printed instead of characters missing from the charset
+
+        Returns
+        -------
+        self : PackedCanvas
+
+        Examples
+        --------
+        >>> from matrix_display import PackedCanvas
+        >>> print(PackedCanvas().append_text('abc¶d').to_str())
+        [██  █       █████   █]
+        [  █ █       █████   █]
+        [ ██ ███ ███ █████ ███]
+        [█ █ █ █ █   █████ █ █]
+        [ ██ ███ ███ █████ ███]
+        >>>
+        """
+        if len(text) == 0:
+            return self
+
+        rgb = tuple(rgb)
+        glyphs = [
+            self.glyph_cache.lookup(
+                self.charset, (c, unknown_char, rgb, 'packed'),
+                self._glyph_strips, c, rgb, unknown_char)
+            for c in text
+        ]
+
+        # Join each row's characters, then append all columns at once
+        strips = [b''.join(row_strips) for row_strips in zip(*glyphs)]
+        count = len(strips[0]) // 3
+        if self.append_space == 0:  # no leading space at canvas start
+            strips = [memoryview(strip)[3:] for strip in strips]
+            count -= 1
+        self._append_strips(strips, count)
+
+        # Precede all subsequent content with a space
+        self.append_space = 1
+        return self
+
+    def draw_text(self, x, text, rgb=(255, 255, 255), unknown_char='█'):
+        """Draw text over the canvas's existing columns, starting at column
+        x; see Canvas.draw_text.
+
+        Parameters
+        ----------
+        x : int
+            The canvas column of the text's first pixel
+        text : str
+            The text to draw
+        rgb : (int, int, int)
+            Optional RGB colour tuple, defaults to white, i.e. (255, 255, 255)
+        unknown_char : str
+            Character printed instead of characters missing from the charset
+
+        Returns
+        -------
+        self : PackedCanvas
+        """
+        self._check_draw(x, text, unknown_char)
+        rgb = tuple(rgb)
+        stride = self._stride * 3
+        start = 3  # the first character's blank column is not drawn
+        for c in text:
+            strips = self.glyph_cache.lookup(
+                self.charset, (c, unknown_char, rgb, 'packed'),
+                self._glyph_strips, c, rgb, unknown_char)
+            size = len(strips[0]) - start
+            for y, strip in zip(range(self._row_count), strips):
+                offset = y * stride + x * 3
+                self._pixels[offset:offset + size] = \
+                    memoryview(strip)[start:]
+            x += size // 3
+            start = 0
+        return self
+
+    def _glyph_strips(self, c, rgb, unknown_char):
+        """Internal method to render a character for the glyph cache.
+
+        Parameters
+        ----------
+        c : str
+            The character to render
+        rgb : (int, int, int)
+            The character's colour
+        unknown_char : str
+            Character to render if c is not in the charset
+
+        Returns
+        -------
+        strips : tuple of bytes
+            Packed RGB bytes for each character row, each starting with a
+            blank column
+        """
+        c_map = self._char_map(c, unknown_char)
+        on = bytes(rgb)
+        off = bytes(rgb_colours.black)
+        return tuple(
+            off + b''.join([on if v else off for v in c_map_row])
+            for c_map_row in c_map)
+
+    def clear(self):
+        """Remove all columns from the canvas, keeping its rows and storage;
+        see Canvas.clear.
+
+        Returns
+        -------
+        self : PackedCanvas
+        """
+        used = self._width * 3
+        blank = bytes(used)
+        for y in range(self._row_count):
+            start = y * self._stride * 3
+            self._pixels[start:start + used] = blank
+        self._width = 0
+        self.append_space = 0  # first character will have no preceding space
+        return self
+
+    def add_rows(self, count=1, pad_colour=rgb_colours.black):
+        """Adds rows to the canvas.
+
+        Parameters
+        ----------
+        count : int
+            Optional number of rows to add; defaults to 1
+        pad_colour : (int, int, int)
+            Optional colour to use for new row; defaults to black
+
+        Returns
+        -------
+        self : PackedCanvas
+        """
+        row = bytes(pad_colour) * self._width
+        row += bytes((self._stride - self._width) * 3)
+        # New bytearray rather than resizing, in case row views are in use
+        self._pixels = self._pixels + row * count
+        self._row_count += count
+        return self
+
+    def delete_rows(self, count=1):
+        """Delete rows from the canvas.
+
+        Parameters
+        ----------
+        count : int
+            Optional number of rows to delete; defaults to 1
+
+        Returns
+        -------
+        self : PackedCanvas
+        """
+        if count > self._row_count:
+            raise ValueError((
+                f"Delete failed; delete count \"{count}\" exceeds canvas "
+                f"row count \"{self._row_count}\""))
+
+        self._row_count -= count
+        self._pixels = self._pixels[:self._row_count * self._stride * 3]
+        return self
+
+    def brightness(self, factor):
+        """Scale the red, green and blue values of every pixel; see
+        Canvas.brightness.
+
+        Parameters
+        ----------
+        factor : float
+            Multiplier for each colour component; results are truncated to
+            int and capped at 255
+
+        Returns
+        -------
+        self : PackedCanvas
+        """
+        table = bytes([min(255, int(c * factor)) for c in range(256)])
+        self._pixels[:] = self._pixels.translate(table)
+        return self
+
+    def replace_colour(self, old_rgb, new_rgb):
+        """Change every pixel of one colour to another; see
+        Canvas.replace_colour.
+
+        Parameters
+        ----------
+        old_rgb : (int, int, int)
+            The colour to replace
+        new_rgb : (int, int, int)
+            The replacement colour
+
+        Returns
+        -------
+        self : PackedCanvas
+        """
+        old_bytes = bytes(old_rgb)
+        new_bytes = bytes(new_rgb)
+        for y in range(self._row_count):
+            row = self.row_bytes(y)
+            data = bytes(row)
+            i = data.find(old_bytes)
+            while i != -1:
+                if i % 3 == 0:  # ignore matches spanning 2 pixels
+                    row[i:i + 3] = new_bytes
+                i = data.find(old_bytes, i + (3 if i % 3 == 0 else 1))
+        return self
+
+    def _reserve(self, width):
+        """Internal method to ensure each row has room for width columns."""
+        if width <= self._stride:
+            return
+
+        stride = max(width, self._stride * 2)
+        pixels = bytearray(self._row_count * stride * 3)
+        used = self._width * 3
+        for y in range(self._row_count):
+            src = y * self._stride * 3
+            dst = y * stride * 3
+            pixels[dst:dst + used] = self._pixels[src:src + used]
+        self._pixels = pixels
+        self._stride = stride
+
+    def _append_strips(self, strips, count):
+        """Internal method to append count columns; strips holds the packed
+        RGB bytes to append to each row, starting with the top row."""
+        self._reserve(self._width + count)
+        stride = self._stride * 3
+        start = self._width * 3
+        for y, strip in zip(range(self._row_count), strips):
+            offset = y * stride + start
+            self._pixels[offset:offset + count * 3] = strip
+        self._width += count
+
+    def _append_pixels(self, width, pixels):
+        """Internal method to append width columns of packed RGB pixels, row
+        by row; see Canvas._append_pixels."""
+        row_size = width * 3
+        self._append_strips([
+            pixels[y * row_size:(y + 1) * row_size]
+            for y in range(self._row_count)], width)
+
+    def _append_pad(self, count, pad_colour):
+        """Internal method to append count columns of pad_colour."""
+        pad = bytes(pad_colour) * count
+        self._append_strips([pad] * self._row_count, count)
+
+
+class _RowsView:
+    """List-like view of the rows of a canvas that provides row_bytes."""
+    def __init__(self, canvas):
+        self._canvas = canvas
+
+    def __len__(self):
+        return self._canvas.height()
+
+    def __getitem__(self, y):
+        if isinstance(y, slice):
+            return [self[i] for i in range(*y.indices(len(self)))]
+        if y < 0:
+            y += len(self)
+        if not 0 <= y < len(self):
+            raise IndexError('row index out of range')
+        return _RowView(self._canvas, y)
+
+    def __iter__(self):
+        for y in range(len(self)):
+            yield _RowView(self._canvas, y)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
+
+class _RowView:
+    """List-like view of one canvas row as (r, g, b) tuples; reads and
+    writes go through the canvas's writable row_bytes memoryview."""
+    def __init__(self, canvas, y):
+        self._canvas = canvas
+        self._y = y
+
+    def __len__(self):
+        return self._canvas.width()
+
+    def _offset(self, x):
+        if x < 0:
+            x += len(self)
+        if not 0 <= x < len(self):
+            raise IndexError('column index out of range')
+        return x * 3
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            start, stop, step = x.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            data = bytes(self._canvas.row_bytes(self._y)[start * 3:stop * 3])
+            return list(zip(data[0::3], data[1::3], data[2::3]))
+        offset = self._offset(x)
+        return tuple(self._canvas.row_bytes(self._y)[offset:offset + 3])
+
+    def __setitem__(self, x, rgb):
+        offset = self._offset(x)
+        self._canvas.row_bytes(self._y)[offset:offset + 3] = bytes(rgb)
+
+    def __iter__(self):
+        data = bytes(self._canvas.row_bytes(self._y))
+        return zip(data[0::3], data[1::3], data[2::3])
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
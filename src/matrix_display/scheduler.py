@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Module defining FrameScheduler class."""
+import time
+
+
+class FrameScheduler:
+    """Paces frames against deadlines on a monotonic clock.
+
+    Deadlines are fixed multiples of the frame period from the start time,
+    so time spent rendering a frame is taken off the following sleep rather
+    than added to it, and small delays do not accumulate as drift. If
+    rendering falls behind, frames are either rendered back to back until
+    the schedule is caught up or, with drop_frames, skipped so that content
+    keeps moving at the intended speed.
+
+    Examples
+    --------
+    >>> from matrix_display.scheduler import FrameScheduler
+    >>> now = [0.0]
+    >>> def clock():
+    ...     return now[0]
+    ...
+    >>> def sleep(seconds):
+    ...     now[0] += seconds
+    ...
+    >>> scheduler = FrameScheduler(0.1, True, clock=clock, sleep=sleep)
+    >>> scheduler.start()
+    >>> now[0] += 0.04  # render time
+    >>> elapsed, steps = scheduler.wait()
+    >>> round(elapsed, 3), steps
+    (0.1, 1)
+    >>> now[0] += 0.35  # a slow frame; 2 frames dropped to keep up
+    >>> elapsed, steps = scheduler.wait()
+    >>> round(elapsed, 3), steps, scheduler.late, scheduler.dropped
+    (0.35, 3, 1, 2)
+    >>> now[0] += 0.01
+    >>> elapsed, steps = scheduler.wait()
+    >>> round(now[0], 3), round(elapsed, 3), steps
+    (0.5, 0.05, 1)
+    >>>
+    """
+    def __init__(self, period, drop_frames=False, clock=time.monotonic,
+                 sleep=time.sleep):
+        """Initialise the scheduler; call start before the first frame.
+
+        Parameters
+        ----------
+        period : float
+            Time in seconds between the start of each frame
+        drop_frames : bool
+            Optional; if True, frames that are already overdue when wait is
+            called are skipped; defaults to False
+        clock : Callable
+            Optional function returning the current time in seconds;
+            defaults to time.monotonic
+        sleep : Callable
+            Optional function to sleep for a number of seconds; defaults to
+            time.sleep
+        """
+        self.period = period
+        self.drop_frames = drop_frames
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline = None  # time the next frame is due
+        self.last_time = None  # time the last wait (or start) returned
+        self.late = 0  # frames that were due before the last one finished
+        self.dropped = 0  # frames skipped to catch up
+
+    def start(self):
+        """Start the schedule; the next frame is due one period from now."""
+        self.last_time = self.clock()
+        self.deadline = self.last_time + self.period
+
+    def wait(self):
+        """Sleep until the next frame is due.
+
+        Returns
+        -------
+        elapsed : float
+            Seconds since the previous call (or start) returned
+        steps : int
+            Number of frame periods to advance content by; more than 1 if
+            frames were dropped
+        """
+        delay = self._time_to_deadline()
+        if delay > 0:
+            self.sleep(delay)
+        return self._next_frame(delay <= 0)
+
+    async def wait_async(self):
+        """Wait, without blocking the event loop, until the next frame is
+        due; see wait.
+
+        Returns
+        -------
+        elapsed : float
+            Seconds since the previous call (or start) returned
+        steps : int
+            Number of frame periods to advance content by; more than 1 if
+            frames were dropped
+        """
+        import asyncio  # only needed here; slow to import
+        delay = self._time_to_deadline()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._next_frame(delay <= 0)
+
+    def _time_to_deadline(self):
+        """Internal method returning seconds until the next frame is due."""
+        if self.deadline is None:
+            self.start()
+        return self.deadline - self.clock()
+
+    def _next_frame(self, late):
+        """Internal method to move on to the next frame's deadline.
+
+        Parameters
+        ----------
+        late : bool
+            True if the frame was already due when waiting started
+        """
+        steps = 1
+        now = self.clock()
+        if late:
+            self.late += 1
+            if self.drop_frames and self.period > 0:
+                missed = int((now - self.deadline) // self.period)
+                self.deadline += missed * self.period
+                self.dropped += missed
+                steps += missed
+
+        self.deadline += self.period
+        elapsed = now - self.last_time
+        self.last_time = now
+        return elapsed, steps
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Module to pass canvas pixels between processes in shared memory, so a
+canvas drawn in a worker process (see Conveyor.add_process_row) reaches the
+display process as one block of packed RGB bytes instead of being pickled.
+
+The worker process creates a shared memory block holding the canvas's
+pixels and returns its name; the display process copies the pixels out and
+frees the block. Each block is owned by the process that frees it.
+
+Examples
+--------
+>>> from matrix_display import PackedCanvas
+>>> from matrix_display.shared_pixels import share_canvas, take_pixels
+>>> canvas = PackedCanvas().append_text('Hi', (255, 0, 0))
+>>> name, width, height = share_canvas(canvas)
+>>> width, height
+(5, 5)
+>>> take_pixels(name, width, height)[:6]
+b'\\xff\\x00\\x00\\x00\\x00\\x00'
+>>>
+"""
+from multiprocessing import resource_tracker, shared_memory
+import os
+
+
+def share_canvas(canvas):
+    """Copy a canvas's pixels to a new shared memory block; the caller hands
+    the block to another process, which must free it with take_pixels.
+
+    Parameters
+    ----------
+    canvas : Canvas
+        The canvas to share; any Canvas class
+
+    Returns
+    -------
+    name : str
+        The shared memory block's name
+    width : int
+        The canvas width
+    height : int
+        The canvas height
+    """
+    width, height = canvas.width(), canvas.height()
+    row_size = width * 3
+    block = shared_memory.SharedMemory(
+        create=True, size=max(row_size * height, 1))
+    try:
+        buffer = block.buf
+        if hasattr(canvas, 'row_bytes'):  # packed pixels, no conversion
+            for y in range(height):
+                buffer[y * row_size:(y + 1) * row_size] = canvas.row_bytes(y)
+        else:
+            for y, row in enumerate(canvas.rows):  # short rows: black
+                buffer[y * row_size:(y + 1) * row_size] = bytes(
+                    [c for pixel in row for c in pixel]).ljust(row_size, b'\0')
+        del buffer  # release the view so the block can be closed
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    block.close()
+    if os.name == 'posix':  # only POSIX blocks are tracked, by '/' + name
+        # The receiving process frees the block, so this process must not
+        resource_tracker.unregister('/' + block.name, 'shared_memory')
+    return block.name, width, height
+
+
+def take_pixels(name, width, height):
+    """Copy the pixels out of a shared memory block created by share_canvas,
+    and free it.
+
+    Parameters
+    ----------
+    name : str
+        The shared memory block's name
+    width : int
+        The canvas width
+    height : int
+        The canvas height
+
+    Returns
+    -------
+    pixels : bytes
+        Packed RGB pixels, row by row
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf[:width * height * 3] as view:
+            return bytes(view)
+    finally:
+        block.close()
+        block.unlink()
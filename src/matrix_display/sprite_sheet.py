@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Module defining SpriteSheet class."""
+from matrix_display.image import load_image, scale_image
+from matrix_display.packed_canvas import PackedCanvas
+
+
+class SpriteSheet:
+    """The frames of a sprite sheet image as canvases: frames of equal size
+    laid out left to right, then top to bottom.
+
+    The image is decoded once, when the sprite sheet is created, and each
+    frame's canvas is created the first time it is needed, then cached; so
+    animation frames and logos are not decoded again each time a row
+    reloads. Cached canvases are shared, so should not be changed; use
+    append_canvas to copy a frame into another canvas.
+
+    Examples
+    --------
+    >>> import itertools
+    >>> from matrix_display import SpriteSheet
+    >>> ppm = b'P6 4 2 255 ' + bytes([255, 0, 0] * 4 + [0, 0, 255] * 4)
+    >>> sheet = SpriteSheet(ppm, 2, 1)
+    >>> len(sheet)
+    4
+    >>> sheet[2].rows
+    [[(0, 0, 255), (0, 0, 255)]]
+    >>> sheet[0] is sheet[0]
+    True
+    >>> frames = itertools.cycle(sheet)  # e.g. for Conveyor.add_row
+    >>> [next(frames).rows[0][0] for __ in range(5)]
+    [(255, 0, 0), (255, 0, 0), (0, 0, 255), (0, 0, 255), (255, 0, 0)]
+    >>>
+    """
+    def __init__(self, image, frame_width, frame_height=None, count=None,
+                 width=None, height=None, method='box',
+                 canvas_class=PackedCanvas, charset=None):
+        """Decode a sprite sheet image.
+
+        Parameters
+        ----------
+        image : str or bytes-like
+            The image file's path, or its contents; a PPM, PGM or PNG file,
+            see matrix_display.image
+        frame_width : int
+            The width of each frame in the image
+        frame_height : int
+            Optional height of each frame in the image; defaults to the
+            image's height, i.e. one row of frames
+        count : int
+            Optional number of frames; defaults to every whole frame in the
+            image
+        width : int
+            Optional width to scale each frame to; see Canvas.from_image
+        height : int
+            Optional height to scale each frame to; see Canvas.from_image
+        method : str
+            Optional scaling method, 'box' (default) or 'nearest'
+        canvas_class : type
+            Optional class of the frame canvases; defaults to
+            matrix_display.PackedCanvas
+        charset : dict
+            Optional charset of the frame canvases; see Canvas
+        """
+        self._image_width, self._image_height, self._pixels = \
+            load_image(image)
+        if frame_height is None:
+            frame_height = self._image_height
+        if frame_width < 1 or frame_height < 1 \
+                or frame_width > self._image_width \
+                or frame_height > self._image_height:
+            raise ValueError((
+                f"Can't split image of size \"{self._image_width}x"
+                f"{self._image_height}\" into frames of size "
+                f"\"{frame_width}x{frame_height}\""))
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self._per_row = self._image_width // frame_width
+        whole = self._per_row * (self._image_height // frame_height)
+        if count is not None and count > whole:
+            raise ValueError((
+                f"Can't take \"{count}\" frames from image with "
+                f"\"{whole}\" whole frames"))
+        self._count = whole if count is None else count
+        self.width = width
+        self.height = height
+        self.method = method
+        self.canvas_class = canvas_class
+        self.charset = charset
+        self._canvases = {}  # frame index: canvas
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        """Return a frame's canvas.
+
+        Parameters
+        ----------
+        index : int
+            The frame's index; negative indexes count from the last frame
+
+        Returns
+        -------
+        canvas : Canvas
+            The frame, an instance of canvas_class; shared, so do not change
+            it
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Sprite sheet frame \"{index}\" out of range")
+        canvas = self._canvases.get(index)
+        if canvas is None:
+            canvas = self._canvases[index] = self._frame_canvas(index)
+        return canvas
+
+    def _frame_canvas(self, index):
+        """Internal method to crop and scale a frame and create its canvas.
+        """
+        left = index % self._per_row * self.frame_width * 3
+        top = index // self._per_row * self.frame_height
+        image_row_size = self._image_width * 3
+        pixels = b''.join([
+            self._pixels[y * image_row_size + left:
+                         y * image_row_size + left + self.frame_width * 3]
+            for y in range(top, top + self.frame_height)])
+        width, height, pixels = scale_image(
+            self.frame_width, self.frame_height, pixels, self.width,
+            self.height, self.method)
+        return self.canvas_class._from_pixels(
+            width, height, pixels, self.charset)
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Module defining StreamCanvas class, used by Conveyor.add_stream_row to
+scroll content of any length, e.g. lines read from a log file or feed.
+
+Examples
+--------
+>>> from matrix_display.stream_canvas import StreamCanvas
+>>> def words():
+...     yield 'Hi'
+...     yield ('!', (255, 0, 0))
+...
+>>> canvas = StreamCanvas(words())
+>>> canvas.to_str(0, 9)
+'[█ █   █  ]\\n[█ █ █ █  ]\\n[███   █  ]\\n[█ █ █    ]\\n[█ █ █ █  ]'
+>>> canvas.exhausted, canvas.width()
+(True, 7)
+>>>
+"""
+from matrix_display.canvas import Canvas
+from matrix_display.packed_canvas import PackedCanvas
+import matrix_display.compiled_font as compiled_font
+
+
+class StreamCanvas:
+    """A read-only canvas of unbounded width, drawn from an iterable of
+    content a little at a time as its columns are viewed.
+
+    Columns are kept in a ring buffer as wide as the widest viewport taken;
+    columns to the left of the latest viewport are discarded, so memory use
+    does not depend on the length of the content. Viewports must therefore
+    move from left to right. Text is drawn chunk_size characters at a time,
+    so long strings are not drawn all at once either.
+    """
+    def __init__(self, items, lpad_count=0, row_count=None, charset=None,
+                 chunk_size=32):
+        """Initialise the canvas; nothing is drawn until a viewport is taken.
+
+        Parameters
+        ----------
+        items : iterable
+            Content to draw, in order; each item may be a str, a (str,
+            (int, int, int)) tuple of text and colour, a Canvas or a list of
+            these. Items are spaced as by Canvas.append_text and
+            Canvas.append_canvas
+        lpad_count : int
+            Optional number of blank columns before the content
+        row_count : int
+            Optional number of rows; defaults to the charset height
+        charset : dict
+            Optional dictionary of character shapes used to draw text;
+            defaults to the compiled font_5 font
+        chunk_size : int
+            Optional maximum number of characters drawn at a time
+        """
+        self.charset = (compiled_font.load_font_5() if charset is None
+                        else charset)
+        self._row_count = (compiled_font.charset_height(self.charset)
+                           if row_count is None else row_count)
+        self.chunk_size = chunk_size
+        self._pieces = self._split(items)
+        self._capacity = 0  # number of columns the ring buffer holds
+        self._pixels = bytearray()  # ring buffer; see _write
+        self._end = 0  # canvas column after the last column in the buffer
+        self._gap = lpad_count  # blank columns to write before the chunk
+        self._chunk = None  # PackedCanvas of drawn columns not yet written
+        self._chunk_ptr = 0  # next column of _chunk to write
+        self._started = False  # True once content has been drawn
+        self._content_width = None  # set once the items are exhausted
+
+    @property
+    def exhausted(self):
+        """True once all content has been drawn into the ring buffer."""
+        return self._content_width is not None
+
+    def height(self):
+        """Return the pixel height of the canvas.
+
+        Returns
+        -------
+        height : int
+        """
+        return self._row_count
+
+    def width(self):
+        """Return the number of columns drawn so far; once the content is
+        exhausted, its total width including left padding.
+
+        Returns
+        -------
+        width : int
+        """
+        return self._end if self._content_width is None \
+            else self._content_width
+
+    def nbytes(self):
+        """Return the number of bytes used by the ring buffer and the drawn
+        piece not yet written to it; see Canvas.nbytes.
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return len(self._pixels) + (
+            0 if self._chunk is None else self._chunk.nbytes())
+
+    def viewport(self, x, width, y=0, height=None):
+        """Return views of a rectangular window onto the canvas as packed RGB
+        bytes, drawing content up to the window's right edge first; see
+        Canvas.viewport. Columns past the end of the content are black.
+
+        The views are only valid until the next call; columns left of x are
+        discarded, so later windows must not start left of x.
+
+        Parameters
+        ----------
+        x : int
+            The first canvas column of the window
+        width : int
+            The number of columns in the window
+        y : int
+            Optional first canvas row of the window; defaults to 0
+        height : int
+            Optional number of rows in the window; defaults to all rows from
+            y to the bottom of the canvas
+
+        Returns
+        -------
+        rows : list of memoryview
+            3 * width bytes of packed (r, g, b) values for each window row
+        """
+        height = self._row_count - y if height is None else height
+        if width > self._capacity:
+            self._grow(width)
+        if x < max(self._end, x + width) - self._capacity:
+            raise ValueError((
+                f"Can't view column \"{x}\"; columns left of "
+                f"\"{self._end - self._capacity}\" have been discarded"))
+
+        self._fill(x + width)
+        ring_size = self._capacity * 3
+        start = (x % self._capacity) * 3 if self._capacity > 0 else 0
+        pixels = memoryview(self._pixels)
+        return [
+            pixels[row_ctr * 2 * ring_size + start:
+                   row_ctr * 2 * ring_size + start + width * 3]
+            for row_ctr in range(y, y + height)
+        ]
+
+    def to_str(self, x, width, pixel_on='█', pixel_off=' '):
+        """Return a string representation of a window onto the canvas; see
+        Canvas.to_str.
+
+        Parameters
+        ----------
+        x : int
+            The first canvas column of the window
+        width : int
+            The number of columns in the window
+        pixel_on : str
+            Optional character to represent a non-black pixel
+        pixel_off : str
+            Optional character to represent a black pixel
+
+        Returns
+        -------
+        text : str
+        """
+        return '\n'.join(
+            '[' + ''.join([
+                pixel_on if any(row[i:i + 3]) else pixel_off
+                for i in range(0, width * 3, 3)
+            ]) + ']'
+            for row in self.viewport(x, width)
+        )
+
+    def _split(self, items):
+        """Internal generator of the content as (text, rgb) chunks of at
+        most chunk_size characters, and canvases."""
+        for item in items:
+            if type(item) is list:
+                yield from self._split(item)
+                continue
+            elif type(item) is str:
+                text, rgb = item, (255, 255, 255)
+            elif type(item) is tuple:
+                text, rgb = item
+            elif isinstance(item, Canvas):
+                yield item
+                continue
+            else:
+                raise ValueError((
+                    f"Can't append content type \"{type(item)}\" (with "
+                    f"value \"{item}\"); require str, tuple, list or Canvas"))
+
+            for start in range(0, len(text), self.chunk_size):
+                yield text[start:start + self.chunk_size], rgb
+
+    def _next_chunk(self):
+        """Internal method to draw the next piece of content.
+
+        Returns
+        -------
+        drawn : bool
+            False if the content is exhausted
+        """
+        piece = next(self._pieces, None)
+        if piece is None:
+            self._content_width = self._end + self._gap
+            return False
+
+        chunk = PackedCanvas(row_count=self._row_count, charset=self.charset)
+        if isinstance(piece, Canvas):
+            chunk.append_canvas(piece)
+        else:
+            chunk.append_text(*piece)
+        if self._started:
+            self._gap += 1  # blank column between pieces, as Canvas appends
+        self._started = True
+        self._chunk = chunk
+        self._chunk_ptr = 0
+        return True
+
+    def _fill(self, target):
+        """Internal method to write columns until the buffer reaches canvas
+        column target; columns that would be overwritten before target is
+        reached are skipped rather than written."""
+        keep_from = target - self._capacity
+        while self._end < target:
+            count = target - self._end
+            if self._gap > 0:
+                count = min(count, self._gap)
+                self._write(None, 0, count, keep_from)
+                self._gap -= count
+            elif self._chunk is not None:
+                count = min(count, self._chunk.width() - self._chunk_ptr)
+                self._write(self._chunk, self._chunk_ptr, count, keep_from)
+                self._chunk_ptr += count
+                if self._chunk_ptr >= self._chunk.width():
+                    self._chunk = None
+            elif self._content_width is not None or not self._next_chunk():
+                self._write(None, 0, count, keep_from)  # past the content
+
+    def _write(self, source, offset, count, keep_from):
+        """Internal method to write columns to the ring buffer.
+
+        Each row of the buffer holds 2 copies of the ring, so any window of
+        up to capacity columns is contiguous in memory; canvas column c is
+        stored at ring position c % capacity of both copies.
+
+        Parameters
+        ----------
+        source : PackedCanvas
+            Canvas to copy columns from; None to write black columns
+        offset : int
+            The first source column to copy
+        count : int
+            The number of columns to write
+        keep_from : int
+            Canvas columns before keep_from are skipped rather than written
+        """
+        skip = min(max(keep_from - self._end, 0), count)
+        self._end += skip
+        offset += skip
+        count -= skip
+        ring_size = self._capacity * 3
+        while count > 0:
+            position = self._end % self._capacity
+            run = min(count, self._capacity - position)
+            for row_ctr in range(self._row_count):
+                if source is None:
+                    data = bytes(run * 3)
+                else:
+                    data = source.row_bytes(row_ctr)[
+                        offset * 3:(offset + run) * 3]
+                start = row_ctr * 2 * ring_size + position * 3
+                self._pixels[start:start + run * 3] = data
+                start += ring_size  # second copy of the ring
+                self._pixels[start:start + run * 3] = data
+            self._end += run
+            offset += run
+            count -= run
+
+    def _grow(self, capacity):
+        """Internal method to enlarge the ring buffer, keeping its columns."""
+        kept = min(self._capacity, self._end)
+        old = PackedCanvas(lpad_count=kept, row_count=self._row_count)
+        if kept > 0:
+            for row_ctr, row in enumerate(
+                    self.viewport(self._end - kept, kept)):
+                old.row_bytes(row_ctr)[:] = row
+
+        self._capacity = capacity
+        self._pixels = bytearray(self._row_count * 2 * capacity * 3)
+        self._end -= kept
+        self._write(old, 0, kept, self._end)